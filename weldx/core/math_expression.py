@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Union
+import warnings
+from copy import deepcopy
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Callable, Union
 
+import numpy as np
 import pint
 import sympy
 import xarray as xr
@@ -16,6 +21,107 @@ ExpressionParameterTypes = Union[
 
 __all__ = ["MathematicalExpression", "ExpressionParameterTypes"]
 
+_BACKENDS = ("auto", "numpy", "numexpr", "numba")
+_AUTO_BACKEND_MIN_SIZE = 100_000
+
+
+@lru_cache(maxsize=1024)
+def _sympify(expression: str) -> sympy.Expr:
+    """Convert an expression string into a (cached) sympy expression."""
+    return sympy.sympify(expression)
+
+
+def _get_symbol_names(expression: sympy.Expr) -> tuple[str, ...]:
+    """Get the sorted names of all free symbols of an expression."""
+    return tuple(sorted(str(s) for s in expression.free_symbols))
+
+
+def _get_unit(value: pint.Quantity | xr.DataArray) -> pint.Unit:
+    """Get the unit of a value, which is dimensionless if it has no unit."""
+    if isinstance(value, xr.DataArray):
+        value = value.data
+    if isinstance(value, pint.Quantity):
+        return value.u
+    return Q_("").u
+
+
+def _to_magnitude(
+    value: pint.Quantity | xr.DataArray, factor: float = 1
+) -> xr.DataArray | xr.Variable:
+    """Strip the unit of a value and scale its magnitude by a factor.
+
+    Values without coordinates are returned as `xarray.Variable`, so that they are
+    broadcast by their dimension names without the overhead of an alignment.
+
+    """
+    data = value.data if isinstance(value, xr.DataArray) else value
+    magnitude = data.m if isinstance(data, pint.Quantity) else data
+    if factor != 1:
+        magnitude = magnitude * factor
+    if not isinstance(value, xr.DataArray):
+        return xr.Variable([f"dim_{i}" for i in range(np.ndim(magnitude))], magnitude)
+    if not value.coords:
+        value = value.variable
+    return value.copy(deep=False, data=magnitude)
+
+
+def _backend_available(backend: str) -> bool:
+    """Return `True` if the packages required by an evaluation backend are present."""
+    if backend in ("auto", "numpy"):
+        return True
+    return find_spec(backend) is not None
+
+
+@lru_cache(maxsize=1024)
+def _lambdify(expression: sympy.Expr, backend: str = "numpy") -> Callable | None:
+    """Compile a sympy expression into a callable for the selected backend.
+
+    The compiled functions are cached process wide, so that identical expressions
+    are only compiled once. All functions take the free symbols of the expression
+    as positional arguments sorted by their names. Keyword arguments are supported
+    by all backends except ``numba``, which compiles a float64 loop eagerly.
+
+    Parameters
+    ----------
+    expression
+        The sympy expression.
+    backend
+        The evaluation backend. ``numpy`` uses numpy and scipy functions,
+        ``numexpr`` compiles the expression into a single `numexpr.evaluate` call and
+        ``numba`` creates a fused loop over all elements using `numba.vectorize`.
+
+    Returns
+    -------
+    Callable
+        The compiled function or `None` if the backend is not available or does not
+        support the expression.
+
+    """
+    symbols = sorted(expression.free_symbols, key=str)
+    if backend == "numpy":
+        return sympy.lambdify(symbols, expression, ("numpy", "scipy"))
+    if not _backend_available(backend):
+        return None
+    if backend == "numexpr":
+        try:
+            return sympy.lambdify(symbols, expression, "numexpr")
+        except TypeError:  # the expression contains unsupported functions
+            return None
+    if backend == "numba":
+        import numba
+        from numba.core.errors import NumbaError
+
+        if not symbols:
+            return None
+        signature = f"float64({', '.join(['float64'] * len(symbols))})"
+        try:
+            return numba.vectorize([signature])(
+                sympy.lambdify(symbols, expression, "math")
+            )
+        except NumbaError:  # the expression contains unsupported functions
+            return None
+    raise ValueError(f"Unknown evaluation backend '{backend}'.")
+
 
 class MathematicalExpression:
     """Mathematical expression using sympy syntax."""
@@ -24,6 +130,7 @@ class MathematicalExpression:
         self,
         expression: sympy.Expr | str,
         parameters: ExpressionParameterTypes = None,
+        backend: str = "auto",
     ):
         """Construct a MathematicalExpression.
 
@@ -34,19 +141,36 @@ class MathematicalExpression:
         parameters :
             A dictionary containing constant values for variables of the
             expression.
+        backend :
+            The backend used to evaluate the expression on unit-free arrays. Besides
+            ``numpy``, ``numexpr`` and ``numba`` can be selected if they are
+            installed. With the default ``auto``, inputs with at least 100000
+            elements are evaluated with ``numexpr`` or ``numba`` if one of them is
+            installed and supports the expression and all other inputs with
+            ``numpy``. Expressions that the selected backend can't compile are
+            evaluated with ``numpy``. Errors during the evaluation are not caught.
 
         """
-        if not isinstance(expression, sympy.Expr):
+        if isinstance(expression, str):
+            expression = _sympify(expression)
+        elif not isinstance(expression, sympy.Expr):
             expression = sympy.sympify(expression)
         if not isinstance(expression, sympy.Expr):
             raise TypeError("'expression' can't be converted to a sympy expression")
         self._expression: sympy.Expr = expression
 
-        self.function = sympy.lambdify(
-            tuple(self._expression.free_symbols), self._expression, ("numpy", "scipy")
-        )
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}'. Valid options are {_BACKENDS}."
+            )
+        if not _backend_available(backend):
+            raise ImportError(f"The '{backend}' backend requires '{backend}'.")
+        self.backend = backend
+
+        self.function = _lambdify(self._expression)
 
         self._parameters: dict[str, pint.Quantity | xr.DataArray] = {}
+        self._evaluation_plans: dict[tuple, tuple | None] = {}
         if parameters is not None:
             self.set_parameters(parameters)
 
@@ -89,6 +213,18 @@ class MathematicalExpression:
 
     __hash__ = None
 
+    def __deepcopy__(self, memo):
+        """Create a deep copy that shares the immutable expression and function."""
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            if k == "_evaluation_plans":
+                v = {}
+            elif k not in ("_expression", "function"):
+                v = deepcopy(v, memo)
+            setattr(result, k, v)
+        return result
+
     def equals(
         self,
         other: Any,
@@ -165,6 +301,7 @@ class MathematicalExpression:
 
         variable_names = [str(v) for v in self._expression.free_symbols]
 
+        parameters = {}
         for k, v in params.items():
             if k not in variable_names:
                 raise ValueError(f'The expression does not have a parameter "{k}"')
@@ -176,7 +313,10 @@ class MathematicalExpression:
                 if v.weldx.units is None:
                     v = v.pint.quantify("")
                 v = v.pint.quantify()
-            self._parameters[k] = v
+            parameters[k] = v
+
+        self._parameters.update(parameters)
+        self._evaluation_plans = {}
 
     @property
     def num_parameters(self):
@@ -216,15 +356,17 @@ class MathematicalExpression:
 
     @property
     def parameters(self) -> dict[str, pint.Quantity | xr.DataArray]:
-        """Return the internal parameters dictionary.
+        """Return a copy of the internal parameters dictionary.
+
+        Use `set_parameter` or `set_parameters` to modify the parameters.
 
         Returns
         -------
         Dict
-            Internal parameters dictionary
+            Copy of the internal parameters dictionary
 
         """
-        return self._parameters
+        return dict(self._parameters)
 
     def get_variable_names(self) -> list[str]:
         """Get a list of all expression variables.
@@ -262,12 +404,138 @@ class MathematicalExpression:
             )
 
         variables = {
-            k: v if isinstance(v, xr.DataArray) else xr.DataArray(Q_(v))
-            for k, v in kwargs.items()
+            k: v if isinstance(v, xr.DataArray) else Q_(v) for k, v in kwargs.items()
         }
 
+        result = self._evaluate_magnitudes(variables)
+        if result is not None:
+            return result
+
+        variables = {
+            k: v if isinstance(v, xr.DataArray) else xr.DataArray(v)
+            for k, v in variables.items()
+        }
         parameters = {
             k: v if isinstance(v, xr.DataArray) else xr.DataArray(v)
             for k, v in self._parameters.items()
         }
         return self.function(**variables, **parameters)
+
+    def _select_backend(self, inputs: list[xr.DataArray | xr.Variable]) -> str:
+        """Get the backend that is used to evaluate the expression."""
+        if self.backend != "auto":
+            return self.backend
+
+        sizes = {}
+        for v in inputs:
+            sizes.update(v.sizes)
+        if np.prod(list(sizes.values()), dtype=float) >= _AUTO_BACKEND_MIN_SIZE:
+            for backend in ("numexpr", "numba"):
+                if _lambdify(self._expression, backend) is not None:
+                    return backend
+        return "numpy"
+
+    def _get_evaluation_plan(self, units: dict[str, pint.Unit]) -> tuple | None:
+        """Get the unit handling for an evaluation with variables of the given units.
+
+        The plan consists of the result unit, the factor that converts the result
+        from base units into this unit, the factors that convert the variables into
+        base units and the parameter magnitudes in base units. It is created once
+        for each combination of variable units and reused until the parameters
+        change.
+
+        Parameters
+        ----------
+        units
+            The units of the variables.
+
+        Returns
+        -------
+        tuple
+            The evaluation plan or `None` if the expression can't be evaluated
+            without units.
+
+        """
+        key = tuple(sorted(units.items()))
+        if key not in self._evaluation_plans:
+            self._evaluation_plans[key] = self._create_evaluation_plan(units)
+        return self._evaluation_plans[key]
+
+    def _create_evaluation_plan(self, units: dict[str, pint.Unit]) -> tuple | None:
+        """Create the unit handling for an evaluation, see `_get_evaluation_plan`."""
+        parameters = {
+            k: v if isinstance(v, xr.DataArray) else xr.DataArray(v)
+            for k, v in self._parameters.items()
+        }
+        units = {**units, **{k: _get_unit(v) for k, v in parameters.items()}}
+        if set(units) != set(_get_symbol_names(self._expression)):
+            return None
+
+        base = {k: Q_(1.0, u).to_base_units() for k, u in units.items()}
+        if any(Q_(0.0, u).to_base_units().m != 0 for u in units.values()):
+            return None  # offset units
+
+        try:
+            unit = self._get_result_unit(units)
+            if self._get_result_unit(units, magnitude=2.0) != unit:
+                return None  # the result unit depends on the values
+            base_unit = self._get_result_unit({k: b.u for k, b in base.items()})
+        except (pint.errors.PintError, pint.UnitStrippedWarning):
+            return None  # let the evaluation with units report the problem
+        scale = Q_(1.0, base_unit).to(unit).m
+
+        factors = {k: base[k].m for k in units}
+        magnitudes = {k: _to_magnitude(v, factors[k]) for k, v in parameters.items()}
+        return unit, scale, factors, magnitudes
+
+    def _get_result_unit(
+        self, units: dict[str, pint.Unit], magnitude: float = 1.0
+    ) -> pint.Unit:
+        """Get the result unit by evaluating the expression with scalar quantities.
+
+        Invalid values, like divisions by zero, are accepted since only the unit is of
+        interest. Stripped units raise a `pint.UnitStrippedWarning` as error.
+
+        """
+        values = {k: Q_(np.float64(magnitude), u) for k, u in units.items()}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            warnings.simplefilter("error", pint.UnitStrippedWarning)
+            return Q_(self.function(**values)).u
+
+    def _evaluate_magnitudes(
+        self, variables: dict[str, pint.Quantity | xr.DataArray]
+    ) -> xr.DataArray | None:
+        """Evaluate the expression on unit-free arrays.
+
+        The variables are converted to base units and the expression is evaluated on
+        their magnitudes using the evaluation plan of their units. The result unit is
+        attached to the returned array afterwards.
+
+        Returns
+        -------
+        xarray.DataArray
+            The result or `None` if the expression can't be evaluated without units.
+
+        """
+        plan = self._get_evaluation_plan(
+            {k: _get_unit(v) for k, v in variables.items()}
+        )
+        if plan is None:
+            return None
+        unit, scale, factors, magnitudes = plan
+
+        magnitudes = magnitudes | {
+            k: _to_magnitude(v, factors[k]) for k, v in variables.items()
+        }
+        inputs = [magnitudes[k] for k in _get_symbol_names(self._expression)]
+
+        function = _lambdify(self._expression, self._select_backend(inputs))
+        if function is None:  # the backend can't compile the expression
+            function = self.function
+        result = xr.apply_ufunc(function, *inputs, join="inner")
+
+        data = result.data if scale == 1 else result.data * scale
+        if isinstance(result, xr.Variable):
+            return xr.DataArray(Q_(data, unit), dims=result.dims)
+        return result.copy(deep=False, data=Q_(data, unit))
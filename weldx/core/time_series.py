@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from _warnings import warn
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -26,6 +27,62 @@ __all__ = [
     "TimeSeries",
 ]
 
+_INTERP_BLOCK_SIZE = 2**16
+
+
+def _interp_sorted(
+    time: np.ndarray,
+    values: np.ndarray,
+    time_interp: np.ndarray,
+    method: str,
+    block_size: int = _INTERP_BLOCK_SIZE,
+) -> np.ndarray:
+    """Interpolate values along a sorted time axis in blocks of query times.
+
+    Query times outside the time axis get the value of the closest edge. The
+    positions of the query times are determined with `numpy.searchsorted` and the
+    results are written into a preallocated output array block by block, so that the
+    size of all temporary arrays is limited by ``block_size``.
+
+    Parameters
+    ----------
+    time :
+        The sorted int64 time axis of the values.
+    values :
+        The values. The first dimension must match the time axis.
+    time_interp :
+        The int64 query times in the same unit and relative to the same reference as
+        ``time``.
+    method :
+        The interpolation method. Either ``step`` or ``linear``.
+    block_size :
+        The number of query times that are processed at once.
+
+    Returns
+    -------
+    numpy.ndarray
+        The interpolated values.
+
+    """
+    num_samples = len(time)
+    dtype = values.dtype if method == "step" else np.result_type(values, float)
+    out = np.empty((len(time_interp), *values.shape[1:]), dtype=dtype)
+
+    for start in range(0, len(time_interp), block_size):
+        t = time_interp[start : start + block_size]
+        idx = np.searchsorted(time, t, side="right") - 1
+        if method == "step" or num_samples == 1:
+            out[start : start + len(t)] = values[np.clip(idx, 0, num_samples - 1)]
+            continue
+
+        idx = np.clip(idx, 0, num_samples - 2)
+        t_0 = time[idx]
+        weight = np.clip((t - t_0) / (time[idx + 1] - t_0), 0, 1)
+        weight = weight.reshape(-1, *[1] * (values.ndim - 1))
+        v_0 = values[idx]
+        out[start : start + len(t)] = v_0 + weight * (values[idx + 1] - v_0)
+    return out
+
 
 class TimeSeries(TimeDependent):
     """Describes the behaviour of a quantity in time."""
@@ -70,6 +127,7 @@ class TimeSeries(TimeDependent):
         self._units = None
         self._interp_counter = 0
         self._reference_time = None
+        self._time_index: tuple[np.ndarray, np.ndarray] | None = None
 
         if isinstance(data, (pint.Quantity, xr.DataArray)):
             self._initialize_discrete(data, time, interpolation, reference_time)
@@ -223,9 +281,33 @@ class TimeSeries(TimeDependent):
                 f' "{str(e)}"'
             ) from e
 
+    def _get_time_index(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the sorted int64 nanosecond time axis and the matching magnitudes."""
+        if self._time_index is None:
+            time = self._data.time.data.astype("timedelta64[ns]").view(np.int64)
+            values = self._data.data.m
+            if np.any(time[1:] < time[:-1]):
+                order = np.argsort(time, kind="stable")
+                time, values = time[order], values[order]
+            self._time_index = (time, values)
+        return self._time_index
+
     def _interp_time_discrete(self, time: Time) -> xr.DataArray:
         """Interpolate the time series if its data is composed of discrete values."""
         data = self._data
+        num_samples = len(data.time)
+        if self.interpolation in ("step", "linear") and (
+            num_samples == 1 or time.is_absolute == (self.reference_time is not None)
+        ):
+            time_ns, values = self._get_time_index()
+            time_interp = time._as_timedelta_int64()
+            values = _interp_sorted(time_ns, values, time_interp, self.interpolation)
+            return xr.DataArray(
+                Q_(values, data.data.u),
+                dims=data.dims,
+                coords={"time": time_interp.view("timedelta64[ns]")},
+            )
+
         if self.time is None and time.is_absolute:
             data = data.weldx.reset_reference_time(time.reference_time)  # type: ignore
 
@@ -388,6 +470,31 @@ class TimeSeries(TimeDependent):
         ts._interp_counter = self._interp_counter + 1
         return ts
 
+    def interp_time_blocks(
+        self, time_blocks: Iterable[types_time_like], time_unit: str = "s"
+    ) -> Iterator[TimeSeries]:
+        """Interpolate the TimeSeries for a sequence of time blocks.
+
+        The blocks are consumed one by one, so that long signals can be processed
+        with a generator without creating all query times at once. Each block is
+        processed like a call to `TimeSeries.interp_time`.
+
+        Parameters
+        ----------
+        time_blocks:
+            An iterable that yields the time values of each block.
+        time_unit:
+            See `TimeSeries.interp_time`.
+
+        Yields
+        ------
+        TimeSeries :
+            A new `TimeSeries` object containing the interpolated data of each block.
+
+        """
+        for time in time_blocks:
+            yield self.interp_time(time, time_unit)
+
     @check_matplotlib_available
     def plot(
         self,
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import copy
-import warnings
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import InitVar, dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
 
@@ -12,6 +15,8 @@ import meshio
 import numpy as np
 import pint
 import sympy
+from scipy.integrate import quad
+from scipy.spatial import cKDTree
 from xarray import DataArray
 
 # note: this is used to resolve visualization.types
@@ -27,6 +32,8 @@ from weldx.util import check_matplotlib_available
 
 # only import heavy-weight packages on type checking
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable, Iterator
+
     import matplotlib.axes
     import numpy.typing as npt
 
@@ -44,8 +51,8 @@ def has_cw_ordering(points: np.ndarray):
         https://stackoverflow.com/a/1165943/6700329
 
     """
-    return (
-        not sum((points[1:, 1] - points[:-1, 1]) * (points[1:, 2] + points[:-1, 2])) < 0
+    return not (
+        np.sum((points[1:, 1] - points[:-1, 1]) * (points[1:, 2] + points[:-1, 2])) < 0
     )
 
 
@@ -102,6 +109,284 @@ def _to_list(var) -> list:
     return [var]
 
 
+def _line_raster_points(
+    point_start: np.ndarray, point_end: np.ndarray, num_pts: int
+) -> np.ndarray:
+    """Get equally distributed points on a straight line.
+
+    Parameters
+    ----------
+    point_start :
+        Start point of the line
+    point_end :
+        End point of the line
+    num_pts :
+        Number of points including start and end point
+
+    Returns
+    -------
+    numpy.ndarray
+        2xN array of points
+
+    """
+    weights = np.linspace(0.0, 1.0, num=num_pts, endpoint=True)
+    return point_start[:, np.newaxis] + np.outer(point_end - point_start, weights)
+
+
+def _arc_raster_points(
+    point_center: np.ndarray,
+    radius: float,
+    angle_start: float,
+    arc_angle: float,
+    sign_winding: int,
+    num_pts: int,
+) -> np.ndarray:
+    """Get equally distributed points on a circular arc.
+
+    Parameters
+    ----------
+    point_center :
+        Center point of the arc
+    radius :
+        Radius of the arc
+    angle_start :
+        Angle between the x-axis and the vector from the center to the start point
+    arc_angle :
+        The (positive) angle that is covered by the arc
+    sign_winding :
+        ``1`` for a counter-clockwise and ``-1`` for a clockwise winding order
+    num_pts :
+        Number of points including start and end point
+
+    Returns
+    -------
+    numpy.ndarray
+        2xN array of points
+
+    """
+    angles = angle_start + sign_winding * np.linspace(
+        0.0, arc_angle, num=num_pts, endpoint=True
+    )
+    return point_center[:, np.newaxis] + radius * np.vstack(
+        [np.cos(angles), np.sin(angles)]
+    )
+
+
+def _arc_num_adaptive_raster_points(
+    radius: float, arc_angle: float, tolerance: float
+) -> int:
+    """Get the number of arc raster points that satisfy a chordal deviation tolerance.
+
+    Parameters
+    ----------
+    radius :
+        Radius of the arc
+    arc_angle :
+        The (positive) angle that is covered by the arc
+    tolerance :
+        The maximal distance between the arc and the chords between two raster points
+
+    Returns
+    -------
+    int
+        Number of raster points including start and end point
+
+    """
+    if tolerance >= radius:
+        return 2
+    max_angle_step = 2 * np.arccos(1 - tolerance / radius)
+    return int(np.ceil(arc_angle / max_angle_step)) + 1
+
+
+_MAX_ADAPTIVE_REFINEMENTS = 12
+
+
+# segment length --------------------------------------------------------------
+
+_LENGTH_INTEGRATION_METHODS = ("auto", "symbolic", "numeric")
+_LENGTH_MEMO_SIZE = 1024
+_MAX_COORD = sympy.Symbol("max_coord")
+
+
+@lru_cache(maxsize=256)
+def _symbolic_length_primitive(
+    integrand: sympy.Expr, coordinate: sympy.Symbol
+) -> sympy.Expr | None:
+    """Get the integral of a segment length integrand as function of its upper bound.
+
+    The results are cached by the structure of the integrand. Since the parameters of a
+    segment are substituted before, this also covers the parameter values.
+
+    Parameters
+    ----------
+    integrand :
+        The expression that is integrated
+    coordinate :
+        The symbol of the integration variable
+
+    Returns
+    -------
+    sympy.Expr
+        The integral with the upper bound ``max_coord`` or `None` if ``sympy`` can't
+        solve it
+
+    """
+    try:
+        primitive = sympy.integrate(integrand, (coordinate, 0, _MAX_COORD))
+    except (NotImplementedError, ValueError):
+        return None
+    if primitive.has(sympy.Integral):
+        return None
+    return primitive
+
+
+@lru_cache(maxsize=512)
+def _lambdify(expr: sympy.Expr, symbol: sympy.Symbol, module: str = "math") -> Callable:
+    """Get a cached numerical function of a single variable expression.
+
+    The default ``math`` module is the fastest choice for scalars. Use ``numpy`` to
+    get a function that accepts arrays.
+
+    """
+    return sympy.lambdify(symbol, expr, module)
+
+
+class _SegmentLength:
+    """Evaluates the length of an expression based segment up to a coordinate value.
+
+    The integral is solved symbolically if possible. Otherwise, or if requested, it is
+    computed with adaptive numerical quadrature. The most recently evaluated lengths
+    are memoized per instance and instances are shared between segments with
+    identical integrands.
+    """
+
+    def __init__(
+        self,
+        integrand: sympy.Expr,
+        coordinate: sympy.Symbol,
+        method: str = "auto",
+        tolerance: float = 1e-9,
+    ):
+        """Construct a `_SegmentLength`.
+
+        Parameters
+        ----------
+        integrand :
+            The absolute value of the derivative of the segment expression
+        coordinate :
+            The symbol of the position coordinate
+        method :
+            One of ``"auto"``, ``"symbolic"`` and ``"numeric"``. ``"auto"`` tries the
+            symbolic integration first and falls back to numerical quadrature if it
+            fails or if the primitive can't be evaluated numerically.
+        tolerance :
+            The absolute and relative tolerance of the numerical quadrature
+
+        """
+        if method not in _LENGTH_INTEGRATION_METHODS:
+            raise ValueError(
+                f"Unknown length integration method '{method}'. Valid values are "
+                f"{_LENGTH_INTEGRATION_METHODS}."
+            )
+
+        self._integrand = integrand
+        self._coordinate = coordinate
+        self._method = method
+        self._tolerance = tolerance
+        self._primitive = None
+        if method != "numeric":
+            self._primitive = _symbolic_length_primitive(integrand, coordinate)
+            if self._primitive is None and method == "symbolic":
+                raise ValueError(f"Can't integrate '{integrand}' symbolically.")
+        self._values = {}
+
+    def __deepcopy__(self, memo) -> _SegmentLength:
+        """Return the instance itself, since instances are shared between segments."""
+        return self
+
+    @property
+    def is_symbolic(self) -> bool:
+        """Return `True` if the length is computed from a symbolic primitive."""
+        return self._primitive is not None
+
+    def _evaluate_primitive(self, position: float | np.ndarray):
+        """Evaluate the symbolic primitive or get `None` if that isn't possible."""
+        module = "math" if np.ndim(position) == 0 else "numpy"
+        try:
+            return _lambdify(self._primitive, _MAX_COORD, module)(position)
+        except (NameError, TypeError) as e:
+            # the primitive contains functions without numerical implementation
+            if self._method == "symbolic":
+                raise ValueError(
+                    f"Can't evaluate the symbolic length integral of "
+                    f"'{self._integrand}' numerically."
+                ) from e
+            self._primitive = None
+        return None
+
+    def _integrate(self, lower: float, upper: float) -> float:
+        """Integrate the integrand numerically between two positions."""
+        value, _ = quad(
+            _lambdify(self._integrand, self._coordinate),
+            lower,
+            upper,
+            epsabs=self._tolerance,
+            epsrel=self._tolerance,
+        )
+        return value
+
+    def _evaluate(self, position: float) -> float:
+        """Get the length from 0 to the passed position without memoization."""
+        if self._primitive is not None:
+            value = self._evaluate_primitive(position)
+            if value is not None:
+                return float(value)
+        return self._integrate(0, position)
+
+    def _evaluate_many(self, positions: np.ndarray) -> np.ndarray:
+        """Get the lengths from 0 to multiple positions without memoization.
+
+        The primitive is evaluated on the whole array. Otherwise, the integrand is
+        integrated once between each pair of consecutive sorted positions and the
+        lengths are obtained as cumulative sum of these sections.
+
+        """
+        if self._primitive is not None:
+            values = self._evaluate_primitive(positions)
+            if values is not None:
+                return np.array(np.broadcast_to(values, positions.shape), dtype=float)
+
+        unique, inverse = np.unique(positions, return_inverse=True)
+        bounds = np.insert(unique, 0, 0.0)
+        sections = [
+            self._integrate(lower, upper)
+            for lower, upper in zip(bounds[:-1], bounds[1:])
+        ]
+        return np.cumsum(sections)[inverse.reshape(positions.shape)]
+
+    def _get_value(self, position: float) -> float:
+        """Get the memoized length from 0 to the passed position."""
+        if position not in self._values:
+            if len(self._values) >= _LENGTH_MEMO_SIZE:
+                del self._values[next(iter(self._values))]
+            self._values[position] = self._evaluate(position)
+        return self._values[position]
+
+    def __call__(self, position: float | np.ndarray) -> float | np.ndarray:
+        """Get the length from 0 to the passed positions in base units."""
+        if np.ndim(position) == 0:
+            return self._get_value(float(position))
+        return self._evaluate_many(np.asarray(position, dtype=float))
+
+
+@lru_cache(maxsize=256)
+def _get_segment_length(
+    integrand: sympy.Expr, coordinate: sympy.Symbol, method: str, tolerance: float
+) -> _SegmentLength:
+    """Get a shared `_SegmentLength` instance for the passed integrand and settings."""
+    return _SegmentLength(integrand, coordinate, method, tolerance)
+
+
 # DynamicBaseSegment ----------------------------------------------------------
 
 
@@ -114,6 +399,8 @@ class DynamicBaseSegment:
             SpatialSeries | pint.Quantity | DataArray | str | MathematicalExpression
         ),
         max_coord: float = 1,
+        length_integration: str = "auto",
+        length_tolerance: float = 1e-9,
         **kwargs,
     ):
         """Initialize a `DynamicBaseSegment`.
@@ -130,6 +417,15 @@ class DynamicBaseSegment:
             value of the passed series dimension that specifies the position on the 2d
             line. The value defines the segments length by evaluating the expression on
             the interval [0, ``max_coord``]
+        length_integration:
+            [only expression based `~weldx.SpatialSeries`] The method that is used to
+            integrate the segment length. ``"symbolic"`` uses ``sympy``, ``"numeric"``
+            uses adaptive numerical quadrature and ``"auto"`` falls back to the
+            numerical quadrature if the symbolic integration fails. Results are cached
+            for identical expressions and parameters.
+        length_tolerance:
+            [only expression based `~weldx.SpatialSeries`] The absolute and relative
+            tolerance of the numerical length integration.
         kwargs:
             A set of keyword arguments that will be forwarded to the ``__init__`` method
             of the `~weldx.SpatialSeries` in case the ``series`` parameter isn't
@@ -141,6 +437,8 @@ class DynamicBaseSegment:
 
         self._series = series
         self._max_coord = max_coord
+        self._length_integration = length_integration
+        self._length_tolerance = length_tolerance
 
         self._length_expr = None
         self._length = None
@@ -170,15 +468,15 @@ class DynamicBaseSegment:
         sym = sympy.sympify(self._series.position_dim_name)
         return me.expression.subs(subs).diff(sym) ** 2
 
-    def _get_length_expr(self) -> MathematicalExpression:
-        """Get the primitive of a the trace function if it is expression based."""
+    def _get_length_expr(self) -> _SegmentLength:
+        """Get the length integral of the trace function if it is expression based."""
         der_sq = [self._get_component_derivative_squared(i) for i in range(3)]
         expr = sympy.sqrt(der_sq[0] + der_sq[1] + der_sq[2])
-        mc, u = sympy.symbols("max_coord, unit")
-        primitive = sympy.integrate(expr, (self._series.position_dim_name, 0, mc)) * u
-        params = dict(unit=Q_(1, Q_("1mm").to_base_units().u).to(_DEFAULT_LEN_UNIT))
+        sym = sympy.Symbol(self._series.position_dim_name)
 
-        return MathematicalExpression(primitive, params)
+        return _get_segment_length(
+            expr, sym, self._length_integration, self._length_tolerance
+        )
 
     def _len_section_disc(self, position: float) -> pint.Quantity:
         """Get the length until a specific position on the trace (discrete version)."""
@@ -199,13 +497,14 @@ class DynamicBaseSegment:
         length = np.sum(np.linalg.norm(diff.m, axis=1))
         return Q_(length, diff.u)
 
-    def get_section_length(self, position: float) -> pint.Quantity:
+    def get_section_length(self, position: float | np.ndarray) -> pint.Quantity:
         """Get the length from the start of the segment to the passed relative position.
 
         Parameters
         ----------
         position:
-            The value of the relative position coordinate.
+            The value of the relative position coordinate. Arrays of positions are
+            supported by expression based segments.
 
         Returns
         -------
@@ -214,21 +513,94 @@ class DynamicBaseSegment:
 
         """
         if self._series.is_expression:
-            # ignore unit stripped warning, as it is expected.
-            # Note, that the result still has the unit,
-            # it is stripped during computation (scipy.integrate)
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore", category=pint.errors.UnitStrippedWarning
-                )
-                length = self._length_expr.evaluate(max_coord=position).data
+            # the expression is evaluated in base units
+            length = Q_(self._length_expr(position), "m").to(_DEFAULT_LEN_UNIT)
         else:
             length = self._len_section_disc(position=position)
-        if length <= 0:
+        if np.all(length <= 0):
             raise ValueError("Segment has no length.")
 
         return length
 
+    def _get_lod_raster_samples(
+        self, tolerances: np.ndarray
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Get raster samples that satisfy multiple chordal deviation tolerances.
+
+        Discrete segments with linear interpolation are represented exactly by their
+        nodes. Other segments are sampled uniformly and the number of samples is
+        doubled until the distances of the centers between two raster points to the
+        connecting chords are below the tolerance. Since the raster of a smaller
+        tolerance is a refinement of the raster of a larger one, all tolerances are
+        handled in a single refinement pass. The number of refinements is limited to
+        ``_MAX_ADAPTIVE_REFINEMENTS``.
+
+        Parameters
+        ----------
+        tolerances:
+            1d array of maximal chordal deviations in the default length unit
+
+        Returns
+        -------
+        List[Tuple[numpy.ndarray, numpy.ndarray]]:
+            The relative positions in the interval [0, 1] and the corresponding points
+            in the default length unit for each tolerance
+
+        Raises
+        ------
+        ValueError
+            If a tolerance is not met after the maximal number of refinements
+
+        """
+        tolerances = np.atleast_1d(np.asarray(tolerances, dtype=float))
+        if not self._series.is_expression and self._series.interpolation == "linear":
+            pdn = self._series.position_dim_name
+            weights = self._series.coordinates[pdn].data / self._max_coord
+            points = self.get_points(weights * self._max_coord).to(_DEFAULT_LEN_UNIT).m
+            return [(weights, points)] * tolerances.size
+
+        samples = [None] * tolerances.size
+        order = np.argsort(-tolerances, kind="stable")
+        level = 0
+
+        weights = np.linspace(0.0, 1.0, 3)
+        points = self.get_points(weights * self._max_coord).to(_DEFAULT_LEN_UNIT).m
+        for num_refinements in range(_MAX_ADAPTIVE_REFINEMENTS + 1):
+            start, center, end = points[:-2:2], points[1:-1:2], points[2::2]
+            chord = end - start
+            weight = np.einsum("ij,ij->i", center - start, chord)
+            weight = np.clip(weight / np.einsum("ij,ij->i", chord, chord), 0, 1)
+            deviation = center - start - weight[:, np.newaxis] * chord
+            max_deviation = np.linalg.norm(deviation, axis=1).max()
+            while level < order.size and max_deviation <= tolerances[order[level]]:
+                samples[order[level]] = (weights[::2], points[::2])
+                level += 1
+            if level == order.size:
+                return samples
+            if num_refinements == _MAX_ADAPTIVE_REFINEMENTS:
+                break
+
+            weights_new = 0.5 * (weights[:-1] + weights[1:])
+            points_new = self.get_points(weights_new * self._max_coord)
+            points_new = points_new.to(_DEFAULT_LEN_UNIT).m
+
+            weights = np.insert(weights, np.arange(1, weights.size), weights_new)
+            points = np.insert(points, np.arange(1, len(points)), points_new, axis=0)
+        tolerance = tolerances[order[level]]
+        raise ValueError(
+            f"The chordal deviation of {Q_(max_deviation, _DEFAULT_LEN_UNIT):~.3g} "
+            f"reached after {_MAX_ADAPTIVE_REFINEMENTS} refinements exceeds the "
+            f"tolerance of {Q_(tolerance, _DEFAULT_LEN_UNIT):~.3g}."
+        )
+
+    def _get_lod_raster_weights(self, tolerances: np.ndarray) -> list[np.ndarray]:
+        """Get relative raster positions for multiple chordal deviation tolerances."""
+        return [weights for weights, _ in self._get_lod_raster_samples(tolerances)]
+
+    def _get_adaptive_raster_weights(self, tolerance: float) -> np.ndarray:
+        """Get relative raster positions that satisfy a chordal deviation tolerance."""
+        return self._get_lod_raster_weights(tolerance)[0]
+
     def get_points(self, positions: float) -> pint.Quantity:
         """Get an array of the points at the specified relative positions.
 
@@ -259,16 +631,14 @@ class DynamicShapeSegment(DynamicBaseSegment):
     """Shape segment class to define arbitrary 2d shapes."""
 
     @property
-    @UREG.wraps(_DEFAULT_LEN_UNIT, (None,), strict=True)
     def point_start(self) -> pint.Quantity:
         """Get the starting point of the segment."""
-        return self.get_points(0)[0, :2]
+        return self._get_raster_points(2)[:, 0].to(_DEFAULT_LEN_UNIT)
 
     @property
-    @UREG.wraps(_DEFAULT_LEN_UNIT, (None,), strict=True)
     def point_end(self) -> pint.Quantity:
         """Get the end point of the segment."""
-        return self.get_points(self._max_coord)[0, :2]
+        return self._get_raster_points(2)[:, 1].to(_DEFAULT_LEN_UNIT)
 
     @UREG.check(None, _DEFAULT_LEN_UNIT)
     def rasterize(self, raster_width: pint.Quantity) -> pint.Quantity:
@@ -290,13 +660,30 @@ class DynamicShapeSegment(DynamicBaseSegment):
         raster_width = Q_(raster_width)
         if raster_width <= 0:
             raise ValueError("'raster_width' must be a number greater than 0.")
+        return self._get_raster_points(self._get_num_raster_points(raster_width))
+
+    def _get_num_raster_points(self, raster_width: pint.Quantity) -> int:
+        """Get the number of raster points that ``rasterize`` would create."""
         num_pts = np.round((self._length / raster_width).to("").m).astype(int) + 1
-        num_pts = max(num_pts, 2)
+        return max(num_pts, 2)
 
+    def _get_raster_points(self, num_pts: int) -> pint.Quantity:
+        """Get a fixed number of equally distributed raster points of the segment."""
         vals = np.linspace(0.0, 1.0, num=num_pts, endpoint=True)
 
         return self.get_points(vals * self._max_coord)[:, :2].transpose()
 
+    def _get_lod_raster_points(self, tolerances: np.ndarray) -> list[pint.Quantity]:
+        """Get raster points for multiple chordal deviation tolerances."""
+        return [
+            Q_(points[:, :2].transpose(), _DEFAULT_LEN_UNIT)
+            for _, points in self._get_lod_raster_samples(tolerances)
+        ]
+
+    def _get_adaptive_raster_points(self, tolerance: float) -> pint.Quantity:
+        """Get raster points that satisfy a chordal deviation tolerance."""
+        return self._get_lod_raster_points(tolerance)[0]
+
     @UREG.check(None, _DEFAULT_LEN_UNIT)
     def apply_translation(self, vector: pint.Quantity) -> DynamicShapeSegment:
         """Apply a translation in place.
@@ -454,6 +841,17 @@ class LineSegment(DynamicShapeSegment):
         """Output simple string representation of a LineSegment."""
         return f"Line: {self.point_start:.2f} -> {self.point_end:.2f}"
 
+    def _get_raster_points(self, num_pts: int) -> pint.Quantity:
+        """Get a fixed number of equally distributed raster points of the segment."""
+        points = self.points
+        return Q_(
+            _line_raster_points(points.m[:, 0], points.m[:, 1], num_pts), points.u
+        )
+
+    def _get_lod_raster_points(self, tolerances: np.ndarray) -> list[pint.Quantity]:
+        """Get raster points for multiple chordal deviation tolerances."""
+        return [self.points] * np.size(tolerances)
+
     @classmethod
     @UREG.check(None, _DEFAULT_LEN_UNIT, _DEFAULT_LEN_UNIT)
     def construct_with_points(
@@ -570,6 +968,7 @@ class ArcSegment(DynamicShapeSegment):
         self._sign_winding = 1 if arc_winding_ccw else -1
         self._points = points
         self._radius = None
+        self._angle_start = None
 
         series = self._update_internals_and_get_series()
         super().__init__(series, max_coord=self._max_coord)
@@ -620,6 +1019,41 @@ class ArcSegment(DynamicShapeSegment):
         if self._length <= 0:
             raise ValueError("Arc length is 0.")
 
+    def _get_raster_points(self, num_pts: int) -> pint.Quantity:
+        """Get a fixed number of equally distributed raster points of the segment."""
+        points = self._points
+        return Q_(
+            _arc_raster_points(
+                points.m[:, 2],
+                self._radius.to(points.u).m,
+                self._angle_start,
+                self._max_coord,
+                self._sign_winding,
+                num_pts,
+            ),
+            points.u,
+        )
+
+    def _get_num_adaptive_raster_points(self, tolerance: float) -> int:
+        """Get the number of raster points for a chordal deviation tolerance."""
+        return _arc_num_adaptive_raster_points(
+            self._radius.to(_DEFAULT_LEN_UNIT).m, self._max_coord, tolerance
+        )
+
+    def _get_lod_raster_weights(self, tolerances: np.ndarray) -> list[np.ndarray]:
+        """Get relative raster positions for multiple chordal deviation tolerances."""
+        return [
+            np.linspace(0.0, 1.0, self._get_num_adaptive_raster_points(tolerance))
+            for tolerance in np.atleast_1d(tolerances)
+        ]
+
+    def _get_lod_raster_points(self, tolerances: np.ndarray) -> list[pint.Quantity]:
+        """Get raster points for multiple chordal deviation tolerances."""
+        return [
+            self._get_raster_points(self._get_num_adaptive_raster_points(tolerance))
+            for tolerance in np.atleast_1d(tolerances)
+        ]
+
     def _update_internals_and_get_series(self) -> SpatialSeries:
         diff = self._points[:, 0] - self._points[:, 2]
         self._max_coord = self._calculate_arc_angle(self._points)
@@ -627,7 +1061,8 @@ class ArcSegment(DynamicShapeSegment):
 
         expr = "(x*cos(a+s*w)+y*sin(a+s*w))*r + o"
         sign = -1 if np.cross([1, 0], diff.m) < 0 else 1
-        a = np.arccos(np.dot([1, 0], diff.m) / self._radius.m) * sign
+        a = np.arccos(np.clip(np.dot([1, 0], diff.m) / self._radius.m, -1, 1)) * sign
+        self._angle_start = a
 
         params = dict(
             x=Q_([1, 0, 0], ""),
@@ -1017,6 +1452,20 @@ class Shape:
         """
         return len(self._segments)
 
+    @property
+    def is_closed(self) -> bool:
+        """Return `True` if the end point of the shape matches its start point.
+
+        Returns
+        -------
+        bool
+            True or False
+
+        """
+        return _vector_is_close(
+            self.segments[-1].point_end, self.segments[0].point_start
+        )
+
     @property
     def segments(self) -> list[segment_types]:
         """Get the shape's segments.
@@ -1203,15 +1652,111 @@ class Shape:
             raise ValueError("'raster_width' must be > 0")
 
         raster_width = Q_(raster_width, _DEFAULT_LEN_UNIT)
-        raster_data = []
-        for segment in self.segments:
-            raster_data.append(segment.rasterize(raster_width).m[:, :-1])
-        raster_data = np.hstack(raster_data)
+        raster_data = [
+            segment._get_raster_points(segment._get_num_raster_points(raster_width))
+            .to(_DEFAULT_LEN_UNIT)
+            .m
+            for segment in self.segments
+        ]
+
+        # the end point of each segment is the start point of the next one
+        last_point = [] if self.is_closed else [raster_data[-1][:, -1:]]
+        return np.hstack([points[:, :-1] for points in raster_data] + last_point)
+
+    @UREG.wraps(_DEFAULT_LEN_UNIT, (None, _DEFAULT_LEN_UNIT), strict=True)
+    def rasterize_adaptive(self, tolerance: pint.Quantity) -> pint.Quantity:
+        """Create an array of points that approximate the shapes contour.
+
+        In contrast to ``rasterize``, the number of points of each segment is
+        determined by the maximal allowed distance between the contour and the straight
+        lines between the raster points. Line segments are represented by their start
+        and end points and arc segments by equal angle steps. The raster of other
+        segments is refined by halving the steps, which is done at most 12 times.
+
+        Parameters
+        ----------
+        tolerance :
+            The maximal chordal deviation between the contour and the raster
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of contour points (2d)
+
+        Raises
+        ------
+        ValueError
+            If a segment doesn't meet the tolerance after 12 refinements
+
+        Examples
+        --------
+        >>> from weldx import Q_, ArcSegment, LineSegment, Shape
+        >>> p1, p2, p3 = Q_([0, 0], "mm"), Q_([10, 0], "mm"), Q_([10, 4], "mm")
+        >>> line = LineSegment.construct_with_points(p1, p2)
+        >>> arc = ArcSegment.construct_with_points(p2, p3, Q_([10, 2], "mm"))
+        >>> Shape([line, arc]).rasterize_adaptive("0.1mm").shape
+        (2, 7)
+
+        """
+        return self._rasterize_lod(tolerance)[0]
+
+    @UREG.wraps(None, (None, _DEFAULT_LEN_UNIT), strict=True)
+    def rasterize_lod(self, tolerances: pint.Quantity) -> list[pint.Quantity]:
+        """Get adaptive rasterizations of the shape for multiple levels of detail.
+
+        All levels are computed in a single refinement pass, since the raster of a
+        smaller tolerance is a refinement of the raster of a larger one. See
+        `Shape.rasterize_adaptive` for details.
+
+        Parameters
+        ----------
+        tolerances :
+            1d array with the chordal deviation tolerance of each level
+
+        Returns
+        -------
+        List[pint.Quantity]
+            The contour points (2d) of each level
+
+        Raises
+        ------
+        ValueError
+            If a segment doesn't meet a tolerance after 12 refinements
+
+        Examples
+        --------
+        >>> from weldx import Q_, ArcSegment, Shape
+        >>> p1, p2 = Q_([10, 0], "mm"), Q_([10, 4], "mm")
+        >>> arc = ArcSegment.construct_with_points(p1, p2, Q_([10, 2], "mm"))
+        >>> [r.shape for r in Shape(arc).rasterize_lod(Q_([1, 0.1, 0.01], "mm"))]
+        [(2, 3), (2, 6), (2, 17)]
+
+        """
+        return [Q_(data, _DEFAULT_LEN_UNIT) for data in self._rasterize_lod(tolerances)]
+
+    def _rasterize_lod(self, tolerances: float | np.ndarray) -> list[np.ndarray]:
+        """Get the adaptive raster data of each tolerance in the default length unit."""
+        tolerances = np.atleast_1d(tolerances)
+        if self.num_segments == 0:
+            raise WeldxException("Can't rasterize empty shape.")
+        if not np.all(tolerances > 0):
+            raise ValueError("'tolerance' must be > 0")
+
+        segment_data = [
+            [
+                points.to(_DEFAULT_LEN_UNIT).m
+                for points in segment._get_lod_raster_points(tolerances)
+            ]
+            for segment in self.segments
+        ]
 
-        last_point = self.segments[-1].point_end.m[:, np.newaxis]
-        if not _vector_is_close(last_point, self.segments[0].point_start.m):
-            raster_data = np.hstack((raster_data, last_point))
-        return raster_data
+        levels = []
+        for raster_data in zip(*segment_data):
+            last_point = [] if self.is_closed else [raster_data[-1][:, -1:]]
+            levels.append(
+                np.hstack([points[:, :-1] for points in raster_data] + last_point)
+            )
+        return levels
 
     @UREG.check(None, _DEFAULT_LEN_UNIT, _DEFAULT_LEN_UNIT)
     def reflect(
@@ -1397,6 +1942,77 @@ class Profile:
             return Q_(np.hstack(raster_data), _DEFAULT_LEN_UNIT)
         return [Q_(item, _DEFAULT_LEN_UNIT) for item in raster_data]
 
+    @UREG.wraps(None, (None, _DEFAULT_LEN_UNIT, None), strict=True)
+    def rasterize_adaptive(
+        self, tolerance: pint.Quantity, stack: bool = True
+    ) -> pint.Quantity | list[pint.Quantity]:
+        """Rasterize the profile with a chordal deviation tolerance.
+
+        See `Shape.rasterize_adaptive` for details.
+
+        Parameters
+        ----------
+        tolerance :
+            The maximal chordal deviation between the shapes and the raster
+        stack :
+            hstack data into a single output array (default = True)
+
+        Returns
+        -------
+        Union[pint.Quantity, List[pint.Quantity]]
+            Raster data
+
+        Raises
+        ------
+        ValueError
+            If a segment doesn't meet the tolerance after 12 refinements
+
+        """
+        return self._rasterize_lod(tolerance, stack)[0]
+
+    @UREG.wraps(None, (None, _DEFAULT_LEN_UNIT, None), strict=True)
+    def rasterize_lod(
+        self, tolerances: pint.Quantity, stack: bool = True
+    ) -> list[pint.Quantity | list[pint.Quantity]]:
+        """Get adaptive rasterizations of the profile for multiple levels of detail.
+
+        All levels of a shape are computed in a single refinement pass. See
+        `Shape.rasterize_lod` for details.
+
+        Parameters
+        ----------
+        tolerances :
+            1d array with the chordal deviation tolerance of each level
+        stack :
+            hstack data of each level into a single output array (default = True)
+
+        Returns
+        -------
+        List[Union[pint.Quantity, List[pint.Quantity]]]
+            The raster data of each level
+
+        Raises
+        ------
+        ValueError
+            If a segment doesn't meet a tolerance after 12 refinements
+
+        """
+        return self._rasterize_lod(tolerances, stack)
+
+    def _rasterize_lod(
+        self, tolerances: float | np.ndarray, stack: bool
+    ) -> list[pint.Quantity | list[pint.Quantity]]:
+        """Get the adaptive raster data of each tolerance."""
+        shape_data = [shape._rasterize_lod(tolerances) for shape in self._shapes]
+
+        levels = []
+        for raster_data in zip(*shape_data):
+            if stack:
+                levels.append(Q_(np.hstack(raster_data), _DEFAULT_LEN_UNIT))
+            else:
+                levels.append([Q_(item, _DEFAULT_LEN_UNIT) for item in raster_data])
+        return levels
+
     @UREG.check(None, None, "[length]", None, None, None, None, None, None, None)
     @check_matplotlib_available
     def plot(
@@ -1594,6 +2210,85 @@ class DynamicTraceSegment(DynamicBaseSegment):
             x = np.array([self._get_tangent_vec_discrete(p) for p in position])
         return self._get_lcs_from_coords_and_tangent(coords, x)
 
+    def _local_cs_data(self, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get orientations and coordinates at multiple rel. positions as plain arrays.
+
+        This is the batched counterpart of ``local_coordinate_system`` that skips the
+        creation of ``LocalCoordinateSystem`` objects.
+
+        Parameters
+        ----------
+        positions:
+            1d array of relative positions on the segment (interval [0, 1])
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]:
+            The orientation matrices with shape (N, 3, 3) and the coordinates in the
+            default length unit with shape (N, 3)
+
+        """
+        positions = np.atleast_1d(np.asarray(positions, dtype=float))
+        pdn = self._series.position_dim_name
+
+        if self._series.is_expression:
+            eval_pos = {pdn: positions * self._max_coord}
+            coords = self._series.evaluate(**eval_pos).data_array
+            coords = coords.transpose(..., "c").data
+            if pdn not in self._derivative.get_variable_names():
+                eval_pos = {}
+            tangent = self._derivative.evaluate(**eval_pos).transpose(..., "c").data.m
+        else:
+            nodes = self._series.coordinates[pdn].data
+            data = self._series.data_array.transpose(..., "c").data
+            data = data.to(_DEFAULT_LEN_UNIT).m
+            idx = np.searchsorted(nodes, positions, side="right") - 1
+            idx = np.clip(idx, 0, len(nodes) - 2)
+            tangent = data[idx + 1] - data[idx]
+            if self._series.interpolation == "linear":
+                weights = (positions - nodes[idx]) / (nodes[idx + 1] - nodes[idx])
+                weights = np.clip(weights, 0, 1)[:, np.newaxis]
+                coords = Q_(data[idx] + weights * tangent, _DEFAULT_LEN_UNIT)
+            else:
+                coords = self._series.evaluate(**{pdn: positions}).data_array
+                coords = coords.transpose(..., "c").data
+
+        coords = np.broadcast_to(coords.to(_DEFAULT_LEN_UNIT).m, (positions.size, 3))
+
+        x = np.broadcast_to(tangent, (positions.size, 3))
+        z = np.broadcast_to([0.0, 0.0, 1.0], x.shape)
+        y = np.cross(z, x)
+
+        if self._limit_orientation:
+            x = np.cross(y, z)
+        else:
+            z = np.cross(x, y)
+
+        orient = np.stack([x, y, z], axis=-1)
+        return orient / np.linalg.norm(orient, axis=-2, keepdims=True), coords
+
+    def _project_local_points(
+        self, points: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Get the closest points on the segment for points in the segment's system.
+
+        Segments with a known geometry override this method with an analytical
+        solution. The base implementation returns `None`.
+
+        Parameters
+        ----------
+        points:
+            Array of points with shape (N, 3) in the default length unit
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]:
+            The lengths from the segment start to the closest points with shape (N,)
+            and the closest points with shape (N, 3)
+
+        """
+        return None
+
     def local_coordinate_system(self, position: float) -> tf.LocalCoordinateSystem:
         """Calculate a local coordinate system at a position of the trace segment.
 
@@ -1643,6 +2338,15 @@ class LinearHorizontalTraceSegment(DynamicTraceSegment):
             Q_([[0, 0, 0], [length, 0, 0]], _DEFAULT_LEN_UNIT), coords=[0, 1]
         )
 
+    def _project_local_points(
+        self, points: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the closest points on the segment for points in the segment's system."""
+        positions = np.clip(points[:, 0], 0, self.length.to(_DEFAULT_LEN_UNIT).m)
+        closest = np.zeros_like(points)
+        closest[:, 0] = positions
+        return positions, closest
+
 
 class RadialHorizontalTraceSegment(DynamicTraceSegment):
     """Trace segment describing an arc with constant z-component."""
@@ -1711,9 +2415,39 @@ class RadialHorizontalTraceSegment(DynamicTraceSegment):
         """Get True, if the segments winding is clockwise, False otherwise."""
         return self._sign_winding > 0
 
+    def _get_lod_raster_weights(self, tolerances: np.ndarray) -> list[np.ndarray]:
+        """Get relative raster positions for multiple chordal deviation tolerances."""
+        num_pts = [
+            _arc_num_adaptive_raster_points(self._radius, self._max_coord, tolerance)
+            for tolerance in np.atleast_1d(tolerances)
+        ]
+        return [np.linspace(0.0, 1.0, num) for num in num_pts]
+
+    def _project_local_points(
+        self, points: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the closest points on the segment for points in the segment's system."""
+        r, w = self._radius, self._sign_winding
+
+        # angle between the start point and the points, seen from the center
+        angles = np.arctan2(points[:, 0], w * (points[:, 1] + w * r)) % (2 * np.pi)
+
+        # outside of the arc, the closer end point is the closest one
+        beyond_end = angles > self._max_coord
+        closer_to_start = (2 * np.pi - angles) < (angles - self._max_coord)
+        angles[beyond_end & closer_to_start] = 0
+        angles[beyond_end & ~closer_to_start] = self._max_coord
+
+        closest = np.zeros_like(points)
+        closest[:, 0] = r * np.sin(angles)
+        closest[:, 1] = w * r * (np.cos(angles) - 1)
+        return r * angles, closest
+
 
 # Trace class -----------------------------------------------------------------
 
+_PROJECTION_CACHE_SIZE = 8
+
 trace_segment_types = Union[
     LinearHorizontalTraceSegment, RadialHorizontalTraceSegment, DynamicTraceSegment
 ]
@@ -1753,6 +2487,8 @@ class Trace:
 
         self._segments = _to_list(segments)
         self._create_lookups(coordinate_system)
+        self._projection_indices = {}
+        self._lod_rasters = {}
 
         if self.length.m <= 0:
             raise ValueError("Trace has no length.")
@@ -1761,9 +2497,11 @@ class Trace:
         """Output representation of a Trace."""
         return (
             f"Trace('segments': {self._segments!r}, "
-            f"'coordinate_system_lookup': {self._coordinate_system_lookup!r}, "
-            f"'total_length_lookup': {self._total_length_lookup!r}, "
-            f"'segment_length_lookup': {self._segment_length_lookup!r})"
+            f"'coordinate_system_lookup': {self._coordinate_system_lookups()!r}, "
+            f"'total_length_lookup': "
+            f"{Q_(self._total_length_array, _DEFAULT_LEN_UNIT)!r}, "
+            f"'segment_length_lookup': "
+            f"{Q_(self._segment_length_array, _DEFAULT_LEN_UNIT)!r})"
         )
 
     def _create_lookups(self, coordinate_system_start: tf.LocalCoordinateSystem):
@@ -1776,44 +2514,267 @@ class Trace:
             the trace.
 
         """
-        self._coordinate_system_lookup = [coordinate_system_start]
-        self._total_length_lookup = [Q_("0mm")]
-        self._segment_length_lookup = []
-
+        self._coordinate_system = coordinate_system_start
         segments = self._segments
 
-        total_length = Q_(0.0, "mm")
-        for i, segment in enumerate(segments):
-            # Fill coordinate system lookup
-            lcs_segment_end = segments[i].local_coordinate_system(1)
-            lcs = lcs_segment_end + self._coordinate_system_lookup[i]
-            self._coordinate_system_lookup += [lcs]
-
-            # Fill length lookups
-            segment_length = segment.length
-            total_length += segment_length
-            self._segment_length_lookup += [segment_length]
-            self._total_length_lookup += [total_length.copy()]
-
-    def _get_segment_index(self, position: float) -> int:
-        """Get the segment index for a certain position.
-
+        # lengths in the default length unit for fast lookups
+        self._segment_length_array = np.array(
+            [(Q_(0.0, _DEFAULT_LEN_UNIT) + s.length).m for s in segments],
+            dtype=float,
+        )
+        self._total_length_array = np.concatenate(
+            [[0.0], np.cumsum(self._segment_length_array)]
+        )
+
+        # coordinate systems at the segment starts as plain arrays
+        if coordinate_system_start.is_time_dependent:
+            cs_lookup = [coordinate_system_start]
+            for i, segment in enumerate(segments):
+                cs_lookup += [segment.local_coordinate_system(1) + cs_lookup[i]]
+            self._coordinate_system_lookup = cs_lookup
+            self._orientation_lookup = np.stack(
+                [lcs.orientation.transpose(..., "c", "v").data for lcs in cs_lookup]
+            )
+            self._coordinates_lookup = np.stack(
+                [lcs.coordinates.data.to(_DEFAULT_LEN_UNIT).m for lcs in cs_lookup]
+            )
+            return
+
+        self._coordinate_system_lookup = None
+        orient = np.empty((len(segments) + 1, 3, 3))
+        coords = np.empty((len(segments) + 1, 3))
+        orient[0] = coordinate_system_start.orientation.transpose("c", "v").data
+        coords[0] = coordinate_system_start.coordinates.data.to(_DEFAULT_LEN_UNIT).m
+        for i, segment in enumerate(segments):
+            orient_end, coords_end = self._segment_local_cs_data(segment, np.ones(1))
+            orient[i + 1] = np.matmul(orient[i], orient_end[0])
+            coords[i + 1] = np.matmul(orient[i], coords_end[0]) + coords[i]
+        self._orientation_lookup = orient
+        self._coordinates_lookup = coords
+
+    def _segment_start_coordinate_system(self, idx: int) -> tf.LocalCoordinateSystem:
+        """Get the coordinate system at the start of a segment.
+
+        Parameters
+        ----------
+        idx :
+            Segment index. The number of segments returns the system at the trace end.
+
+        Returns
+        -------
+        weldx.transformations.LocalCoordinateSystem
+            Coordinate system at the start of the segment
+
+        """
+        if self._coordinate_system_lookup is not None:
+            return self._coordinate_system_lookup[idx]
+        if idx == 0:
+            return self._coordinate_system
+        return tf.LocalCoordinateSystem(
+            self._orientation_lookup[idx],
+            Q_(self._coordinates_lookup[idx], _DEFAULT_LEN_UNIT),
+        )
+
+    def _coordinate_system_lookups(self) -> list[tf.LocalCoordinateSystem]:
+        """Get the coordinate systems at all segment starts and the trace end."""
+        return [
+            self._segment_start_coordinate_system(i)
+            for i in range(self.num_segments + 1)
+        ]
+
+    def _get_segment_index(self, position: float | np.ndarray) -> int | np.ndarray:
+        """Get the segment index for a certain position.
+
+        Positions that coincide with the end of a segment are assigned to this segment.
+
         Parameters
         ----------
         position :
-            Position
+            Single position or array of positions in the default length unit
 
         Returns
         -------
-        int
-            Segment index
+        Union[int, numpy.ndarray]
+            Segment index or array of segment indices
+
+        """
+        return np.searchsorted(self._total_length_array[1:-1], position, side="left")
+
+    @staticmethod
+    def _segment_local_cs_data(
+        segment: trace_segment_types, weights: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the local orientations and coordinates of a segment as plain arrays."""
+        if isinstance(segment, DynamicTraceSegment):
+            return segment._local_cs_data(weights)
+
+        # fallback for custom segments that only provide `local_coordinate_system`
+        lcs_list = [segment.local_coordinate_system(w) for w in weights]
+        orient = np.stack(
+            [lcs.orientation.transpose(..., "c", "v").data for lcs in lcs_list]
+        )
+        coords = np.stack(
+            [lcs.coordinates.data.to(_DEFAULT_LEN_UNIT).m for lcs in lcs_list]
+        )
+        return orient, coords
+
+    def _local_cs_data(self, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get orientations and coordinates at multiple positions as plain arrays.
+
+        Parameters
+        ----------
+        positions :
+            1d array of positions on the trace in the default length unit
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The orientation matrices with shape (N, 3, 3) and the coordinates in the
+            default length unit with shape (N, 3)
 
         """
-        position = np.clip(position, 0, self.length)
-        for i in range(len(self._total_length_lookup) - 2):
-            if position <= self._total_length_lookup[i + 1]:
-                return i
-        return self.num_segments - 1
+        lengths = self._total_length_array
+        positions = np.clip(np.atleast_1d(np.asarray(positions, dtype=float)), 0, None)
+        positions = np.clip(positions, None, lengths[-1])
+
+        idx = self._get_segment_index(positions)
+        weights = (positions - lengths[idx]) / self._segment_length_array[idx]
+
+        orient = np.empty((positions.size, 3, 3))
+        coords = np.empty((positions.size, 3))
+        for i in np.unique(idx):
+            mask = idx == i
+            orient[mask], coords[mask] = self._segment_local_cs_data(
+                self._segments[i], weights[mask]
+            )
+
+        orient_start = self._orientation_lookup[idx]
+        orient = np.matmul(orient_start, orient)
+        coords = np.einsum("nij,nj->ni", orient_start, coords)
+        return orient, coords + self._coordinates_lookup[idx]
+
+    def _projection_index(
+        self, raster_width: float
+    ) -> tuple[np.ndarray, np.ndarray, cKDTree]:
+        """Get the cached raster and its spatial index that are used for projections.
+
+        The indices are cached by their number of raster segments. Only the
+        ``_PROJECTION_CACHE_SIZE`` most recently created indices are kept.
+
+        Parameters
+        ----------
+        raster_width :
+            The maximal distance between two raster points in the default length unit
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray, scipy.spatial.cKDTree]
+            The positions of the raster points, the raster points with shape (N, 3)
+            and a KD-tree of the raster points
+
+        """
+        length = self._total_length_array[-1]
+        num_raster_segments = max(int(np.ceil(length / raster_width)), 1)
+        if num_raster_segments not in self._projection_indices:
+            if len(self._projection_indices) >= _PROJECTION_CACHE_SIZE:
+                del self._projection_indices[next(iter(self._projection_indices))]
+            positions = np.linspace(0, length, num_raster_segments + 1)
+            _, points = self._local_cs_data(positions)
+            self._projection_indices[num_raster_segments] = (
+                positions,
+                points,
+                cKDTree(points),
+            )
+        return self._projection_indices[num_raster_segments]
+
+    def _project_on_raster(
+        self, points: np.ndarray, raster_width: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Project points onto the polyline through the cached raster points.
+
+        Only the two lines that are connected to the closest raster point are
+        considered.
+
+        Parameters
+        ----------
+        points :
+            Array of points with shape (N, 3) in the default length unit
+        raster_width :
+            The maximal distance between two raster points in the default length unit
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The positions on the trace and the distances to the polyline
+
+        """
+        raster_pos, raster_points, tree = self._projection_index(raster_width)
+        _, idx = tree.query(points)
+
+        positions = np.empty(len(points))
+        distances = np.full(len(points), np.inf)
+        for idx_start in (idx - 1, idx):
+            idx_start = np.clip(idx_start, 0, len(raster_pos) - 2)
+            start = raster_points[idx_start]
+            vec = raster_points[idx_start + 1] - start
+            weight = np.einsum("ij,ij->i", points - start, vec)
+            weight = np.clip(weight / np.einsum("ij,ij->i", vec, vec), 0, 1)
+
+            dist = np.linalg.norm(points - start - weight[:, np.newaxis] * vec, axis=1)
+            closer = dist < distances
+            pos_start = raster_pos[idx_start]
+            pos = pos_start + weight * (raster_pos[idx_start + 1] - pos_start)
+            positions[closer] = pos[closer]
+            distances[closer] = dist[closer]
+        return positions, distances
+
+    def _project_on_segments(
+        self,
+        points: np.ndarray,
+        segment_indices: np.ndarray,
+        positions: np.ndarray,
+        distances: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Refine projected positions with the analytical solutions of the segments.
+
+        Points that are assigned to segments without an analytical solution keep the
+        passed positions and distances.
+
+        Parameters
+        ----------
+        points :
+            Array of points with shape (N, 3) in the default length unit
+        segment_indices :
+            The index of the segment that each point is projected on
+        positions :
+            The approximated positions on the trace
+        distances :
+            The approximated distances to the trace
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The refined positions on the trace and the distances to the trace
+
+        """
+        positions, distances = positions.copy(), distances.copy()
+        for i in np.unique(segment_indices):
+            segment = self._segments[i]
+            if not isinstance(segment, DynamicTraceSegment):
+                continue
+
+            mask = segment_indices == i
+            local_points = np.matmul(
+                points[mask] - self._coordinates_lookup[i], self._orientation_lookup[i]
+            )
+            projection = segment._project_local_points(local_points)
+            if projection is None:
+                continue
+
+            local_positions, closest = projection
+            positions[mask] = self._total_length_array[i] + local_positions
+            distances[mask] = np.linalg.norm(local_points - closest, axis=1)
+        return positions, distances
 
     @property
     def coordinate_system(self) -> tf.LocalCoordinateSystem:
@@ -1825,7 +2786,7 @@ class Trace:
             Coordinate system of the trace
 
         """
-        return self._coordinate_system_lookup[0]
+        return self._coordinate_system
 
     @property
     @UREG.wraps(_DEFAULT_LEN_UNIT, (None,), strict=True)
@@ -1838,7 +2799,7 @@ class Trace:
             Length of the trace.
 
         """
-        return self._total_length_lookup[-1]
+        return self._total_length_array[-1]
 
     @property
     def segments(self) -> list[trace_segment_types]:
@@ -1881,17 +2842,120 @@ class Trace:
             Local coordinate system
 
         """
+        position = np.clip(position.to(_DEFAULT_LEN_UNIT).m, 0, self.length.m)
         idx = self._get_segment_index(position)
 
-        total_length_start = self._total_length_lookup[idx]
-        segment_length = self._segment_length_lookup[idx]
-        weight = (position - total_length_start) / segment_length
+        total_length_start = self._total_length_array[idx]
+        segment_length = self._segment_length_array[idx]
+        weight = float((position - total_length_start) / segment_length)
 
         local_segment_cs = self.segments[idx].local_coordinate_system(weight)
-        segment_start_cs = self._coordinate_system_lookup[idx]
+        segment_start_cs = self._segment_start_coordinate_system(idx)
 
         return local_segment_cs + segment_start_cs
 
+    @UREG.wraps((None, _DEFAULT_LEN_UNIT), (None, _DEFAULT_LEN_UNIT), strict=True)
+    def local_coordinate_system_data(
+        self, positions: pint.Quantity
+    ) -> tuple[np.ndarray, pint.Quantity]:
+        """Get the orientations and coordinates at multiple positions on the trace.
+
+        In contrast to ``local_coordinate_system``, all positions are evaluated in a
+        single call and the results are returned as stacked arrays instead of
+        `~weldx.transformations.LocalCoordinateSystem` instances.
+
+        Parameters
+        ----------
+        positions :
+            Single position or 1d array of positions
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, pint.Quantity]
+            The orientation matrices with shape (N, 3, 3) and the coordinates with
+            shape (N, 3)
+
+        Examples
+        --------
+        >>> from weldx import Q_, LinearHorizontalTraceSegment, Trace
+        >>> trace = Trace(LinearHorizontalTraceSegment("10mm"))
+        >>> orientations, coordinates = trace.local_coordinate_system_data(
+        ...     Q_([0, 5, 10], "mm")
+        ... )
+        >>> orientations.shape
+        (3, 3, 3)
+        >>> coordinates[:, 0]
+        <Quantity([ 0.  5. 10.], 'millimeter')>
+
+        """
+        return self._local_cs_data(positions)
+
+    @UREG.check(None, "[length]", None)
+    def project_points(
+        self, points: pint.Quantity, raster_width: pint.Quantity = None
+    ) -> tuple[pint.Quantity, pint.Quantity]:
+        """Get the positions on the trace that are closest to the passed points.
+
+        The points are first projected onto a polyline through a cached raster of the
+        trace using a KD-tree. Afterwards, the results are refined analytically for
+        `LinearHorizontalTraceSegment` and `RadialHorizontalTraceSegment`. For other
+        segment types, the polyline projection is returned. Its accuracy depends on
+        the ``raster_width`` and the curvature of the segment.
+
+        Parameters
+        ----------
+        points :
+            Single point or array of points with shape (N, 3)
+        raster_width :
+            The maximal distance between the raster points of the polyline. If `None`
+            is passed, the trace is divided into at least 1000 parts and each segment
+            is rasterized with at least 20 points.
+
+        Returns
+        -------
+        Tuple[pint.Quantity, pint.Quantity]
+            The positions on the trace and the distances of the points to the trace
+
+        Examples
+        --------
+        >>> from weldx import Q_, LinearHorizontalTraceSegment, Trace
+        >>> trace = Trace(LinearHorizontalTraceSegment("10mm"))
+        >>> positions, distances = trace.project_points(
+        ...     Q_([[2, 1, 0], [12, 0, 0]], "mm")
+        ... )
+        >>> positions
+        <Quantity([ 2. 10.], 'millimeter')>
+        >>> distances
+        <Quantity([1. 2.], 'millimeter')>
+
+        """
+        points = np.atleast_2d(points.to(_DEFAULT_LEN_UNIT).m).astype(float)
+        if raster_width is None:
+            segment_lengths = np.diff(self._total_length_array)
+            raster_width = min(segment_lengths.min() / 20, segment_lengths.sum() / 1000)
+        else:
+            raster_width = Q_(raster_width).to(_DEFAULT_LEN_UNIT).m
+        if not raster_width > 0:
+            raise ValueError("'raster_width' must be > 0")
+
+        positions, distances = self._project_on_raster(points, float(raster_width))
+
+        # the closest point might be located on the neighboring segment
+        (pos_a, dist_a), (pos_b, dist_b) = (
+            self._project_on_segments(
+                points,
+                self._get_segment_index(positions + offset),
+                positions,
+                distances,
+            )
+            for offset in (-raster_width, raster_width)
+        )
+        closer = dist_b < dist_a
+        positions = np.where(closer, pos_b, pos_a)
+        distances = np.where(closer, dist_b, dist_a)
+
+        return Q_(positions, _DEFAULT_LEN_UNIT), Q_(distances, _DEFAULT_LEN_UNIT)
+
     @UREG.wraps(_DEFAULT_LEN_UNIT, (None, _DEFAULT_LEN_UNIT), strict=True)
     def rasterize(self, raster_width: pint.Quantity) -> pint.Quantity:
         """Rasterize the trace.
@@ -1910,32 +2974,107 @@ class Trace:
         if not raster_width > 0:
             raise ValueError("'raster_width' must be > 0")
 
-        raster_width = Q_(raster_width, _DEFAULT_LEN_UNIT)
+        length = self._total_length_array[-1]
+
+        raster_width = np.clip(raster_width, 0, length)
+        num_raster_segments = int(np.round(length / raster_width))
+        raster_width_eff = length / num_raster_segments
+
+        locations = np.arange(num_raster_segments) * raster_width_eff
+        _, raster_data = self._local_cs_data(locations)
+
+        last_point = self._coordinates_lookup[-1]
+        return np.vstack([raster_data, last_point]).transpose()
+
+    @UREG.wraps(_DEFAULT_LEN_UNIT, (None, _DEFAULT_LEN_UNIT), strict=True)
+    def rasterize_adaptive(self, tolerance: pint.Quantity) -> pint.Quantity:
+        """Rasterize the trace with a chordal deviation tolerance.
 
-        raster_width = np.clip(raster_width, Q_("0mm"), self.length)
-        num_raster_segments = int(np.round(self.length / raster_width))
-        raster_width_eff = self.length / num_raster_segments
+        The number of points of each segment is determined by the maximal allowed
+        distance between the trace and the straight lines between the raster points.
+        Linear segments are represented by their start and end points and radial
+        segments by equal angle steps. The raster of other segments is refined by
+        halving the steps, which is done at most 12 times. The results are cached and
+        returned as read-only arrays, since traces can't be modified.
 
-        idx = 0
-        raster_data = np.empty((3, 0))
-        for i in range(num_raster_segments):
-            location = i * raster_width_eff
+        Parameters
+        ----------
+        tolerance :
+            The maximal chordal deviation between the trace and the raster
+
+        Returns
+        -------
+        pint.Quantity
+            Raster data
+
+        Raises
+        ------
+        ValueError
+            If a segment doesn't meet the tolerance after 12 refinements
+
+        """
+        return self._rasterize_lod(tolerance)[0]
 
-            while not location <= self._total_length_lookup[idx + 1]:
-                idx += 1
+    @UREG.wraps(None, (None, _DEFAULT_LEN_UNIT), strict=True)
+    def rasterize_lod(self, tolerances: pint.Quantity) -> list[pint.Quantity]:
+        """Get adaptive rasterizations of the trace for multiple levels of detail.
+
+        All levels that aren't cached yet are computed in a single refinement pass,
+        since the raster of a smaller tolerance is a refinement of the raster of a
+        larger one. The levels share the cache of `Trace.rasterize_adaptive`.
+
+        Parameters
+        ----------
+        tolerances :
+            1d array with the chordal deviation tolerance of each level
 
-            segment_location = location - self._total_length_lookup[idx]
-            weight = segment_location / self._segment_length_lookup[idx]
-            local_segment_cs = self.segments[idx].local_coordinate_system(weight)
-            segment_start_cs = self._coordinate_system_lookup[idx]
+        Returns
+        -------
+        List[pint.Quantity]
+            The raster data of each level
+
+        Raises
+        ------
+        ValueError
+            If a segment doesn't meet a tolerance after 12 refinements
+
+        Examples
+        --------
+        >>> from weldx import Q_, Trace
+        >>> from weldx.geometry import RadialHorizontalTraceSegment
+        >>> trace = Trace(RadialHorizontalTraceSegment("10mm", "180deg"))
+        >>> [r.shape for r in trace.rasterize_lod(Q_([1, 0.1, 0.01], "mm"))]
+        [(3, 5), (3, 13), (3, 37)]
 
-            local_cs = local_segment_cs + segment_start_cs
+        """
+        return [Q_(data, _DEFAULT_LEN_UNIT) for data in self._rasterize_lod(tolerances)]
 
-            data_point = local_cs.coordinates.data[:, np.newaxis]
-            raster_data = np.hstack([raster_data, data_point])
+    def _rasterize_lod(self, tolerances: float | np.ndarray) -> list[np.ndarray]:
+        """Get the cached raster data of each tolerance in the default length unit."""
+        tolerances = [float(tolerance) for tolerance in np.atleast_1d(tolerances)]
+        if not all(tolerance > 0 for tolerance in tolerances):
+            raise ValueError("'tolerance' must be > 0")
 
-        last_point = self._coordinate_system_lookup[-1].coordinates.data[:, np.newaxis]
-        return np.hstack([raster_data, last_point])
+        missing = list(
+            dict.fromkeys(t for t in tolerances if t not in self._lod_rasters)
+        )
+        if missing:
+            lengths = self._total_length_array
+            segment_weights = [
+                segment._get_lod_raster_weights(missing) for segment in self._segments
+            ]
+            last_point = self._coordinates_lookup[-1]
+            for level, tolerance in enumerate(missing):
+                positions = [
+                    lengths[i] + weights[level][:-1] * (lengths[i + 1] - lengths[i])
+                    for i, weights in enumerate(segment_weights)
+                ]
+                _, raster_data = self._local_cs_data(np.concatenate(positions))
+
+                raster_data = np.vstack([raster_data, last_point]).T
+                raster_data.flags.writeable = False
+                self._lod_rasters[tolerance] = raster_data
+        return [self._lod_rasters[tolerance] for tolerance in tolerances]
 
     @UREG.check(None, "[length]", None, None, None)
     def plot(
@@ -2023,6 +3162,76 @@ def linear_profile_interpolation_sbs(
     return Profile(shapes_c)
 
 
+def _sbs_topology_matches(profile_a: Profile, profile_b: Profile) -> bool:
+    """Check if two profiles can be interpolated segment by segment."""
+    if profile_a.num_shapes != profile_b.num_shapes:
+        return False
+    for shape_a, shape_b in zip(profile_a.shapes, profile_b.shapes):
+        if shape_a.num_segments != shape_b.num_segments:
+            return False
+        if any(
+            type(seg_a) is not type(seg_b)
+            for seg_a, seg_b in zip(shape_a.segments, shape_b.segments)
+        ):
+            return False
+        if shape_a.is_closed != shape_b.is_closed:
+            return False
+    return True
+
+
+def _rasterize_sbs_pair(
+    profile_a: Profile, profile_b: Profile, raster_width: pint.Quantity
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rasterize two profiles with identical segment by segment point counts.
+
+    The number of raster points of each segment pair is determined by the segment that
+    needs more points to satisfy the raster width. Interpolating the returned raster
+    data linearly is equivalent to rasterizing a linearly interpolated profile with the
+    same point counts.
+
+    Parameters
+    ----------
+    profile_a :
+        First profile
+    profile_b :
+        Second profile
+    raster_width :
+        Raster width
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        The 2d raster data of both profiles in the default length unit
+
+    """
+    raster_a, raster_b = [], []
+    for shape_a, shape_b in zip(profile_a.shapes, profile_b.shapes):
+        for seg_a, seg_b in zip(shape_a.segments, shape_b.segments):
+            num_pts = max(
+                seg_a._get_num_raster_points(raster_width),
+                seg_b._get_num_raster_points(raster_width),
+            )
+            for seg, raster in ((seg_a, raster_a), (seg_b, raster_b)):
+                points = seg._get_raster_points(num_pts).to(_DEFAULT_LEN_UNIT).m
+                raster.append(points[:, :-1])
+        if not shape_a.is_closed:
+            raster_a.append(shape_a.segments[-1].point_end.m[:, np.newaxis])
+            raster_b.append(shape_b.segments[-1].point_end.m[:, np.newaxis])
+    return np.hstack(raster_a), np.hstack(raster_b)
+
+
+def _rasterize_local_profile(
+    profile: VariableProfile, location: pint.Quantity, raster_width: pint.Quantity
+) -> np.ndarray:
+    """Get the 3d raster data of a variable profile at a certain location.
+
+    This function is defined on module level so that it can be used with a process
+    pool.
+    """
+    local_profile = profile.local_profile(location)
+    return Geometry._profile_raster_data_3d(local_profile, raster_width).m
+
+
 # Varying profile class -------------------------------------------------------
 
 
@@ -2067,9 +3276,9 @@ class VariableProfile:
                 "Number of interpolations must be 1 less than number of profiles."
             )
 
-        for i in range(len(profiles) - 1):
-            if locations[i] >= locations[i + 1]:
-                raise ValueError("Locations need to be sorted in ascending order.")
+        locations = np.array(locations, dtype=float)
+        if np.any(np.diff(locations) <= 0):
+            raise ValueError("Locations need to be sorted in ascending order.")
 
         self._profiles = profiles
         self._locations = locations
@@ -2083,24 +3292,21 @@ class VariableProfile:
             f"'interpolation_schemes' {self._interpolation_schemes!r})"
         )
 
-    def _segment_index(self, location: float):
+    def _segment_index(self, location: float | np.ndarray) -> int | np.ndarray:
         """Get the index of the segment at a certain location.
 
         Parameters
         ----------
         location :
-            Location
+            Single location or array of locations in the default length unit
 
         Returns
         -------
-        int
-            Segment index
+        Union[int, numpy.ndarray]
+            Segment index or array of segment indices
 
         """
-        idx = 0
-        while location > self._locations[idx + 1]:
-            idx += 1
-        return idx
+        return np.searchsorted(self._locations[1:-1], location, side="left")
 
     @property
     def interpolation_schemes(self) -> list:
@@ -2283,22 +3489,6 @@ class Geometry:
         if not isinstance(trace, Trace):
             raise TypeError("'trace' must be a 'Trace' class")
 
-    def _get_local_profile_data(self, trace_location: float, raster_width: float):
-        """Get a rasterized profile at a certain location on the trace.
-
-        Parameters
-        ----------
-        trace_location :
-            Location on the trace
-        raster_width :
-            Raster width
-
-        """
-        relative_location = trace_location / self._trace.length
-        profile_location = relative_location * self._profile.max_location
-        profile = self._profile.local_profile(profile_location)
-        return self._profile_raster_data_3d(profile, raster_width)
-
     @UREG.wraps(_DEFAULT_LEN_UNIT, (None, _DEFAULT_LEN_UNIT), strict=True)
     def _rasterize_trace(self, raster_width: pint.Quantity) -> pint.Quantity:
         """Rasterize the trace.
@@ -2349,6 +3539,40 @@ class Geometry:
             coords = coords.m
         return local_data + coords
 
+    @staticmethod
+    def _sweep_profile_data(
+        profile_raster_data: np.ndarray,
+        orientations: np.ndarray,
+        coordinates: np.ndarray,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
+        """Transform a profiles data to multiple locations on the trace at once.
+
+        Parameters
+        ----------
+        profile_raster_data :
+            Rasterized 3d profile with shape (3, M). Alternatively, an individual
+            profile for each trace location can be passed with shape (N, 3, M).
+        orientations :
+            Orientations of the trace locations with shape (N, 3, 3)
+        coordinates :
+            Coordinates of the trace locations with shape (N, 3)
+        out :
+            Optional preallocated output array with shape (N, 3, M)
+
+        Returns
+        -------
+        numpy.ndarray
+            Transformed profile data with shape (N, 3, M)
+
+        """
+        if out is None:
+            out = np.empty((len(orientations), 3, profile_raster_data.shape[-1]))
+        subscripts = "nij,jm->nim" if profile_raster_data.ndim == 2 else "nij,njm->nim"
+        np.einsum(subscripts, orientations, profile_raster_data, out=out)
+        out += coordinates[:, :, np.newaxis]
+        return out
+
     @staticmethod
     def _profile_raster_data_3d(profile: Profile, raster_width, stack: bool = True):
         """Get the rasterized profile in 3d.
@@ -2396,38 +3620,90 @@ class Geometry:
 
         """
         locations = self._rasterize_trace(trace_raster_width)
+        orientations, coordinates = self._trace.local_coordinate_system_data(locations)
+        coordinates = coordinates.m
+
+        profile_data = self._profile_raster_data_3d(
+            self._profile, profile_raster_width, stack=stack
+        )
 
         if stack:  # old behavior for 3d point cloud
-            profile_data = self._profile_raster_data_3d(
-                self._profile, profile_raster_width, stack=True
+            profile_data = profile_data.m
+            raster_data = np.empty((3, len(locations), profile_data.shape[1]))
+            self._sweep_profile_data(
+                profile_data, orientations, coordinates, raster_data.transpose(1, 0, 2)
             )
-            raster_data = np.empty([3, 0])
-            for _, location in enumerate(locations):
-                local_data = self._get_transformed_profile_data(
-                    profile_data.m, location
-                )
-                raster_data = np.hstack([raster_data, local_data])
-            raster_data = Q_(raster_data, _DEFAULT_LEN_UNIT)
-        else:
-            profile_data = self._profile_raster_data_3d(
-                self._profile, profile_raster_width, stack=False
+            return Q_(raster_data.reshape(3, -1), _DEFAULT_LEN_UNIT)
+
+        return [
+            self._sweep_profile_data(data.m, orientations, coordinates)
+            for data in profile_data
+        ]
+
+    def _supports_raster_interpolation(self) -> bool:
+        """Return `True` if the raster data of the key profiles can be interpolated."""
+        profile = self._profile
+        return all(
+            scheme is linear_profile_interpolation_sbs
+            and _sbs_topology_matches(profile.profiles[i], profile.profiles[i + 1])
+            for i, scheme in enumerate(profile.interpolation_schemes)
+        )
+
+    def _interpolate_profile_raster_data(
+        self, profile_raster_width, profile_locations, orientations, coordinates
+    ) -> np.ndarray:
+        """Rasterize a variable profile by interpolating the key profile raster data.
+
+        Parameters
+        ----------
+        profile_raster_width :
+            Raster width of the profiles
+        profile_locations :
+            Locations on the variable profile in the default length unit
+        orientations :
+            Orientations of the corresponding trace locations with shape (N, 3, 3)
+        coordinates :
+            Coordinates of the corresponding trace locations with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Raster data
+
+        """
+        key_locations = self._profile.locations.m
+        profile_locations = np.clip(profile_locations, 0, key_locations[-1])
+        idx = self._profile._segment_index(profile_locations)
+        weights = (profile_locations - key_locations[idx]) / (
+            key_locations[idx + 1] - key_locations[idx]
+        )
+
+        raster_data = []
+        for i in np.unique(idx):
+            mask = idx == i
+            data_a, data_b = _rasterize_sbs_pair(
+                self._profile.profiles[i],
+                self._profile.profiles[i + 1],
+                Q_(profile_raster_width),
             )
+            w = weights[mask][:, np.newaxis, np.newaxis]
+            local_data = np.insert((1 - w) * data_a + w * data_b, 0, 0, axis=1)
 
-            raster_data = []
-            for data in profile_data:
-                raster_data.append(
-                    np.stack(
-                        [
-                            self._get_transformed_profile_data(data.m, location)
-                            for location in locations
-                        ],
-                        0,
-                    )
-                )
+            data = np.empty((3, np.count_nonzero(mask), local_data.shape[-1]))
+            self._sweep_profile_data(
+                local_data, orientations[mask], coordinates[mask], data.swapaxes(0, 1)
+            )
+            raster_data.append(data.reshape(3, -1))
 
-        return raster_data
+        return np.hstack(raster_data)
 
-    def _rasterize_variable_profile(self, profile_raster_width, trace_raster_width):
+    def _rasterize_variable_profile(
+        self,
+        profile_raster_width,
+        trace_raster_width,
+        interpolate_raster: bool = False,
+        num_workers: int = None,
+    ):
         """Rasterize the geometry with a variable profile.
 
         Parameters
@@ -2436,6 +3712,12 @@ class Geometry:
             Raster width of the profiles
         trace_raster_width :
             Distance between two profiles
+        interpolate_raster :
+            If `True`, the key profiles are rasterized only once and their raster data
+            is interpolated. See ``rasterize`` for further details.
+        num_workers :
+            Number of worker processes that compute the local profiles. If `None`,
+            no process pool is used.
 
         Returns
         -------
@@ -2443,15 +3725,70 @@ class Geometry:
             Raster data
 
         """
-        locations = self._rasterize_trace(trace_raster_width)
-        raster_data = np.empty([3, 0])
-        for _, location in enumerate(locations):
-            profile_data = self._get_local_profile_data(location, profile_raster_width)
+        return self._rasterize_variable_profile_at(
+            profile_raster_width,
+            self._rasterize_trace(trace_raster_width),
+            interpolate_raster=interpolate_raster,
+            num_workers=num_workers,
+        )
+
+    def _rasterize_variable_profile_at(
+        self,
+        profile_raster_width,
+        locations,
+        interpolate_raster: bool = False,
+        num_workers: int = None,
+    ):
+        """Rasterize the geometry with a variable profile at the given trace locations.
+
+        Parameters
+        ----------
+        profile_raster_width :
+            Raster width of the profiles
+        locations :
+            Locations on the trace
+        interpolate_raster :
+            If `True`, the key profiles are rasterized only once and their raster data
+            is interpolated. See ``rasterize`` for further details.
+        num_workers :
+            Number of worker processes that compute the local profiles. If `None`,
+            no process pool is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Raster data
+
+        """
+        orientations, coordinates = self._trace.local_coordinate_system_data(locations)
+        coordinates = coordinates.m
 
-            local_data = self._get_transformed_profile_data(profile_data.m, location)
-            raster_data = np.hstack([raster_data, local_data])
+        relative_locations = (locations / self._trace.length).to("").m
+        profile_locations = relative_locations * self._profile.max_location
 
-        return raster_data
+        if interpolate_raster and self._supports_raster_interpolation():
+            return self._interpolate_profile_raster_data(
+                profile_raster_width, profile_locations.m, orientations, coordinates
+            )
+
+        args = (repeat(self._profile), profile_locations, repeat(profile_raster_width))
+        if num_workers is None:
+            profile_data = list(map(_rasterize_local_profile, *args))
+        else:
+            chunksize = max(1, len(locations) // (4 * num_workers))
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                profile_data = list(
+                    executor.map(_rasterize_local_profile, *args, chunksize=chunksize)
+                )
+
+        return np.hstack(
+            [
+                self._sweep_profile_data(
+                    data, orientations[i : i + 1], coordinates[i : i + 1]
+                )[0]
+                for i, data in enumerate(profile_data)
+            ]
+        )
 
     @property
     def profile(self) -> Profile | VariableProfile:
@@ -2475,12 +3812,14 @@ class Geometry:
         """
         return self._trace
 
-    @UREG.check(None, "[length]", "[length]", None)
+    @UREG.check(None, "[length]", "[length]", None, None, None)
     def rasterize(
         self,
         profile_raster_width: pint.Quantity,
         trace_raster_width: pint.Quantity,
         stack: bool = True,
+        interpolate_raster: bool = False,
+        num_workers: int = None,
     ) -> pint.Quantity:
         """Rasterize the geometry.
 
@@ -2492,6 +3831,20 @@ class Geometry:
             Distance between two profiles
         stack :
             hstack data into a single output array (default = True)
+        interpolate_raster :
+            [only `VariableProfile`] If `True`, each key profile is rasterized only
+            once and the raster points are interpolated linearly instead of
+            rasterizing an interpolated profile at each trace location. This requires
+            that all interpolation schemes are `linear_profile_interpolation_sbs` and
+            that the segments of neighboring profiles match. Otherwise, this option has
+            no effect. The number of raster points of each segment is determined by the
+            key profile that needs more points, so that it does not change between two
+            key profiles. (default = False)
+        num_workers :
+            [only `VariableProfile`] Number of worker processes that are used to
+            compute the local profiles. The profiles need to be pickleable. If `None`,
+            all profiles are computed in the current process. This option has no
+            effect if the raster data is interpolated. (default = None)
 
         Returns
         -------
@@ -2504,7 +3857,12 @@ class Geometry:
                 profile_raster_width, trace_raster_width, stack=stack
             )
         return Q_(
-            self._rasterize_variable_profile(profile_raster_width, trace_raster_width),
+            self._rasterize_variable_profile(
+                profile_raster_width,
+                trace_raster_width,
+                interpolate_raster=interpolate_raster,
+                num_workers=num_workers,
+            ),
             _DEFAULT_LEN_UNIT,
         )
 
@@ -2612,12 +3970,93 @@ class Geometry:
 
         return SpatialData.from_geometry_raster(rasterization, closed_mesh)
 
-    @UREG.check(None, None, "[length]", "[length]")
+    @UREG.check(None, "[length]", "[length]", None, None)
+    def spatial_data_chunks(
+        self,
+        profile_raster_width: pint.Quantity,
+        trace_raster_width: pint.Quantity,
+        chunk_size: int = 1000,
+        closed_mesh: bool = True,
+    ) -> Iterator[SpatialData]:
+        """Rasterize the geometry piecewise and yield the pieces as `SpatialData`.
+
+        Each chunk covers a consecutive range of at most ``chunk_size`` profile
+        locations on the trace. Consecutive chunks share their boundary profile, so
+        that the triangulated pieces stitch together without gaps. Only a single
+        chunk is kept in memory at once, which makes it possible to triangulate long
+        geometries with a fine resolution.
+
+        Parameters
+        ----------
+        profile_raster_width :
+            Target distance between the individual points of a profile
+        trace_raster_width :
+            Target distance between the individual profiles on the trace
+        chunk_size :
+            Maximal number of profile locations per chunk. Must be at least 2.
+        closed_mesh :
+            If `True`, the front face of the first and the back face of the last
+            chunk are closed
+
+        Yields
+        ------
+        SpatialData :
+            The triangulated data of the current chunk. If a
+            `weldx.geometry.VariableProfile` is used, the chunks contain only the raster
+            points like the data returned by `Geometry.spatial_data` and consecutive
+            chunks don't share profiles.
+
+        Raises
+        ------
+        ValueError
+            If ``chunk_size`` is smaller than 2
+
+        """
+        if chunk_size < 2:
+            raise ValueError("'chunk_size' must be at least 2.")
+
+        locations = self._rasterize_trace(trace_raster_width)
+        if isinstance(self._profile, VariableProfile):
+            for start in range(0, len(locations), chunk_size):
+                rasterization = self._rasterize_variable_profile_at(
+                    profile_raster_width, locations[start : start + chunk_size]
+                )
+                yield SpatialData(Q_(rasterization.T, _DEFAULT_LEN_UNIT))
+            return
+
+        profile_data = [
+            data.m
+            for data in self._profile_raster_data_3d(
+                self._profile, profile_raster_width, stack=False
+            )
+        ]
+
+        num_locations = len(locations)
+        for start in range(0, num_locations - 1, chunk_size - 1):
+            stop = min(start + chunk_size, num_locations)
+            orientations, coordinates = self._trace.local_coordinate_system_data(
+                locations[start:stop]
+            )
+            raster_data = [
+                Q_(
+                    self._sweep_profile_data(data, orientations, coordinates.m),
+                    _DEFAULT_LEN_UNIT,
+                )
+                for data in profile_data
+            ]
+            yield SpatialData.from_geometry_raster(
+                raster_data,
+                closed_mesh=closed_mesh and start == 0,
+                close_back=closed_mesh and stop == num_locations,
+            )
+
+    @UREG.check(None, None, "[length]", "[length]", None)
     def to_file(
         self,
         file_name: str,
         profile_raster_width: pint.Quantity,
         trace_raster_width: pint.Quantity,
+        chunk_size: int = None,
     ):
         """Write the ``Geometry`` data into a CAD file.
 
@@ -2635,17 +4074,29 @@ class Geometry:
             Target distance between the individual points of a profile
         trace_raster_width :
             Target distance between the individual profiles on the trace
+        chunk_size :
+            If not `None`, the geometry is triangulated in chunks with the given
+            number of profile locations using `Geometry.spatial_data_chunks` and
+            streamed into the file with `SpatialData.chunks_to_file`. This keeps the
+            memory consumption bounded but only supports binary ``.stl`` files.
 
         """
         if isinstance(self._profile, VariableProfile):
             raise NotImplementedError
 
+        if chunk_size is not None:
+            chunks = self.spatial_data_chunks(
+                profile_raster_width, trace_raster_width, chunk_size
+            )
+            SpatialData.chunks_to_file(chunks, file_name)
+            return
+
         raster_data = self._rasterize_constant_profile(
             profile_raster_width=profile_raster_width,
             trace_raster_width=trace_raster_width,
             stack=False,
         )
-        raster_data = raster_data * _DEFAULT_LEN_UNIT
+        raster_data = [Q_(r, _DEFAULT_LEN_UNIT) for r in raster_data]
 
         SpatialData.from_geometry_raster(raster_data, True).to_file(file_name)
 
@@ -2722,67 +4173,55 @@ class SpatialData:
 
         return SpatialData(Q_(mesh.points, units), triangles)
 
-    @staticmethod
-    def _shape_raster_points(
-        shape_raster_data: np.ndarray | pint.Quantity,
-    ) -> list[list[int]]:
-        """Extract all points from a shapes raster data."""
-        if isinstance(shape_raster_data, Q_):
-            shape_raster_data = shape_raster_data.m
-        return shape_raster_data.reshape(
-            (shape_raster_data.shape[0] * shape_raster_data.shape[1], 3)
-        ).tolist()
-
     @staticmethod
     def _shape_profile_triangles(
         num_profiles: int, num_profile_points: int, offset: int, cw_ordering: bool
-    ) -> list[list[int]]:
+    ) -> np.ndarray:
         """Create the profile main surface triangles for ``_shape_triangles``."""
-        tri_base = []
-        for i in range(num_profile_points):
-            idx_0 = i
-            idx_1 = (i + 1) % num_profile_points
-            idx_2 = idx_0 + num_profile_points
-            idx_3 = idx_1 + num_profile_points
-
-            if cw_ordering:
-                tri_base += [[idx_0, idx_2, idx_1], [idx_1, idx_2, idx_3]]
-            else:
-                tri_base += [[idx_0, idx_1, idx_2], [idx_1, idx_3, idx_2]]
-        tri_base = np.array(tri_base, dtype=int)
+        idx_0 = np.arange(num_profile_points)
+        idx_1 = (idx_0 + 1) % num_profile_points
+        idx_2 = idx_0 + num_profile_points
+        idx_3 = idx_1 + num_profile_points
 
-        triangles = np.array(
-            [
-                tri_base + i * num_profile_points + offset
-                for i in range(num_profiles - 1)
-            ],
-            dtype=int,
-        )
+        if cw_ordering:
+            tri_base = [[idx_0, idx_2, idx_1], [idx_1, idx_2, idx_3]]
+        else:
+            tri_base = [[idx_0, idx_1, idx_2], [idx_1, idx_3, idx_2]]
+        # shape: (num_profile_points * 2, 3)
+        tri_base = np.array(tri_base).transpose(2, 0, 1).reshape(-1, 3)
 
-        return triangles.reshape((tri_base.shape[0] * (num_profiles - 1), 3)).tolist()
+        profile_offsets = np.arange(num_profiles - 1) * num_profile_points + offset
+        triangles = tri_base[np.newaxis] + profile_offsets[:, np.newaxis, np.newaxis]
+        return triangles.reshape(-1, 3)
 
     @staticmethod
     def _shape_front_back_triangles(
-        num_profiles: int, num_profile_points: int, offset: int, cw_ordering: bool
-    ) -> list[list[int]]:
-        """Create the front and back surface triangles for ``_shape_triangles``."""
-        tri_cw = []
-        tri_ccw = []
-        i_0 = 0
-        i_1 = 0
-
-        while i_0 + i_1 < num_profile_points - 2:
-            p_0 = i_0 + offset
-            if i_1 == i_0:
-                p_1 = p_0 + 1
-                p_2 = num_profile_points + offset - i_1 - 1
-                i_0 += 1
-            else:
-                p_1 = num_profile_points + offset - i_1 - 2
-                p_2 = p_1 + 1
-                i_1 += 1
-            tri_cw += [[p_0, p_1, p_2]]
-            tri_ccw += [[p_0, p_2, p_1]]
+        num_profiles: int,
+        num_profile_points: int,
+        offset: int,
+        cw_ordering: bool,
+        close_front: bool = True,
+        close_back: bool = True,
+    ) -> np.ndarray:
+        """Create the front and back surface triangles for ``_shape_triangles``.
+
+        The triangles form a zigzag pattern between both ends of the profile points.
+        The n-th triangle with ``k = n // 2`` connects the points
+        ``[k, k + 1, num_profile_points - k - 1]`` if n is even and
+        ``[k + 1, num_profile_points - k - 2, num_profile_points - k - 1]`` if n is
+        odd. The front or back surface can be omitted with ``close_front`` and
+        ``close_back``.
+        """
+        n = np.arange(max(num_profile_points - 2, 0))
+        k = n // 2
+        is_even = n % 2 == 0
+
+        p_0 = np.where(is_even, k, k + 1)
+        p_1 = np.where(is_even, k + 1, num_profile_points - k - 2)
+        p_2 = num_profile_points - k - 1
+
+        tri_cw = np.stack([p_0, p_1, p_2], axis=-1) + offset
+        tri_ccw = tri_cw[:, [0, 2, 1]]
 
         if cw_ordering:
             front = tri_cw
@@ -2790,15 +4229,23 @@ class SpatialData:
         else:
             front = tri_ccw
             back = tri_cw
-        return [
-            *front,
-            *(np.array(back, int) + (num_profiles - 1) * num_profile_points).tolist(),
-        ]
+        back = back + (num_profiles - 1) * num_profile_points
+
+        triangles = [front] if close_front else []
+        if close_back:
+            triangles.append(back)
+        if not triangles:
+            return np.empty((0, 3), dtype=tri_cw.dtype)
+        return np.vstack(triangles)
 
     @classmethod
     def _shape_triangles(
-        cls, shape_raster_data: np.ndarray, offset: int, closed_mesh: bool
-    ) -> list[list[int]]:
+        cls,
+        shape_raster_data: np.ndarray,
+        offset: int,
+        closed_mesh: bool,
+        close_back: bool = None,
+    ) -> np.ndarray:
         """Get the triangles of a shape from its raster data.
 
         The triangle data are just indices referring to a list of points.
@@ -2812,26 +4259,40 @@ class SpatialData:
         closed_mesh :
             If `True`, the front and back faces of the geometry will also be
             triangulated.
+        close_back :
+            If not `None`, ``closed_mesh`` only refers to the front face and this
+            parameter decides if the back face is triangulated.
 
         Returns
         -------
-        List[List[int]] :
-            The list of triangles
+        numpy.ndarray :
+            The triangles as array with shape (M, 3)
 
         """
+        close_front = closed_mesh
+        if close_back is None:
+            close_back = closed_mesh
+
         n_prf = shape_raster_data.shape[0]
         n_prf_pts = shape_raster_data.shape[1]
         cw_ord = has_cw_ordering(shape_raster_data[0])
-        if not closed_mesh:
+        if not (close_front or close_back):
             return cls._shape_profile_triangles(n_prf, n_prf_pts, offset, cw_ord)
-        return [
-            *cls._shape_profile_triangles(n_prf, n_prf_pts, offset, cw_ord),
-            *cls._shape_front_back_triangles(n_prf, n_prf_pts, offset, cw_ord),
-        ]
+        return np.vstack(
+            [
+                cls._shape_profile_triangles(n_prf, n_prf_pts, offset, cw_ord),
+                cls._shape_front_back_triangles(
+                    n_prf, n_prf_pts, offset, cw_ord, close_front, close_back
+                ),
+            ]
+        )
 
     @classmethod
     def from_geometry_raster(
-        cls, geometry_raster: np.ndarray, closed_mesh: bool = True
+        cls,
+        geometry_raster: np.ndarray,
+        closed_mesh: bool = True,
+        close_back: bool = None,
     ) -> SpatialData:
         """Triangulate rasterized Geometry Profile.
 
@@ -2841,6 +4302,11 @@ class SpatialData:
             A single unstacked geometry rasterization.
         closed_mesh :
             If `True`, the surface of the 3d geometry will be closed
+        close_back :
+            If not `None`, ``closed_mesh`` only refers to the front face of the
+            geometry and this parameter decides if the back face is closed. This is
+            used to triangulate the individual chunks of
+            `Geometry.spatial_data_chunks`.
 
         Returns
         -------
@@ -2849,12 +4315,26 @@ class SpatialData:
 
         """
         units = None if not isinstance(geometry_raster[0], Q_) else geometry_raster[0].u
-        points = []
+        if units:
+            geometry_raster = [shape_data.to(units).m for shape_data in geometry_raster]
+
+        num_points = sum(shape_data[:, 0].size for shape_data in geometry_raster)
+        points = np.empty((num_points, 3))
         triangles = []
+
+        offset = 0
         for shape_data in geometry_raster:
             shape_data = shape_data.swapaxes(1, 2)
-            triangles += cls._shape_triangles(shape_data, len(points), closed_mesh)
-            points += cls._shape_raster_points(shape_data)
+            num_shape_points = shape_data.shape[0] * shape_data.shape[1]
+            triangles.append(
+                cls._shape_triangles(shape_data, offset, closed_mesh, close_back)
+            )
+            shape_points = points[offset : offset + num_shape_points]
+            shape_points.reshape(shape_data.shape)[:] = shape_data
+            offset += num_shape_points
+
+        dtype = "uint32" if num_points <= np.iinfo("uint32").max else "uint64"
+        triangles = np.vstack(triangles).astype(dtype)
 
         if units:
             points = Q_(points, units)
@@ -2966,6 +4446,75 @@ class SpatialData:
         )
         mesh.write(file_name)
 
+    @staticmethod
+    def chunks_to_file(
+        chunks: Iterable[SpatialData], file_name: str | Path, units: str = "mm"
+    ):
+        """Stream multiple pieces of triangulated spatial data into a single file.
+
+        The chunks are written one after another as binary STL, so only a single
+        chunk has to be kept in memory. Combined with
+        `Geometry.spatial_data_chunks`, this allows exporting large geometries. The
+        data is written into a temporary file next to the target file, which replaces
+        the target file once all chunks are written. If a chunk can't be written, the
+        temporary file is removed and an existing target file is left untouched.
+
+        Parameters
+        ----------
+        chunks :
+            Iterable of triangulated `SpatialData` instances that are not time
+            dependent
+        file_name :
+            Name of the file. Only the ``.stl`` format is supported.
+        units :
+            Conversion target for length unit before export.
+
+        """
+        file_name = Path(file_name)
+        if file_name.suffix.lower() != ".stl":
+            raise ValueError("Chunked export only supports the '.stl' file format.")
+
+        stl_dtype = np.dtype(
+            [
+                ("normal", "<f4", (3,)),
+                ("points", "<f4", (3, 3)),
+                ("attr", "<u2"),
+            ]
+        )
+
+        num_triangles = 0
+        tmp_file_name = file_name.with_name(f"{file_name.name}.part")
+        try:
+            with open(tmp_file_name, "wb") as file:
+                file.write(b"weldx chunked export".ljust(80, b"\0"))
+                file.write(np.uint32(0).tobytes())
+                for chunk in chunks:
+                    if chunk.triangles is None or chunk.is_time_dependent:
+                        raise ValueError(
+                            "Chunks must be triangulated and not time dependent."
+                        )
+                    points = chunk.coordinates.data.to(units).m
+                    triangle_points = points[chunk.triangles]
+                    normals = np.cross(
+                        triangle_points[:, 1] - triangle_points[:, 0],
+                        triangle_points[:, 2] - triangle_points[:, 0],
+                    )
+                    lengths = np.linalg.norm(normals, axis=-1, keepdims=True)
+                    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+                    records = np.zeros(len(triangle_points), dtype=stl_dtype)
+                    records["normal"] = normals
+                    records["points"] = triangle_points
+                    file.write(records.tobytes())
+                    num_triangles += len(records)
+
+                file.seek(80)
+                file.write(np.uint32(num_triangles).tobytes())
+            os.replace(tmp_file_name, file_name)
+        except BaseException:
+            tmp_file_name.unlink(missing_ok=True)
+            raise
+
     @property
     def is_time_dependent(self) -> bool:
         """Return `True` if the coordinates are time dependent."""
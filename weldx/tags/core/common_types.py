@@ -14,6 +14,7 @@ from pandas.api.types import is_timedelta64_dtype as is_timedelta
 from weldx.asdf.types import WeldxConverter
 from weldx.asdf.util import _get_instance_shape, dataclass_serialization_class
 from weldx.constants import Q_
+from weldx.util.util import _is_dask_array
 
 
 # Dimension ----------------------------------------------------------------------------
@@ -86,6 +87,8 @@ class VariableConverter(WeldxConverter):
         else:
             unit = None
             data = obj.data
+        if _is_dask_array(data):  # asdf can only store loaded arrays
+            data = np.asarray(data)
         dtype = obj.data.dtype.str
         data = self.convert_time_dtypes(data=data)
         if not data.shape:  # scalar
@@ -1,6 +1,5 @@
 import warnings
 
-import sympy
 from xarray import DataArray
 
 from weldx.asdf.types import WeldxConverter
@@ -43,6 +42,4 @@ class MathematicalExpressionConverter(WeldxConverter):
                 v = (v, dims)
             parameters[k] = v
 
-        return MathematicalExpression(
-            sympy.sympify(node["expression"]), parameters=parameters
-        )
+        return MathematicalExpression(node["expression"], parameters=parameters)
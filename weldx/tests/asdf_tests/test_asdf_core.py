@@ -241,6 +241,24 @@ def test_local_coordinate_system(
         assert data["lcs"] == lcs
 
 
+def test_local_coordinate_system_dask():
+    """Test writing a LocalCoordinateSystem with dask backed data to ASDF."""
+    da = pytest.importorskip("dask.array")
+
+    angles = np.array([[0], [90], [180], [270]])
+    orientation = WXRotation.from_euler("z", angles, degrees=True).as_matrix()
+    coords = Q_(np.arange(12, dtype=float).reshape(4, 3), "mm")
+    time = pd.DatetimeIndex(["2000-01-01", "2000-01-02", "2000-01-03", "2000-01-04"])
+    lcs = tf.LocalCoordinateSystem(orientation, coords, time)
+    lcs_dask = tf.LocalCoordinateSystem(
+        da.from_array(orientation, chunks=2),
+        Q_(da.from_array(coords.m, chunks=2), "mm"),
+        time,
+    )
+    with write_read_buffer_context({"lcs": lcs_dask}) as data:
+        assert data["lcs"] == lcs
+
+
 @pytest.mark.parametrize("memmap", [True, False])
 @pytest.mark.parametrize("lazy_load", [True, False])
 @pytest.mark.parametrize("has_ref_time", [True, False])
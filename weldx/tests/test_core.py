@@ -200,6 +200,139 @@ class TestMathematicalExpression:
         with pytest.raises(exception_type):
             ma_def.evaluate(**variables)
 
+    # test_compilation_cache -----------------------------------------------------------
+
+    @staticmethod
+    def test_compilation_cache():
+        """Test that compiled functions are shared between instances and copies."""
+        from copy import deepcopy
+
+        expr = MathematicalExpression("a*t + b", dict(a=Q_(1, "m/s"), b=Q_(2, "m")))
+        other = MathematicalExpression("a*t + b")
+        copied = deepcopy(expr)
+
+        assert other.function is expr.function
+        assert copied.function is expr.function
+        assert copied == expr
+
+        copied.set_parameter("b", Q_(3, "m"))
+        assert expr.parameters["b"] == Q_(2, "m")
+
+    # test_backends --------------------------------------------------------------------
+
+    @staticmethod
+    @pytest.mark.parametrize("backend", ["numpy", "numexpr", "numba"])
+    @pytest.mark.parametrize(
+        "expression, parameters, variables",
+        [
+            ("a*t + b", dict(a=Q_(2, "mm/s"), b=Q_(1, "m")), dict(t=Q_([0, 1], "s"))),
+            (
+                "a*sin(o*t + p) + b",
+                dict(a=Q_(2, "A"), o=Q_(10, "rad/s"), p=Q_(1, "rad"), b=Q_(3, "A")),
+                dict(t=Q_([0, 1, 2], "ms")),
+            ),
+            (
+                "a*x**2 + b",
+                dict(a=(Q_([1, 2], "1/mm"), "c"), b=(Q_([1, 2], "m"), "c")),
+                dict(x=xr.DataArray(Q_([0, 1, 2], "cm"), dims=["s"])),
+            ),
+        ],
+    )
+    def test_backends(backend, expression, parameters, variables):
+        """Test the unit-free evaluation backends against the pint evaluation."""
+        if backend != "numpy":
+            pytest.importorskip(backend)
+        exp = MathematicalExpression(expression, parameters).evaluate(**variables)
+        result = MathematicalExpression(expression, parameters, backend=backend)
+        result = result.evaluate(**variables)
+
+        assert result.data.u == exp.data.u
+        xr.testing.assert_allclose(result.pint.dequantify(), exp.pint.dequantify())
+
+    # test_evaluation_plan -------------------------------------------------------------
+
+    @staticmethod
+    def test_evaluation_plan():
+        """Test the reuse and invalidation of the unit-free evaluation plans."""
+        expr = MathematicalExpression("a*t + b", dict(a=Q_(2, "mm/s"), b=Q_(1, "m")))
+
+        result = expr.evaluate(t=Q_([0, 1], "s"))
+        assert result.data.u == U_("mm")
+        assert np.allclose(result.data.m, [1000, 1002])
+        assert len(expr._evaluation_plans) == 1
+
+        expr.evaluate(t=Q_([1, 2], "ms"))
+        expr.evaluate(t=Q_([1, 2], "s"))
+        assert len(expr._evaluation_plans) == 2
+
+        expr.set_parameter("b", Q_(1, "mm"))
+        assert len(expr._evaluation_plans) == 0
+        assert np.allclose(expr.evaluate(t=Q_(1, "s")).data, Q_(3, "mm"))
+
+    @staticmethod
+    def test_evaluation_plan_parameters():
+        """Test that plans are only invalidated by valid parameter changes."""
+        expr = MathematicalExpression("a + t", dict(a=Q_(2, "m")))
+
+        # integers stay integers if no unit conversion is required
+        result = expr.evaluate(t=Q_(np.array([1, 2]), "m"))
+        assert result.data.m.dtype == np.int64
+        assert np.all(result.data == Q_([3, 4], "m"))
+
+        with pytest.raises(ValueError):
+            expr.set_parameters({"a": Q_(1, "m"), "b": Q_(1, "m")})
+        assert len(expr._evaluation_plans) == 1
+        assert expr.parameters["a"] == Q_(2, "m")
+
+        # the returned parameters are a copy
+        expr.parameters["a"] = Q_(5, "m")
+        assert np.all(expr.evaluate(t=Q_(np.array([1, 2]), "m")).data.m == [3, 4])
+
+    @staticmethod
+    def test_evaluation_plan_unit_depends_on_values():
+        """Test that expressions whose unit depends on the values use pint."""
+        expr = MathematicalExpression("a**b", dict(a=Q_(2, "m")))
+
+        assert expr.evaluate(b=1).data == Q_(2, "m")
+        with pytest.raises(pint.DimensionalityError):
+            expr.evaluate(b=np.array([1, 2]))
+
+    @staticmethod
+    def test_backend_auto_selection(monkeypatch):
+        """Test the size based backend selection and the evaluation errors."""
+        from weldx.core import math_expression
+
+        lambdify = math_expression._lambdify
+
+        def _lambdify(expression, backend="numpy"):
+            if backend == "numexpr":
+
+                def _function(*args):
+                    raise RuntimeError("evaluation failed")
+
+                return _function
+            return lambdify(expression, backend)
+
+        expr = MathematicalExpression("a*t", dict(a=Q_(2, "m/s")))
+        assert expr.backend == "auto"
+
+        small = xr.Variable("t", np.ones(10))
+        large = xr.Variable("t", np.ones(math_expression._AUTO_BACKEND_MIN_SIZE))
+        assert expr._select_backend([small]) == "numpy"
+        assert expr._select_backend([large]) in ("numpy", "numexpr", "numba")
+
+        monkeypatch.setattr(math_expression, "_lambdify", _lambdify)
+        assert expr._select_backend([large]) == "numexpr"
+        assert np.all(expr.evaluate(t=Q_(np.ones(10), "s")).data == Q_(2, "m"))
+        with pytest.raises(RuntimeError, match="evaluation failed"):
+            expr.evaluate(t=Q_(large.data, "s"))
+
+    @staticmethod
+    def test_backend_exceptions():
+        """Test the exceptions related to the backend selection."""
+        with pytest.raises(ValueError):
+            MathematicalExpression("a*b", backend="fortran")
+
     @staticmethod
     @pytest.mark.slow
     def test_integrate_length_computation():
@@ -502,6 +635,38 @@ class TestTimeSeries:
         else:
             assert result.time.all_close(time)
 
+    # test_interp_time_blocks ----------------------------------------------------------
+
+    @staticmethod
+    @pytest.mark.parametrize("interpolation", ["step", "linear"])
+    def test_interp_time_blocks(interpolation):
+        """Test the blockwise interpolation of discrete values."""
+        from weldx.core.time_series import _interp_sorted
+
+        values = Q_(np.arange(20).reshape(10, 2) ** 2, "mm")
+        ts = TimeSeries(values, Q_(np.arange(10), "s"), interpolation=interpolation)
+        time = Time(Q_(np.linspace(-2, 12, 57), "s"))
+
+        t = np.clip(np.linspace(-2, 12, 57), 0, 9)
+        if interpolation == "step":
+            t = np.floor(t)
+        exp = np.stack([np.interp(t, np.arange(10), v) for v in values.m.T], axis=1)
+        exp = Q_(exp, "mm")
+
+        result = ts.interp_time(time)
+        assert np.allclose(result.data, exp)
+
+        time_ns, magnitudes = ts._get_time_index()
+        time_interp = time.as_timedelta_index().values.astype("timedelta64[ns]")
+        time_interp = time_interp.view(np.int64)
+        blocks = _interp_sorted(time_ns, magnitudes, time_interp, interpolation, 5)
+        assert np.allclose(blocks, exp.m)
+
+        blocks = (time[i : i + 10] for i in range(0, len(time), 10))
+        results = list(ts.interp_time_blocks(blocks))
+        assert len(results) == 6
+        assert np.allclose(np.concatenate([r.data for r in results]), exp)
+
     # test_interp_time_warning ---------------------------------------------------------
 
     @staticmethod
@@ -1135,6 +1135,114 @@ def arc_segment_transformation_test_case(
     check_segments_identical(segment_ccw, segment_ccw_trans)
 
 
+@pytest.mark.parametrize(
+    "segment",
+    [
+        geo.LineSegment(Q_([[-1, 3], [2, -4]], "mm")),
+        geo.LineSegment(Q_([[0.1, 0.1], [0.2, 0.5]], "m")),
+        geo.ArcSegment(Q_([[3, 1, 1], [4, 6, 4]], "mm")),
+        geo.ArcSegment(Q_([[3, 1, 1], [4, 6, 4]], "mm"), False),
+        geo.ArcSegment(Q_([[1, 3, 3], [2, 4, 2]], "cm"), False),
+        geo.ArcSegment(Q_([[-1, 0, 0], [0, -1, 0]], "mm")).translate(Q_([1, 2], "mm")),
+    ],
+)
+def test_segment_raster_points_closed_form(segment):
+    """Test the closed-form rasterization of line and arc segments.
+
+    The results are compared to the evaluation of the segments `SpatialSeries`.
+
+    Parameters
+    ----------
+    segment :
+        The tested segment
+
+    """
+    num_pts = 17
+    exp = geo.DynamicShapeSegment._get_raster_points(segment, num_pts)
+    raster = segment._get_raster_points(num_pts)
+
+    assert raster.u == exp.u
+    assert np.allclose(raster.m, exp.m)
+    assert np.allclose(segment.point_start.m, exp[:, 0].to("mm").m)
+    assert np.allclose(segment.point_end.m, exp[:, -1].to("mm").m)
+
+
+class ParabolaSegment(geo.DynamicShapeSegment):
+    """Expression based shape segment with a parabolic trajectory."""
+
+    def __init__(self, **kwargs):
+        params = dict(x=Q_([1, 0, 0], "mm"), y=Q_([0, 2, 0], "mm"))
+        super().__init__("x * s + y * s**2", parameters=params, **kwargs)
+
+
+def test_dynamic_segment_length_integration():
+    """Test the symbolic and numeric length integration of expression segments."""
+    seg_sym = ParabolaSegment(length_integration="symbolic")
+    seg_num = ParabolaSegment(length_integration="numeric", length_tolerance=1e-12)
+
+    assert seg_sym._length_expr.is_symbolic
+    assert not seg_num._length_expr.is_symbolic
+    for pos in [0.25, 0.5, 1]:
+        assert np.isclose(
+            seg_sym.get_section_length(pos), seg_num.get_section_length(pos)
+        )
+
+    # array positions
+    pos = np.array([0.25, 0.5, 1])
+    lengths = seg_sym.get_section_length(pos)
+    assert lengths.shape == (3,)
+    assert np.allclose(lengths, [seg_num.get_section_length(p) for p in pos])
+
+    # unsorted and repeated array positions with numerical integration
+    pos = np.array([[1, 0.25], [0.5, 0.25]])
+    lengths = seg_num.get_section_length(pos)
+    assert lengths.shape == (2, 2)
+    assert np.allclose(lengths, seg_sym.get_section_length(pos))
+
+    # memoization is bounded
+    for pos in np.linspace(0.1, 1, 2 * geo._LENGTH_MEMO_SIZE):
+        seg_num.get_section_length(pos)
+    assert len(seg_num._length_expr._values) == geo._LENGTH_MEMO_SIZE
+
+    # identical expressions and parameters share the length integral
+    assert ParabolaSegment()._length_expr is ParabolaSegment()._length_expr
+
+    # translations do not change the integrand
+    seg_trans = seg_num.translate(Q_([1, 2], "mm"))
+    assert seg_trans._length_expr is seg_num._length_expr
+    assert np.isclose(seg_trans.length, seg_num.length)
+
+    with pytest.raises(ValueError):
+        ParabolaSegment(length_integration="magic")
+
+
+@pytest.mark.slow
+def test_dynamic_segment_length_integration_fallback():
+    """Test the numeric fallback if an integral can't be solved symbolically."""
+    params = dict(x=Q_([1, 0, 0], "mm"), y=Q_([0, 1, 0], "mm"))
+    seg = geo.DynamicShapeSegment("x * sin(s) + y * s", parameters=params)
+
+    assert not seg._length_expr.is_symbolic
+    assert np.isclose(seg.length, Q_(1.311442498, "mm"))
+
+    with pytest.raises(ValueError):
+        geo.DynamicShapeSegment(
+            "x * sin(s) + y * s", parameters=params, length_integration="symbolic"
+        )
+
+
+def test_dynamic_segment_length_integration_fallback_evaluation():
+    """Test the numeric fallback if a symbolic primitive can't be evaluated."""
+    params = dict(x=Q_([1, 0, 0], "mm"), y=Q_([0, 1, 0], "mm"))
+    seg = geo.DynamicTraceSegment("x * s + y * s**3", parameters=params)
+    seg_num = geo.DynamicTraceSegment(
+        "x * s + y * s**3", parameters=params, length_integration="numeric"
+    )
+
+    assert not seg._length_expr.is_symbolic
+    assert np.isclose(seg.length, seg_num.length)
+
+
 def test_arc_segment_transformations():
     """Test the arc segments transformation functions."""
     # translation -----------------------------------------
@@ -1595,6 +1703,90 @@ def shape_transformation_test_case(
     check_shapes_identical(shape_trans, shape)
 
 
+@pytest.mark.parametrize("closed", [True, False])
+def test_shape_rasterize_adaptive(closed: bool):
+    """Test the rasterization of a shape with a chordal deviation tolerance.
+
+    Parameters
+    ----------
+    closed :
+        If `True`, the shape is closed with an additional line segment
+
+    """
+    points = Q_([[0, 0], [10, 0], [10, 4], [0, 4]], "mm")
+    arc = geo.ArcSegment.construct_with_points(points[1], points[2], Q_([10, 2], "mm"))
+    shape = geo.Shape(
+        [
+            geo.LineSegment.construct_with_points(points[0], points[1]),
+            arc,
+            geo.LineSegment.construct_with_points(points[2], points[3]),
+        ]
+    )
+    if closed:
+        shape.add_line_segments(points[0])
+
+    tolerance = 0.01
+    data = shape.rasterize_adaptive(Q_(tolerance, "mm")).m
+    num_arc_pts = data.shape[1] - 2 if closed else data.shape[1] - 3
+
+    assert np.allclose(data[:, :2], points[:2].m.T)
+    assert np.allclose(data[:, -1], points[3].m)
+
+    # chordal deviation of the arc
+    arc_data = data[:, 1 : 1 + num_arc_pts]
+    centers = 0.5 * (arc_data[:, :-1] + arc_data[:, 1:])
+    deviation = 2 - np.linalg.norm(centers - np.array([[10], [2]]), axis=0)
+    assert np.all(np.isclose(np.linalg.norm(arc_data.T - [10, 2], axis=1), 2))
+    assert np.all(deviation <= tolerance)
+    assert np.any(deviation > tolerance / 2)
+
+    # profile
+    profile = geo.Profile([shape, shape.translate(Q_([0, 10], "mm"))])
+    raster = profile.rasterize_adaptive(Q_(tolerance, "mm"))
+    assert raster.shape == (2, 2 * data.shape[1])
+
+    levels = profile.rasterize_lod(Q_([1, 0.1, 0.01], "mm"), stack=False)
+    assert len(levels) == 3
+    assert np.allclose(levels[-1][0].m, data)
+    assert levels[0][0].shape[1] < levels[1][0].shape[1] < levels[2][0].shape[1]
+
+
+def test_shape_rasterize_adaptive_refinement_limit():
+    """Test that an unreachable chordal deviation tolerance raises an exception."""
+    params = dict(x=Q_([1, 0, 0], "mm"), y=Q_([0, 1, 0], "mm"))
+    shape = geo.Shape(geo.DynamicShapeSegment("x * s + y * s**2", parameters=params))
+
+    assert shape.rasterize_adaptive(Q_(1e-6, "mm")).shape[1] > 2
+    with pytest.raises(ValueError, match="after 12 refinements"):
+        shape.rasterize_adaptive(Q_(1e-12, "mm"))
+    with pytest.raises(ValueError, match="after 12 refinements"):
+        shape.rasterize_lod(Q_([1e-3, 1e-12], "mm"))
+
+
+def test_shape_rasterize_lod():
+    """Test the rasterization of a shape for multiple levels of detail."""
+    params = dict(x=Q_([1, 0, 0], "mm"), y=Q_([0, 1, 0], "mm"))
+    shape = geo.Shape(
+        [
+            geo.DynamicShapeSegment("x * s + y * s**2", parameters=params),
+            geo.LineSegment.construct_with_points(Q_([1, 1], "mm"), Q_([2, 1], "mm")),
+        ]
+    )
+    tolerances = Q_([0.01, 1, 0.001], "mm")
+    levels = shape.rasterize_lod(tolerances)
+
+    assert len(levels) == 3
+    for level, tolerance in zip(levels, tolerances):
+        assert level.u == Q_(1, "mm").u
+        assert np.allclose(level.m, shape.rasterize_adaptive(tolerance).m)
+
+    # finer levels are refinements of coarser ones
+    assert levels[1].shape[1] < levels[0].shape[1] < levels[2].shape[1]
+    for coarse, fine in [(levels[1], levels[0]), (levels[0], levels[2])]:
+        distance = np.linalg.norm(coarse.m.T[:, np.newaxis] - fine.m.T, axis=-1)
+        assert np.allclose(distance.min(axis=1), 0)
+
+
 def test_shape_transformation():
     """Test the shapes transformation functions.
 
@@ -2337,6 +2529,21 @@ def test_trace_construction():
         geo.Trace(custom_segment)
 
 
+def test_trace_segment_index():
+    """Test the segment lookup of a trace."""
+    segments = [geo.LinearHorizontalTraceSegment(f"{length}mm") for length in [1, 2, 3]]
+    trace = geo.Trace(segments)
+
+    positions = np.array([-1, 0, 0.5, 1, 1.2, 3, 4, 6, 7])
+    exp = [0, 0, 0, 0, 1, 1, 2, 2, 2]
+
+    assert np.array_equal(trace._get_segment_index(positions), exp)
+    for position, idx in zip(positions, exp):
+        assert trace._get_segment_index(position) == idx
+
+    assert repr(Q_([0.0, 1.0, 3.0, 6.0], "mm")) in repr(trace)
+
+
 @pytest.mark.slow
 def test_trace_local_coordinate_system():
     """Test the trace's local coordinate system function.
@@ -2407,6 +2614,123 @@ def test_trace_local_coordinate_system():
         check_coordinate_systems_identical(cs_trace, cs_exp)
 
 
+def test_trace_local_coordinate_system_data():
+    """Test the batched evaluation of the trace's local coordinate systems."""
+    radial_segment = geo.RadialHorizontalTraceSegment("1mm", Q_(np.pi, "rad"))
+    linear_segment = geo.LinearHorizontalTraceSegment("1mm")
+    orientation = WXRotation.from_euler("x", np.pi / 2).as_matrix()
+    cs_base = tf.LocalCoordinateSystem(orientation, Q_([-3, 2.5, 5], "mm"))
+
+    trace = geo.Trace([radial_segment, linear_segment, radial_segment], cs_base)
+    positions = Q_(np.linspace(-1, trace.length.m + 1, 23), "mm")
+    orient, coords = trace.local_coordinate_system_data(positions)
+
+    assert orient.shape == (23, 3, 3)
+    assert coords.shape == (23, 3)
+    for i, position in enumerate(positions):
+        cs_exp = trace.local_coordinate_system(np.clip(position, 0, trace.length))
+        assert np.allclose(orient[i], cs_exp.orientation.data)
+        assert np.allclose(coords[i].m, cs_exp.coordinates.data.m)
+
+    # single position
+    orient, coords = trace.local_coordinate_system_data(Q_(1, "mm"))
+    cs_exp = trace.local_coordinate_system(Q_(1, "mm"))
+    assert np.allclose(orient[0], cs_exp.orientation.data)
+    assert np.allclose(coords[0].m, cs_exp.coordinates.data.m)
+
+
+@pytest.mark.parametrize("clockwise", [True, False])
+def test_trace_project_points(clockwise: bool):
+    """Test the projection of points onto a trace.
+
+    Parameters
+    ----------
+    clockwise :
+        The winding order of the radial segments
+
+    """
+    radial_segment = geo.RadialHorizontalTraceSegment("5mm", "120deg", clockwise)
+    linear_segment = geo.LinearHorizontalTraceSegment("10mm")
+    orientation = WXRotation.from_euler("x", np.pi / 2).as_matrix()
+    cs_base = tf.LocalCoordinateSystem(orientation, Q_([-3, 2.5, 5], "mm"))
+    trace = geo.Trace([linear_segment, radial_segment, linear_segment], cs_base)
+
+    # points with a known offset perpendicular to the trace
+    positions = np.linspace(0, trace.length.m, 31)
+    offsets = np.random.default_rng(0).uniform(-1, 1, (31, 2))
+    orient, coords = trace.local_coordinate_system_data(Q_(positions, "mm"))
+    points = coords.m + np.einsum("nij,nj->ni", orient[:, :, 1:], offsets)
+
+    pos, dist = trace.project_points(Q_(points, "mm"))
+
+    assert np.allclose(pos.m, positions)
+    assert np.allclose(dist.m, np.linalg.norm(offsets, axis=1))
+
+    # points beyond the ends
+    pos, dist = trace.project_points(Q_(coords.m[0] - orient[0, :, 0], "mm"))
+    assert np.allclose(pos.m, 0)
+    assert np.allclose(dist.m, 1)
+
+
+def test_trace_project_points_generic_segment():
+    """Test the polyline projection for segments without an analytic solution."""
+    params = dict(x=Q_([1, 0, 0], "mm"), y=Q_([0, 1, 0], "mm"))
+    segment = geo.DynamicTraceSegment("x * 10 * s + y * s**2", parameters=params)
+    trace = geo.Trace(segment)
+
+    positions = np.linspace(0, trace.length.m, 11)
+    orient, coords = trace.local_coordinate_system_data(Q_(positions, "mm"))
+    points = coords.m + 0.5 * orient[:, :, 2]
+
+    pos, dist = trace.project_points(Q_(points, "mm"), "0.1mm")
+
+    assert np.allclose(pos.m, positions, atol=1e-3)
+    assert np.allclose(dist.m, 0.5, atol=1e-3)
+
+    # the cached indices are shared by equivalent raster widths and bounded
+    trace.project_points(Q_(points, "mm"), "100um")
+    assert len(trace._projection_indices) == 1
+    for raster_width in np.linspace(0.2, 2, 2 * geo._PROJECTION_CACHE_SIZE):
+        trace.project_points(Q_(points, "mm"), Q_(raster_width, "mm"))
+    assert len(trace._projection_indices) == geo._PROJECTION_CACHE_SIZE
+
+
+def test_trace_rasterize_adaptive():
+    """Test the rasterization of a trace with a chordal deviation tolerance."""
+    params = dict(x=Q_([1, 0, 0], "mm"), z=Q_([0, 0, 1], "mm"))
+    trace = geo.Trace(
+        [
+            geo.LinearHorizontalTraceSegment("10mm"),
+            geo.RadialHorizontalTraceSegment("5mm", "90deg"),
+            geo.DynamicTraceSegment("x * 10 * s + z * s**2", parameters=params),
+        ]
+    )
+
+    tolerance = 0.01
+    data = trace.rasterize_adaptive(Q_(tolerance, "mm")).m
+
+    assert np.allclose(data[:, :2].T, [[0, 0, 0], [10, 0, 0]])
+    assert np.allclose(data[:, -1], [15, 15, 1])
+
+    # chordal deviation of the radial segment
+    on_arc = np.isclose(np.linalg.norm(data[:2].T - [10, 5], axis=1), 5)
+    arc_data = data[:2, on_arc]
+    centers = 0.5 * (arc_data[:, :-1] + arc_data[:, 1:])
+    deviation = 5 - np.linalg.norm(centers - np.array([[10], [5]]), axis=0)
+    assert np.all(deviation <= tolerance)
+
+    # levels of detail
+    levels = trace.rasterize_lod(Q_([1, 0.1, tolerance], "mm"))
+    assert levels[0].shape[1] < levels[1].shape[1] < levels[2].shape[1]
+    assert levels[2].m is trace.rasterize_adaptive(Q_(tolerance, "mm")).m
+
+    trace = geo.Trace(trace.segments)
+    levels = trace.rasterize_lod(Q_([0.1, 1, 0.5], "mm"))
+    assert len(trace._lod_rasters) == 3
+    for level, tolerance in zip(levels, [0.1, 1, 0.5]):
+        assert level.m is trace.rasterize_adaptive(Q_(tolerance, "mm")).m
+
+
 @pytest.mark.slow
 def test_trace_rasterization():
     """Test the trace's rasterize function.
@@ -2687,6 +3011,24 @@ def test_variable_profile_local_profile():
     check_interpolated_profile_points(profile, [0, 0], [8, 16], [16, 0])
 
 
+def test_variable_profile_segment_index():
+    """Test the segment lookup of a variable profile."""
+    interpol = geo.linear_profile_interpolation_sbs
+    profile_a, profile_b = get_default_profiles()
+    variable_profile = geo.VariableProfile(
+        [profile_a, profile_b, profile_a, profile_b],
+        Q_([0, 1, 2.5, 4], "mm"),
+        [interpol] * 3,
+    )
+
+    locations = np.array([-1, 0, 0.5, 1, 1.2, 2.5, 3, 4, 5])
+    exp = [0, 0, 0, 0, 1, 1, 2, 2, 2]
+
+    assert np.array_equal(variable_profile._segment_index(locations), exp)
+    for location, idx in zip(locations, exp):
+        assert variable_profile._segment_index(location) == idx
+
+
 # test geometry class ---------------------------------------------------------
 
 
@@ -2913,6 +3255,48 @@ def test_geometry_rasterization_profile_interpolation():
             assert vector_is_close(data[:, idx_0 + j].m, point_exp)
 
 
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_geometry_rasterization_profile_raster_interpolation(num_workers):
+    """Check the interpolation of key profile raster data and the process pool.
+
+    Parameters
+    ----------
+    num_workers : int
+        Number of worker processes passed to the ``rasterize`` method
+
+    """
+    interpol = geo.linear_profile_interpolation_sbs
+    shape_a = geo.Shape().add_line_segments(Q_([[1, 0], [1, 1], [0, 1]], "mm"))
+    shape_b = shape_a.transform([[2, 0], [0, 2]])
+
+    variable_profile = geo.VariableProfile(
+        [geo.Profile(shape_a), geo.Profile(shape_b), geo.Profile(shape_a)],
+        Q_([0, 2, 6], "mm"),
+        [interpol, interpol],
+    )
+    trace = geo.Trace(
+        [
+            geo.LinearHorizontalTraceSegment("2mm"),
+            geo.RadialHorizontalTraceSegment("3mm", Q_(1, "rad")),
+        ]
+    )
+    geometry = geo.Geometry(variable_profile, trace)
+
+    # the raster width exceeds all segment lengths, so that the number of points
+    # does not change between the profiles
+    data_exp = geometry.rasterize("7mm", "0.5mm")
+    data = geometry.rasterize("7mm", "0.5mm", num_workers=num_workers)
+    data_interp = geometry.rasterize("7mm", "0.5mm", interpolate_raster=True)
+
+    assert np.allclose(data.m, data_exp.m)
+    assert np.allclose(data_interp.m, data_exp.m)
+
+    # the number of points of each profile is determined by the denser key profile
+    data_interp = geometry.rasterize("0.25mm", "0.5mm", interpolate_raster=True)
+    num_locations = len(geometry._rasterize_trace(Q_("0.5mm")))
+    assert data_interp.shape[1] == num_locations * 17
+
+
 def get_test_profile() -> geo.Profile:
     """Create a `weldx.geometry.Profile` for tests.
 
@@ -3002,6 +3386,125 @@ class TestGeometry:
             num_triangles = len(spatial_data.triangles)
         assert num_triangles == exp_num_triangles
 
+    @staticmethod
+    @pytest.mark.parametrize("stack", [True, False])
+    def test_rasterize_constant_profile(stack: bool):
+        """Compare the batched profile sweep against single location transformations.
+
+        Parameters
+        ----------
+        stack : bool
+            The ``stack`` parameter passed to the ``rasterize`` method
+
+        """
+        trace = geo.Trace(
+            [
+                geo.LinearHorizontalTraceSegment("3mm"),
+                geo.RadialHorizontalTraceSegment("2mm", Q_(np.pi / 2, "rad")),
+            ]
+        )
+        geometry = geo.Geometry(get_test_profile(), trace)
+        data = geometry.rasterize("0.5mm", "0.5mm", stack=stack)
+
+        locations = geometry._rasterize_trace(Q_("0.5mm"))
+        profile_data = geometry._profile_raster_data_3d(
+            geometry.profile, Q_("0.5mm"), stack=stack
+        )
+        if stack:
+            exp = [
+                geometry._get_transformed_profile_data(profile_data.m, location)
+                for location in locations
+            ]
+            assert np.allclose(data.m, np.hstack(exp))
+        else:
+            for shape_data, shape_profile_data in zip(data, profile_data):
+                exp = [
+                    geometry._get_transformed_profile_data(shape_profile_data.m, loc)
+                    for loc in locations
+                ]
+                assert np.allclose(shape_data, np.stack(exp))
+
+    @staticmethod
+    @pytest.mark.parametrize("chunk_size", [2, 3, 5, 100])
+    @pytest.mark.parametrize("closed_mesh", [True, False])
+    def test_spatial_data_chunks(chunk_size: int, closed_mesh: bool):
+        """Test that the chunks of `spatial_data_chunks` stitch to the full mesh.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximal number of profile locations per chunk
+        closed_mesh : bool
+            The ``closed_mesh`` parameter passed to the functions
+
+        """
+        trace = geo.Trace(
+            [
+                geo.LinearHorizontalTraceSegment("3mm"),
+                geo.RadialHorizontalTraceSegment("2mm", Q_(np.pi / 2, "rad")),
+            ]
+        )
+        geometry = geo.Geometry(get_test_profile(), trace)
+        full = geometry.spatial_data("0.5mm", "0.5mm", closed_mesh=closed_mesh)
+        chunks = list(
+            geometry.spatial_data_chunks("0.5mm", "0.5mm", chunk_size, closed_mesh)
+        )
+
+        num_locations = len(geometry._rasterize_trace(Q_("0.5mm")))
+        assert len(chunks) == int(np.ceil((num_locations - 1) / (chunk_size - 1)))
+        assert sum(len(c.triangles) for c in chunks) == len(full.triangles)
+
+        def _triangle_set(data):
+            points = data.coordinates.data.m[data.triangles]
+            return {tuple(np.round(tri, 8).flatten()) for tri in points}
+
+        chunk_triangles = set().union(*[_triangle_set(c) for c in chunks])
+        assert chunk_triangles == _triangle_set(full)
+
+    @staticmethod
+    @pytest.mark.parametrize("chunk_size", [2, 5, 100])
+    def test_spatial_data_chunks_variable_profile(chunk_size: int):
+        """Test `spatial_data_chunks` with a variable profile.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximal number of profile locations per chunk
+
+        """
+        geometry = get_test_geometry_variable_profile()
+        full = geometry.spatial_data("1cm", "1cm")
+        chunks = list(geometry.spatial_data_chunks("1cm", "1cm", chunk_size))
+
+        num_locations = len(geometry._rasterize_trace(Q_("1cm")))
+        assert len(chunks) == int(np.ceil(num_locations / chunk_size))
+        assert all(chunk.triangles is None for chunk in chunks)
+        assert np.allclose(
+            np.vstack([chunk.coordinates.data.m for chunk in chunks]),
+            full.coordinates.data.m,
+        )
+
+    @staticmethod
+    def test_to_file_chunked():
+        """Test the chunked export of `Geometry.to_file` against the regular one."""
+        geometry = get_test_geometry_constant_profile()
+        with TemporaryDirectory(dir=Path(__file__).parent) as tmpdirname:
+            geometry.to_file(f"{tmpdirname}/full.stl", "0.5cm", "0.5cm")
+            geometry.to_file(f"{tmpdirname}/chunks.stl", "0.5cm", "0.5cm", 2)
+            full = SpatialData.from_file(f"{tmpdirname}/full.stl")
+            chunks = SpatialData.from_file(f"{tmpdirname}/chunks.stl")
+
+            with pytest.raises(ValueError):
+                geometry.to_file(f"{tmpdirname}/chunks.ply", "0.5cm", "0.5cm", 2)
+
+        full_tri = full.coordinates.data.m[full.triangles]
+        chunks_tri = chunks.coordinates.data.m[chunks.triangles]
+        assert full_tri.shape == chunks_tri.shape
+        assert np.allclose(
+            np.sort(full_tri.reshape(len(full_tri), -1), axis=0),
+            np.sort(chunks_tri.reshape(len(chunks_tri), -1), axis=0),
+        )
+
 
 # --------------------------------------------------------------------------------------
 # SpatialData
@@ -3072,6 +3575,48 @@ class TestSpatialData:
         with pytest.raises(exception_type):
             SpatialData(*arguments)
 
+    # test_from_geometry_raster --------------------------------------------------------
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "cw_ordering, exp_front",
+        [
+            (True, [[0, 1, 4], [1, 3, 4], [1, 2, 3]]),
+            (False, [[0, 4, 1], [1, 4, 3], [1, 3, 2]]),
+        ],
+    )
+    def test_front_back_triangles(cw_ordering: bool, exp_front: list):
+        """Test the triangulation of the front and back faces.
+
+        Parameters
+        ----------
+        cw_ordering : bool
+            `True` if the profile points have clockwise ordering
+        exp_front : list
+            The expected triangles of the front face
+
+        """
+        triangles = SpatialData._shape_front_back_triangles(3, 5, 2, cw_ordering)
+
+        exp_front = np.array(exp_front) + 2
+        exp_back = exp_front[:, [0, 2, 1]] + 10
+        assert np.array_equal(triangles, np.vstack([exp_front, exp_back]))
+
+    @staticmethod
+    def test_from_geometry_raster():
+        """Test the triangulation of a rasterized geometry."""
+        geometry = get_test_geometry_constant_profile()
+        raster = geometry.rasterize("1cm", "0.5cm", stack=False)
+        data = SpatialData.from_geometry_raster([Q_(r, "mm") for r in raster])
+
+        # 3 profiles with 4 and 2 points -> (2 * 8 + 4) + (2 * 4 + 0) triangles
+        assert data.triangles.dtype == np.uint32
+        assert data.triangles.shape == (28, 3)
+        assert data.triangles.max() == 17
+
+        points = np.vstack([r.swapaxes(1, 2).reshape(-1, 3) for r in raster])
+        assert np.allclose(data.coordinates.data.m, points)
+
     # test_comparison ------------------------------------------------------------------
 
     @staticmethod
@@ -3159,6 +3704,28 @@ class TestSpatialData:
         assert np.allclose(data.coordinates.data, data_read.coordinates.data)
         assert np.allclose(data.triangles, data_read.triangles)
 
+    @staticmethod
+    def test_chunks_to_file_error():
+        """Test that a failing chunked export leaves no partial file behind."""
+        points = Q_([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], "mm")
+        valid = SpatialData(points, [[0, 1, 2], [2, 3, 0]])
+        invalid = SpatialData(points)
+
+        with TemporaryDirectory(dir=Path(__file__).parent) as tmpdirname:
+            filepath = Path(tmpdirname) / "test.stl"
+            with pytest.raises(ValueError):
+                SpatialData.chunks_to_file([valid, invalid], filepath)
+            assert not any(Path(tmpdirname).iterdir())
+
+            # an existing file is only replaced by a complete export
+            SpatialData.chunks_to_file([valid], filepath)
+            with pytest.raises(ValueError):
+                SpatialData.chunks_to_file([valid, valid, invalid], filepath)
+            assert list(Path(tmpdirname).iterdir()) == [filepath]
+            data_read = SpatialData.from_file(filepath)
+
+        assert len(data_read.triangles) == 2
+
     @staticmethod
     def test_time_dependent_data():
         """Simple test for assigning and transforming time dependent data."""
@@ -701,6 +701,56 @@ class TestTime:
         arr2 = time.as_data_array()
         assert arr.time.identical(arr2.time)
 
+    # test_quantity_conversion ---------------------------------------------------------
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.sort(np.random.default_rng(0).uniform(-500, 500, 1000)),
+            np.array([3e-10, 1e-9, 0.1, 0.7, 1.1, 2.5, 123456.123456789]),
+            np.array([-3, 0, 2, 7]),
+        ],
+    )
+    def test_quantity_conversion(values):
+        """Test that quantities are converted like `pandas.to_timedelta` does."""
+        exp = pd.to_timedelta(values, "s")
+        assert np.all(Time(Q_(values, "s")).as_pandas_index() == exp)
+        assert np.all(Time(Q_(values * 1000, "ms")).as_pandas_index() == exp)
+
+    # test_int64_construction ----------------------------------------------------------
+
+    @staticmethod
+    def test_int64_construction():
+        """Test the trusted construction and the cached int64 values."""
+        ns = np.array([0, 1, 3], dtype=np.int64) * 10**9
+
+        t = Time._from_nanoseconds(ns)
+        assert t.equals(Time(Q_([0, 1, 3], "s")))
+        assert np.all(t._as_int64() == ns)
+        assert not t._as_int64().flags.writeable
+        assert Time(t)._as_int64() is t._as_int64()
+
+        # the passed array is copied
+        ns_copy = ns.copy()
+        ns[0] = 1
+        assert np.all(t._as_int64() == ns_copy)
+        assert t.equals(Time(Q_([0, 1, 3], "s")))
+        ns[0] = 0
+
+        t_abs = Time._from_nanoseconds(ns, "2020-01-01")
+        assert t_abs.equals(Time(Q_([0, 1, 3], "s"), "2020-01-01"))
+        assert np.all(t_abs._as_timedelta_int64() == ns)
+        assert np.all(t_abs == t + Timestamp("2020-01-01"))
+        assert t_abs.all_close(t_abs)
+
+        assert Time._from_nanoseconds(ns[:1]).is_timestamp is False
+        assert len(Time._from_nanoseconds(ns[:1])) == 1
+
+        q = t.as_quantity("ns")
+        q += Q_(1, "ns")
+        assert np.all(t._as_int64() == ns)
+
     # test_duration --------------------------------------------------------------------
 
     @staticmethod
@@ -812,3 +862,46 @@ class TestTime:
             assert np.all(instance.union(list_of_objects[1:]) == time_exp)
         else:
             assert np.all(Time.union(list_of_objects) == time_exp)
+
+    # test_union_tolerance -------------------------------------------------------------
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "list_of_objects, tolerance, time_exp",
+        [
+            (
+                [Q_([1, 3, 4], "s"), Q_([1.001, 2, 3.002], "s")],
+                Q_(5, "ms"),
+                Q_([1, 2, 3, 4], "s"),
+            ),
+            (
+                [Q_([1, 3, 4], "s"), Q_([1.001, 2, 3.002], "s")],
+                Q_(1.5, "ms"),
+                Q_([1, 2, 3, 3.002, 4], "s"),
+            ),
+            (
+                [Q_(np.arange(0, 1, 0.1), "s")],
+                Q_(250, "ms"),
+                Q_(np.arange(0, 1, 0.1), "s"),
+            ),
+            (
+                [Q_(np.arange(0, 1, 0.1), "s"), Q_(np.arange(0, 1, 0.1) + 1e-4, "s")],
+                Q_(200, "ms"),
+                Q_(np.arange(0, 1, 0.1), "s"),
+            ),
+            (
+                [Q_([1, 2], "s"), Q_([1.001], "s"), Q_([1.002, 3], "s")],
+                Q_(1.5, "ms"),
+                Q_([1, 1.002, 2, 3], "s"),
+            ),
+            (
+                [date_range("2020-02-01", periods=3, freq="1D")] * 2,
+                Timedelta("1h"),
+                date_range("2020-02-01", periods=3, freq="1D"),
+            ),
+        ],
+    )
+    def test_union_tolerance(list_of_objects, tolerance, time_exp):
+        """Test the merging of close time values in Time.union."""
+        result = Time.union(list_of_objects, tolerance=tolerance)
+        assert np.all(result == Time(time_exp))
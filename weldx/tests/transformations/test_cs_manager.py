@@ -956,6 +956,35 @@ def test_time_union_time_series_coords(
     assert np.all(exp_time == csm.time_union(list_of_edges))
 
 
+@pytest.mark.parametrize("csm_time_ref", [None, "2000-01-01"])
+def test_time_union_incremental_update(csm_time_ref):
+    """Test that the cached time union follows modifications of the CSM."""
+
+    def _exp(seconds):
+        exp = pd.to_timedelta(seconds, unit="s")
+        if csm_time_ref is not None:
+            exp = pd.Timestamp(csm_time_ref) + exp
+        return exp
+
+    coordinates = Q_([[1, 2, 3], [4, 5, 6]], "mm")
+    csm = CSM("root", time_ref=csm_time_ref)
+    assert csm.time_union() is None
+
+    csm.create_cs("a", "root", coordinates=coordinates, time=Q_([1, 3], "s"))
+    assert np.all(csm.time_union() == _exp([1, 3]))
+
+    csm.create_cs("b", "a", coordinates=coordinates, time=Q_([2, 3], "s"))
+    csm.create_cs("c", "root", coordinates=Q_([1, 2, 3], "mm"))
+    assert np.all(csm.time_union() == _exp([1, 2, 3]))
+    assert np.all(csm.time_union([("b", "a")]) == _exp([2, 3]))
+
+    csm.add_cs("b", "a", LCS(coordinates=coordinates, time=Q_([0, 5], "s")))
+    assert np.all(csm.time_union() == _exp([0, 1, 3, 5]))
+
+    csm.delete_cs("b")
+    assert np.all(csm.time_union() == _exp([1, 3]))
+
+
 # test_get_local_coordinate_system_no_time_dep -----------------------------------------
 
 
@@ -1589,6 +1618,244 @@ def test_get_cs_exception_timeseries(lcs, in_lcs, exp_exception, units):
         csm.get_cs(lcs, in_lcs)
 
 
+# test_get_cs_cache --------------------------------------------------------------------
+
+
+def test_get_cs_cache():
+    """Test the caching of `get_cs` results and its invalidation."""
+    csm = CSM("r")
+    csm.create_cs("a", "r", r_mat_z(0.5), Q_([1, 0, 0], "mm"))
+    csm.create_cs("b", "a", r_mat_x(0.5), Q_([0, 2, 0], "mm"))
+    csm.create_cs(
+        "m", "b", coordinates=Q_([[0, 0, 0], [0, 0, 2]], "mm"), time=Q_([0, 2], "s")
+    )
+    csm.create_cs("c", "m", r_mat_y(0.5), Q_([0, 0, 3], "mm"))
+    csm.create_cs("d", "c", coordinates=Q_([1, 1, 1], "mm"))
+
+    time = Q_([0, 1, 2], "s")
+    lcs = csm.get_cs("d", "r", time)
+    lcs_cached = csm.get_cs("d", "r", Time(time))
+    assert lcs_cached is not lcs
+    assert np.shares_memory(lcs_cached.orientation.data, lcs.orientation.data)
+    lcs_other = csm.get_cs("d", "r", Q_([0, 1], "s"))
+    assert not np.shares_memory(lcs_other.orientation.data, lcs.orientation.data)
+
+    # result with composed static sub-chains matches the edge-wise composition
+    lcs_exp = csm.get_cs("d", "c") + csm.get_cs("c", "m")
+    lcs_exp += csm.get_cs("m", "b", time) + csm.get_cs("b", "a") + csm.get_cs("a", "r")
+    check_cs_close(lcs, lcs_exp)
+
+    # invalidation
+    csm.create_cs("c", "m", coordinates=Q_([0, 0, 4], "mm"))
+    lcs_new = csm.get_cs("d", "r", time)
+    assert not np.allclose(lcs_new.coordinates.data.m, lcs.coordinates.data.m)
+
+    csm.assign_data(Q_(np.zeros((2, 3)), "mm"), "data", "d")
+    lcs_assigned = csm.get_cs("d", "r", time)
+    assert not np.shares_memory(lcs_assigned.orientation.data, lcs_new.orientation.data)
+
+    csm.delete_cs("d")
+    with pytest.raises(ValueError):
+        csm.get_cs("d", "r", time)
+
+    other = CSM("d", "other")
+    other.create_cs("c", "d", coordinates=Q_([0, 0, 1], "mm"))
+    csm.merge(other)
+    lcs_merged = csm.get_cs("d", "r", time)
+    csm.unmerge()
+    with pytest.raises(ValueError):
+        csm.get_cs("d", "r", time)
+    assert lcs_merged is not None
+
+
+# test_get_cs_cache_modification -------------------------------------------------------
+
+
+def test_get_cs_cache_modification():
+    """Test that modifying a returned system does not change the cached result."""
+    csm = CSM("r")
+    csm.create_cs("a", "r", r_mat_z(0.5), Q_([1, 0, 0], "mm"))
+    csm.create_cs(
+        "b", "a", coordinates=Q_([[0, 0, 0], [0, 0, 2]], "mm"), time=Q_([0, 2], "s")
+    )
+    time = Q_([0, 1, 2], "s")
+
+    for cs_name in ["a", "b"]:
+        lcs = csm.get_cs(cs_name, "r", time)
+        lcs_exp = csm.get_cs(cs_name, "r", time)
+        lcs.reset_reference_time(pd.Timestamp("2021-01-01"))
+        with pytest.raises(ValueError):
+            lcs.coordinates.data.m[0] = 5
+
+        lcs_cached = csm.get_cs(cs_name, "r", time)
+        assert lcs_cached.reference_time is None
+        check_cs_close(lcs_cached, lcs_exp)
+
+
+# test_get_cs_many ---------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("reference", ["r", "a", "c"])
+@pytest.mark.parametrize("time", [None, Q_([0.5, 1.5], "s")])
+def test_get_cs_many(reference, time):
+    """Test that `get_cs_many` returns the same systems as `get_cs`."""
+    csm = CSM("r")
+    csm.create_cs("a", "r", r_mat_z(0.5), Q_([1, 0, 0], "mm"))
+    csm.create_cs(
+        "m", "a", coordinates=Q_([[0, 0, 0], [0, 0, 2]], "mm"), time=Q_([0, 2], "s")
+    )
+    csm.create_cs("b", "m", r_mat_x(0.5), Q_([0, 2, 0], "mm"))
+    csm.create_cs("c", "b", coordinates=Q_([1, 1, 1], "mm"))
+    csm.create_cs("d", "r", r_mat_y(0.5), Q_([0, 0, 3], "mm"))
+
+    names = ["r", "a", "m", "b", "c", "d"]
+    lcs_dict = csm.get_cs_many(names, reference, time)
+    matrices = csm.get_homogeneous_matrices(names, "m", reference, time)
+
+    assert matrices.shape == (len(names), 2, 4, 4)
+    for i, name in enumerate(names):
+        time_exp = Q_([0, 2], "s") if time is None and name != reference else time
+        lcs_exp = csm.get_cs(name, reference, time_exp)
+        check_cs_close(lcs_dict[name], lcs_exp)
+        mat_exp = np.reshape(lcs_exp.as_homogeneous_matrix("m"), (-1, 4, 4))
+        assert np.allclose(matrices[i], mat_exp)
+
+
+# test_tree_index ----------------------------------------------------------------------
+
+
+def test_tree_index():
+    """Test that the tree index follows modifications of the CSM."""
+    from networkx import shortest_path
+
+    rng = np.random.default_rng(0)
+    csm = CSM("root")
+    names = ["root"]
+    for i in range(60):
+        csm.create_cs(f"cs_{i}", names[rng.integers(len(names))])
+        names.append(f"cs_{i}")
+        if i == 20:
+            csm.get_parent_system_name("cs_0")  # later systems are added incrementally
+
+    def _check_paths():
+        for name_0, name_1 in rng.choice(csm.coordinate_system_names, (100, 2)):
+            path = csm._get_tree_index().path(name_0, name_1)
+            assert path == shortest_path(csm.graph, name_0, name_1)
+
+    _check_paths()
+
+    parent = csm.get_parent_system_name("cs_30")
+    csm.relabel({parent: "renamed"})
+    assert csm.get_parent_system_name("cs_30") == "renamed"
+    _check_paths()
+
+    csm.delete_cs("renamed", delete_children=True)
+    _check_paths()
+
+
+# test_compile_path --------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "csm_time_ref, lcs_time_ref",
+    [
+        (None, None),
+        ("2020-01-01", None),
+        (None, "2020-01-01"),
+        ("2020-01-01", "2020-01-01 00:00:01"),
+    ],
+)
+@pytest.mark.parametrize("path", [("d", "e"), ("e", "d"), ("d", "root"), ("b", "e")])
+def test_compile_path(csm_time_ref, lcs_time_ref, path):
+    """Test that compiled paths return the same transformations as `get_cs`."""
+    csm = CSM("root", time_ref=csm_time_ref)
+    csm.create_cs(
+        "a",
+        "root",
+        [r_mat_z(0), r_mat_z(0.5), r_mat_z(1)],
+        Q_([[1, 2, 3], [4, 5, 6], [0, 0, 1]], "mm"),
+        time=Q_([0, 2, 4], "s"),
+        time_ref=lcs_time_ref,
+    )
+    csm.create_cs("b", "a", r_mat_x(0.5), Q_([1, 0, 0], "cm"))
+    csm.create_cs(
+        "c",
+        "b",
+        [r_mat_y(0), r_mat_y(0.5)],
+        Q_([[1, 2, 3], [4, 5, 6]], "m"),
+        time=Q_([1, 3], "s"),
+        time_ref=lcs_time_ref,
+    )
+    csm.create_cs("d", "c", coordinates=Q_([1, 1, 0], "mm"))
+    csm.create_cs("e", "root", r_mat_y(0.5), Q_([1, 0, 2], "mm"))
+
+    compiled = csm.compile_path(*path, translation_unit="m")
+    assert compiled.is_time_dependent
+
+    time = Q_([0.5, 1.7, 3.2, 5], "s")
+    time_ref = lcs_time_ref if lcs_time_ref is not None else csm_time_ref
+    if time_ref is not None:
+        time = Time(time, time_ref)
+    lcs_exp = csm.get_cs(*path, time=time)
+
+    orientation, coordinates = compiled(time)
+    assert np.allclose(orientation, lcs_exp.orientation.data)
+    assert np.allclose(coordinates, lcs_exp.coordinates.data.to("m").m)
+
+    time_single = Q_(1.7, "s")
+    if time_ref is not None:
+        time_single = pd.Timestamp(time_ref) + pd.Timedelta(1.7, "s")
+    orientation, coordinates = compiled(time_single)
+    assert orientation.shape == (3, 3)
+    assert np.allclose(orientation, lcs_exp.orientation.data[1])
+    assert np.allclose(coordinates, lcs_exp.coordinates.data[1].to("m").m)
+
+    with pytest.raises(ValueError):
+        compiled()
+
+
+def test_compile_path_mixed_time_ref():
+    """Test that paths mixing systems with and without reference time are rejected."""
+    csm = CSM("root")
+    csm.create_cs(
+        "a", "root", coordinates=Q_([[0, 0, 0], [1, 0, 0]], "mm"), time=Q_([0, 2], "s")
+    )
+    csm.create_cs(
+        "b", "a", coordinates=Q_([[0, 0, 0], [0, 1, 0]], "mm"), time=Q_([0, 2], "s")
+    )
+    # the public interface prevents this case, so the graph is modified directly
+    csm.graph.edges[("b", "a")]["transformation"] = LCS(
+        coordinates=Q_([[0, 0, 0], [0, 1, 0]], "mm"),
+        time=Q_([0, 2], "s"),
+        time_ref="2020-01-01",
+    )
+    csm._invalidate_cs_cache()
+
+    with pytest.raises(TypeError):
+        csm.get_cs("b", "root", Q_([1], "s"))
+    with pytest.raises(TypeError):
+        csm.compile_path("b", "root")
+
+
+def test_compile_path_static():
+    """Test compiling a path of static coordinate systems."""
+    csm = CSM("root")
+    csm.create_cs("a", "root", r_mat_z(0.5), Q_([1, 2, 3], "mm"))
+    csm.create_cs("b", "a", r_mat_x(0.5), Q_([1, 0, 0], "cm"))
+    csm.create_cs("c", "root", r_mat_y(0.5), Q_([1, 0, 2], "mm"))
+    lcs_exp = csm.get_cs("b", "c")
+
+    compiled = csm.compile_path("b", "c")
+    assert not compiled.is_time_dependent
+    orientation, coordinates = compiled()
+    assert np.allclose(orientation, lcs_exp.orientation.data)
+    assert np.allclose(coordinates, lcs_exp.coordinates.data.to("mm").m)
+
+    orientation, coordinates = compiled(pd.to_timedelta([1, 2, 3], "s").values)
+    assert orientation.shape == (3, 3, 3)
+    assert np.allclose(coordinates, lcs_exp.coordinates.data.to("mm").m)
+
+
 # test_merge ---------------------------------------------------------------------------
 
 
@@ -2849,3 +3116,51 @@ def test_coordinate_system_manager_transform_data():
     # data is not compatible
     with pytest.raises(np.core._exceptions._UFuncNoLoopError):
         csm.transform_data("wrong", "lcs_3", "lcs_1")
+
+
+# test_transform_data_blockwise --------------------------------------------------------
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 10])
+@pytest.mark.parametrize("data_time", [False, True])
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_transform_data_blockwise(chunk_size, data_time, use_dask):
+    """Test the block wise transformation of `transform_data`."""
+    csm = CSM("root")
+    csm.create_cs(
+        "a",
+        "root",
+        [r_mat_z(0), r_mat_z(0.5)],
+        Q_([[1, 2, 3], [4, 5, 6]], "mm"),
+        time=Q_([0, 2], "s"),
+    )
+    csm.create_cs("b", "a", r_mat_x(0.5), Q_([1, 0, 0], "cm"))
+
+    rng = np.random.default_rng(42)
+    if data_time:
+        data = xr.DataArray(
+            Q_(rng.random((4, 5, 3)), "mm"),
+            dims=["n", "time", "c"],
+            coords={"time": pd.to_timedelta([0, 0.5, 1, 1.5, 2], "s")},
+        ).transpose("time", "n", "c")
+    else:
+        data = xr.DataArray(Q_(rng.random((5, 4, 3)), "mm"), dims=["n", "m", "c"])
+    exp = csm.transform_data(data, "b", "root")
+
+    if use_dask:
+        da = pytest.importorskip("dask.array")
+        data = data.copy(data=Q_(da.from_array(data.data.m, chunks=2), "mm"))
+
+    result = csm.transform_data(data, "b", "root", chunk_size=chunk_size)
+    assert result.dims == exp.dims
+    assert np.all(result.time == exp.time)
+    assert np.allclose(result.data.to("mm").m, exp.data.to("mm").m)
+
+    # preallocated output
+    out = np.zeros(exp.shape)
+    result = csm.transform_data(data, "b", "root", chunk_size=chunk_size, out=out)
+    assert result.data.m is out
+    assert np.allclose(out, exp.data.to("mm").m)
+
+    with pytest.raises(ValueError):
+        csm.transform_data(data, "b", "root", out=np.zeros((1, 3)))
@@ -601,6 +601,109 @@ def test_interp_time_discrete_outside_value_range_both_sides():
     assert np.allclose(lcs_interp.orientation.data, lcs.orientation.data)
 
 
+# test_interp_time_slerp_cache ---------------------------------------------------------
+
+
+def test_interp_time_slerp_cache(monkeypatch):
+    """Test that the orientation interpolator is only created once per system."""
+    import weldx.transformations.local_cs as local_cs
+
+    num_calls = []
+    slerp_cls = local_cs.Slerp
+
+    def _slerp(*args):
+        num_calls.append(1)
+        return slerp_cls(*args)
+
+    monkeypatch.setattr(local_cs, "Slerp", _slerp)
+
+    orientation = WXRotation.from_euler("x", [[0], [90], [180]], degrees=True)
+    lcs = LCS(orientation.as_matrix(), time=Q_([0, 2, 4], "s"))
+    for angle in [45, 90, 135]:
+        lcs_interp = lcs.interp_time(Q_([angle / 45, angle / 45 + 1], "s"))
+        exp = WXRotation.from_euler("x", [[angle], [angle + 45]], degrees=True)
+        assert np.allclose(lcs_interp.orientation.data, exp.as_matrix())
+
+    assert len(num_calls) == 1
+
+
+def test_dask_backed_data():
+    """Test that dask backed systems are validated and evaluated lazily."""
+    da = pytest.importorskip("dask.array")
+
+    angles = np.linspace(0, 180, 50)[:, np.newaxis]
+    orientation = WXRotation.from_euler("z", angles, degrees=True).as_matrix()
+    coordinates = Q_(np.arange(150).reshape(50, 3), "mm")
+    time = Q_(np.arange(50), "s")
+    lcs_exp = LCS(orientation, coordinates, time)
+    lcs = LCS(
+        da.from_array(2 * orientation, chunks=(10, 3, 3)),
+        Q_(da.from_array(coordinates.m, chunks=(10, 3)), "mm"),
+        time,
+    )
+    assert isinstance(lcs.orientation.data, da.Array)
+    assert isinstance(lcs.coordinates.data.m, da.Array)
+
+    # interpolation only loads the required keyframes
+    time_interp = Q_([1.5, 20.25], "s")
+    lcs_interp = lcs.interp_time(time_interp)
+    assert isinstance(lcs_interp.orientation.data, np.ndarray)
+    check_cs_close(lcs_interp, lcs_exp.interp_time(time_interp))
+
+    # addition with static systems stays lazy
+    lcs_static = LCS(r_mat_z(0.5), Q_([1, 2, 3], "mm"))
+    for lcs_sum, lcs_sum_exp in [
+        (lcs + lcs_static, lcs_exp + lcs_static),
+        (lcs_static + lcs, lcs_static + lcs_exp),
+    ]:
+        assert isinstance(lcs_sum.orientation.data, da.Array)
+        assert np.allclose(lcs_sum.orientation.values, lcs_sum_exp.orientation.values)
+        assert np.allclose(
+            lcs_sum.coordinates.data.m.compute(), lcs_sum_exp.coordinates.data.m
+        )
+
+    # orthogonality checks are sampled eagerly and deferred for the remaining data
+    orientation[0, 0, 1] = 2
+    with pytest.raises(ValueError):
+        LCS(da.from_array(orientation), coordinates, time)
+    orientation[0, 0, 1] = 0
+    orientation[25, 0, 1] = 2
+    lcs = LCS(da.from_array(orientation, chunks=(10, 3, 3)), coordinates, time)
+    with pytest.raises(ValueError):
+        lcs.orientation.compute()
+
+
+@pytest.mark.parametrize(
+    "time",
+    [[1], [0], [2], [-1], [3], [0.5], [0.5, 1.5], [1, 2], [-1, 1], [-1, 3]],
+)
+def test_dask_backed_interp_time(time):
+    """Test that dask backed systems are interpolated like numpy backed ones."""
+    da = pytest.importorskip("dask.array")
+
+    orientation = WXRotation.from_euler(
+        "z", [[0], [90], [180]], degrees=True
+    ).as_matrix()
+    coordinates = Q_([[0, 0, 0], [1, 2, 3], [2, 4, 6]], "mm")
+    time_lcs = Q_([0, 1, 2], "s")
+    lcs_exp = LCS(orientation, coordinates, time_lcs)
+    lcs = LCS(
+        da.from_array(orientation, chunks=(1, 3, 3)),
+        Q_(da.from_array(coordinates.m, chunks=(1, 3)), "mm"),
+        time_lcs,
+    )
+
+    lcs_interp = lcs.interp_time(Q_(time, "s"))
+    lcs_interp_exp = lcs_exp.interp_time(Q_(time, "s"))
+    if lcs_interp_exp.time is None:
+        assert lcs_interp.time is None
+    else:
+        assert lcs_interp.time.equals(lcs_interp_exp.time)
+    assert lcs_interp.is_time_dependent == lcs_interp_exp.is_time_dependent
+    assert np.allclose(lcs_interp.orientation.data, lcs_interp_exp.orientation.data)
+    assert np.allclose(lcs_interp.coordinates.data, lcs_interp_exp.coordinates.data)
+
+
 # test_interp_time_timeseries_as_coords ------------------------------------------------
 
 
@@ -1137,6 +1240,66 @@ def test_subtraction(
     )
 
 
+# test_addition_homogeneous_matrices ---------------------------------------------------
+
+
+@pytest.mark.parametrize("time_ref_rhs", [TS("2020-01-01"), TS("2020-01-01 00:00:01")])
+def test_addition_homogeneous_matrices(time_ref_rhs):
+    """Test addition and inversion against products of homogeneous matrices."""
+    time_lhs = Time(Q_([0, 1, 2, 3], "s"), TS("2020-01-01"))
+    lhs = LCS(r_mat_z([0, 0.25, 0.5, 0.75]), Q_([[1, 0, 0]] * 4, "mm"), time_lhs)
+    rhs = LCS(
+        r_mat_y([0, 0.5]),
+        Q_([[0, 0, 0], [0, 0, 0.002]], "m"),
+        Q_([0, 4], "s"),
+        time_ref_rhs,
+    )
+
+    result = lhs + rhs
+    assert result.reference_time == TS("2020-01-01")
+    assert np.all(result.time == time_lhs)
+
+    mat_rhs = rhs.interp_time(time_lhs).as_homogeneous_matrix("mm")
+    mat_exp = mat_rhs @ lhs.as_homogeneous_matrix("mm")
+    assert np.allclose(result.as_homogeneous_matrix("mm"), mat_exp)
+
+    identity = result + result.invert()
+    assert np.allclose(identity.orientation.data, np.eye(3))
+    assert np.allclose(identity.coordinates.data.m, 0)
+
+
+# test_homogeneous_matrices_without_copies ---------------------------------------------
+
+
+def test_homogeneous_matrices_without_copies(tmp_path):
+    """Test wrapping and exporting homogeneous matrices without copying them."""
+    time = Time(Q_([0, 1, 2, 3], "s"), TS("2020-01-01"))
+    lcs_exp = LCS(r_mat_z([0, 0.25, 0.5, 0.75]), Q_([[1, 2, 3]] * 4, "mm"), time)
+
+    file = tmp_path / "poses.npy"
+    np.save(file, lcs_exp.as_homogeneous_matrix("m"))
+    matrices = np.load(file, mmap_mode="r")
+
+    lcs = LCS.from_homogeneous_transformation(
+        matrices, "m", time, construction_checks=False
+    )
+    assert np.shares_memory(lcs.orientation.data, matrices)
+    assert np.shares_memory(lcs.coordinates.data.m, matrices)
+    assert lcs.reference_time == TS("2020-01-01")
+    check_cs_close(lcs, lcs_exp)
+
+    out = np.zeros((4, 4, 4))
+    assert lcs.as_homogeneous_matrix("mm", out=out) is out
+    assert np.allclose(out, lcs_exp.as_homogeneous_matrix("mm"))
+
+    with pytest.raises(ValueError):
+        LCS.from_homogeneous_transformation(matrices, "m", construction_checks=False)
+    with pytest.raises(ValueError):
+        LCS.from_homogeneous_transformation(
+            matrices, "m", time[:2], construction_checks=False
+        )
+
+
 # test_comparison_coords_timeseries ----------------------------------------------------
 
 
@@ -279,6 +279,13 @@ class Time:
         time: types_time_like,
         time_ref: types_timestamp_like = None,
     ):
+        if isinstance(time, Time) and time_ref is None:
+            # already validated, share the data and its cached int64 values
+            self._time = time._time
+            self._time_ref = time._time_ref
+            self._int64 = time._int64
+            return
+
         time, time_ref = self._get_time_input(time, time_ref)
 
         # sanity check
@@ -298,6 +305,100 @@ class Time:
 
         self._time: pd.TimedeltaIndex | pd.DatetimeIndex = time
         self._time_ref: pd.Timestamp = time_ref
+        self._int64: np.ndarray | None = None
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        time: types_pandas_times,
+        time_ref: Timestamp | None = None,
+    ) -> Time:
+        """Create a `Time` object from valid pandas data without any checks.
+
+        The data must be monotonic increasing and relative times must already include
+        the reference time, so that they are absolute.
+
+        Parameters
+        ----------
+        time :
+            A pandas time type.
+        time_ref :
+            An optional reference time.
+
+        Returns
+        -------
+        weldx.time.Time :
+            The new time object
+
+        """
+        if isinstance(time, pd.Index) and len(time) == 1:
+            time = time[0]
+        obj = cls.__new__(cls)
+        obj._time = time
+        obj._time_ref = time_ref
+        obj._int64 = None
+        return obj
+
+    @classmethod
+    def _from_nanoseconds(
+        cls, nanoseconds: np.ndarray, time_ref: Timestamp | None = None
+    ) -> Time:
+        """Create a `Time` object from sorted int64 nanoseconds without any checks.
+
+        Parameters
+        ----------
+        nanoseconds :
+            Monotonic increasing int64 time deltas in nanoseconds. If a reference time
+            is provided, they are relative to it.
+        time_ref :
+            An optional reference time.
+
+        Returns
+        -------
+        weldx.time.Time :
+            The new time object
+
+        """
+        if time_ref is None:
+            # the index shares the memory of the cached values, so they are copied
+            nanoseconds = np.array(nanoseconds, dtype=np.int64)
+            nanoseconds.flags.writeable = False
+            index = pd.TimedeltaIndex(nanoseconds.view("timedelta64[ns]"))
+            obj = cls._from_trusted(index)
+            if len(nanoseconds) > 1:
+                obj._int64 = nanoseconds
+            return obj
+        nanoseconds = np.asarray(nanoseconds, dtype=np.int64)
+        time = pd.TimedeltaIndex(nanoseconds.view("timedelta64[ns]"))
+        time_ref = pd.Timestamp(time_ref)
+        return cls._from_trusted(time + time_ref, time_ref)
+
+    def _as_int64(self) -> np.ndarray:
+        """Get the data as int64 nanoseconds.
+
+        Absolute times are returned as nanoseconds since the epoch and relative times
+        as nanoseconds of the time deltas. Scalars are returned as arrays of length 1.
+        The values are cached and must not be modified.
+
+        """
+        if self._int64 is None:
+            values = self.as_pandas_index().values
+            unit = "datetime64[ns]" if self.is_absolute else "timedelta64[ns]"
+            values = values.astype(unit, copy=False).view(np.int64)
+            values.flags.writeable = False
+            self._int64 = values
+        return self._int64
+
+    def _as_timedelta_int64(self) -> np.ndarray:
+        """Get the time deltas to the reference time as int64 nanoseconds.
+
+        See `Time._as_int64` for details.
+
+        """
+        values = self._as_int64()
+        if self.is_absolute:
+            return values - self.reference_time.value
+        return values
 
     @staticmethod
     def _get_time_input(time, time_ref):
@@ -325,7 +426,8 @@ class Time:
         """Element-wise addition between `Time` object and compatible types."""
         other = Time(other)
         time_ref = self.reference_time if self.is_absolute else other.reference_time
-        return Time(self._time + other.as_pandas(), time_ref)
+        # the sum of two monotonic increasing inputs is monotonic increasing
+        return Time._from_trusted(self._time + other.as_pandas(), time_ref)
 
     def __radd__(self, other: types_time_like) -> Time:
         """Element-wise addition between `Time` object and compatible types."""
@@ -350,7 +452,14 @@ class Time:
         --------
         equals : Check equality of `Time` objects.
         """
-        return self._time == Time(other).as_pandas()
+        other = Time(other)
+        if (
+            isinstance(self._time, pd.Index)
+            and isinstance(other._time, pd.Index)
+            and self.is_absolute == other.is_absolute
+        ):
+            return self._as_int64() == other._as_int64()
+        return self._time == other.as_pandas()
 
     __hash__ = None
 
@@ -427,7 +536,9 @@ class Time:
         other = Time(other)
         if self.reference_time != other.reference_time:
             return False
-        return np.allclose(self.as_quantity("s").m, other.as_quantity("s").m)
+        return np.allclose(
+            self._as_timedelta_int64() * 1e-9, other._as_timedelta_int64() * 1e-9
+        )
 
     def as_quantity(self, unit: str = "s") -> pint.Quantity:
         """Return the data as `pint.Quantity`.
@@ -447,10 +558,12 @@ class Time:
         from pandas Timedelta documentation: "The .value attribute is always in ns."
         https://pandas.pydata.org/docs/reference/api/pandas.Timedelta.html
         """
-        nanoseconds = self.as_timedelta_index().values.astype(np.int64)
+        nanoseconds = self._as_timedelta_int64()
         if len(nanoseconds) == 1:
             nanoseconds = nanoseconds[0]
         q = Q_(nanoseconds, "ns").to(unit)
+        if q.m is nanoseconds:
+            q = Q_(nanoseconds.copy(), "ns")
         if self.is_absolute:
             # store time_ref info
             q.time_ref = self.reference_time  # type: ignore[attr-defined]
@@ -668,11 +781,32 @@ class Time:
             # necessary interfaces so that the function works as expected
             time = np.expand_dims(time, 0)  # type: ignore[assignment]
 
-        delta = pd.to_timedelta(time.to(base).magnitude, base)
+        delta = Time._seconds_to_timedelta(np.asarray(time.to(base).magnitude))
         if time_ref is not None:
             delta = delta + time_ref
         return delta
 
+    @staticmethod
+    def _seconds_to_timedelta(seconds: np.ndarray) -> pd.TimedeltaIndex:
+        """Convert an array of seconds into a `pandas.TimedeltaIndex`.
+
+        This gives the same results as ``pd.to_timedelta(seconds, "s")`` but performs
+        the conversion on the whole array with numpy.
+
+        """
+        if (
+            seconds.dtype.kind not in "iuf"
+            or not np.all(np.isfinite(seconds))
+            or np.any(np.abs(seconds) >= 9.2e9)  # out of the int64 nanosecond range
+        ):
+            return pd.to_timedelta(seconds, "s")
+        base = seconds.astype(np.int64)
+        nanoseconds = base * 1_000_000_000
+        if seconds.dtype.kind == "f":
+            fraction = np.round(seconds - base, 9)
+            nanoseconds += (fraction * 1e9).astype(np.int64)
+        return pd.TimedeltaIndex(nanoseconds.view("timedelta64[ns]"))
+
     @staticmethod
     def _convert_xarray(
         time: xr.DataArray | xr.Dataset,
@@ -736,6 +870,12 @@ class Time:
     ----------
     times:
         A list of time-like objects
+    tolerance:
+        Optional time delta. Time values of an input that are not further apart from
+        a value of one of the preceding inputs than this tolerance are merged into
+        that value. Values of the same input are never merged. This avoids an
+        explosion of the union size if the inputs are recorded with slightly
+        jittering clocks.
 
     Returns
     -------
@@ -759,20 +899,127 @@ class Time:
     >>> all(t1.union([t2]) == Time(["1s", "2s", "3s", "4s", "5s"]))
     True
 
+    Merging values that are closer than a tolerance:
+
+    >>> t3 = Time(["1.001s", "2s", "3.002s"])
+    >>> all(t1.union([t3], tolerance="5ms") == Time(["1s", "2s", "3s", "4s"]))
+    True
+
     """
 
     @staticmethod
-    def _union_class(times: Sequence[types_time_like]) -> Time:
+    def _union_class(
+        times: Sequence[types_time_like], tolerance: types_timedelta_like = None
+    ) -> Time:
         """Class version of the ``union`` method."""
-        pandas_index = reduce(
-            lambda x, y: x.union(y),
-            (Time(time).as_pandas_index() for time in times),
-        )
-        return Time(pandas_index)
+        times = [Time(time) for time in times]
+        is_absolute = {time.is_absolute for time in times}
+        if len(is_absolute) != 1:
+            # let pandas handle (or reject) mixed absolute and relative inputs
+            pandas_index = reduce(
+                lambda x, y: x.union(y), (time.as_pandas_index() for time in times)
+            )
+            return Time(pandas_index)
+
+        if tolerance is not None:
+            tolerance = Time(tolerance).as_timedelta().value
+        values = _union_int64([time._as_int64() for time in times], tolerance)
+        if is_absolute.pop():
+            index = pd.DatetimeIndex(values.view("datetime64[ns]"))
+        else:
+            index = pd.TimedeltaIndex(values.view("timedelta64[ns]"))
 
-    def _union_instance(self, times: Sequence[types_time_like]) -> Time:
+        # keep a common non-nanosecond resolution of the inputs like pandas does
+        units = {getattr(time.as_pandas_index(), "unit", "ns") for time in times}
+        if len(units) == 1 and (unit := units.pop()) != "ns":
+            index = index.as_unit(unit)
+        return Time._from_trusted(index)
+
+    def _union_instance(
+        self, times: Sequence[types_time_like], tolerance: types_timedelta_like = None
+    ) -> Time:
         """Instance version of the ``union`` method."""
-        return Time._union_class([self, *times])
+        return Time._union_class([self, *times], tolerance)
+
+
+def _union_int64(arrays: Sequence[np.ndarray], tolerance: int = None) -> np.ndarray:
+    """Get the sorted union of multiple sorted int64 arrays.
+
+    All arrays are concatenated once and sorted with a stable sort. For int64 values,
+    numpy uses timsort, which detects the sorted input runs and merges them, so that
+    the costs are comparable to a k-way merge of the inputs.
+
+    Parameters
+    ----------
+    arrays :
+        Sorted int64 arrays.
+    tolerance :
+        Optional tolerance. Values of an array that are not further away from a value
+        of one of the preceding arrays than the tolerance are dropped. Values of the
+        same array are never merged.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted union without duplicates.
+
+    """
+    if tolerance is not None and tolerance > 0 and len(arrays) > 1:
+        values = _merge_within_tolerance(arrays, tolerance)
+    else:
+        values = np.concatenate(arrays)
+        values.sort(kind="stable")
+    if len(values) < 2:
+        return values
+    keep = np.empty(len(values), dtype=bool)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+def _merge_within_tolerance(arrays: Sequence[np.ndarray], tolerance: int) -> np.ndarray:
+    """Merge sorted int64 arrays and drop values close to values of preceding arrays.
+
+    Only values that have a neighbor within the tolerance in the sorted union can be
+    dropped. The arrays are reduced to these values and added one after another.
+    Each value is compared to its neighbors in the sorted values that were kept from
+    all preceding arrays and the remaining values are inserted at their sorted
+    positions.
+
+    """
+    values = np.concatenate(arrays)
+    order = np.argsort(values, kind="stable")
+    values = values[order]
+
+    close = np.diff(values) <= tolerance
+    candidates = np.zeros(len(values), dtype=bool)
+    candidates[1:] = close
+    candidates[:-1] |= close
+    if not candidates.any():
+        return values
+
+    is_candidate = np.empty(len(values), dtype=bool)
+    is_candidate[order] = candidates
+    offsets = np.cumsum([len(array) for array in arrays])[:-1]
+    arrays = [
+        np.asarray(array)[mask]
+        for array, mask in zip(arrays, np.split(is_candidate, offsets))
+    ]
+
+    kept = arrays[0]
+    for array in arrays[1:]:
+        if len(kept) == 0:
+            kept = array
+            continue
+        idx = np.searchsorted(kept, array)
+        left = kept[np.maximum(idx - 1, 0)]
+        right = kept[np.minimum(idx, len(kept) - 1)]
+        keep = (np.abs(array - left) > tolerance) & (np.abs(right - array) > tolerance)
+        kept = np.insert(kept, idx[keep], array[keep])
+
+    values = np.concatenate([values[~candidates], kept])
+    values.sort(kind="stable")
+    return values
 
 
 # list of types that are supported to be stored in Time._time
@@ -1,11 +1,12 @@
 """Contains methods and classes for coordinate transformations."""
 
-from .cs_manager import CoordinateSystemManager
+from .cs_manager import CompiledPath, CoordinateSystemManager
 from .local_cs import LocalCoordinateSystem
 from .rotation import WXRotation
 from .util import *
 
 __all__ = [
+    "CompiledPath",
     "CoordinateSystemManager",
     "LocalCoordinateSystem",
     "WXRotation",
@@ -10,17 +10,19 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
+import pint
 import xarray as xr
 
 from weldx import util
+from weldx.constants import _DEFAULT_LEN_UNIT, Q_, U_
 from weldx.core import TimeSeries
 from weldx.exceptions import WeldxException
 from weldx.geometry import SpatialData
-from weldx.time import Time, types_time_like, types_timestamp_like
+from weldx.time import Time, _union_int64, types_time_like, types_timestamp_like
 from weldx.types import UnitLike
 from weldx.util import check_matplotlib_available, dataclass_nested_eq
 
-from .local_cs import LocalCoordinateSystem
+from .local_cs import LocalCoordinateSystem, _time_as_int, _Transform
 from .types import types_coordinates, types_homogeneous, types_orientation
 
 # only import heavy-weight packages on type checking
@@ -29,7 +31,10 @@ if TYPE_CHECKING:  # pragma: no cover
     import networkx as nx
 
 
-__all__ = ["CoordinateSystemManager"]
+__all__ = ["CompiledPath", "CoordinateSystemManager"]
+
+_CS_CACHE_SIZE = 256
+"""Maximum number of `CoordinateSystemManager.get_cs` results that are cached."""
 
 
 class CoordinateSystemManager:
@@ -131,6 +136,11 @@ class CoordinateSystemManager:
         self._root_system_name = root_coordinate_system_name
         self._subsystems: list[CoordinateSystemManager.SubsystemInfo] = []
         self._graph = DiGraph()
+        self._cs_cache: dict[tuple, LocalCoordinateSystem] = {}
+        self._static_chain_cache: dict[tuple, LocalCoordinateSystem] = {}
+        self._edge_time_cache: dict[tuple, tuple[np.ndarray, bool] | None] = {}
+        self._time_union_cache: tuple[np.ndarray, bool] | None = None
+        self._tree_index: _TreeIndex | None = None
         self._add_coordinate_system_node(root_coordinate_system_name)
 
     def __repr__(self):
@@ -351,6 +361,31 @@ class CoordinateSystemManager:
         """
         return len(self.lcs_time_dependent)
 
+    def _invalidate_cs_cache(
+        self, keep_time_indexes: bool = False, keep_tree_index: bool = False
+    ):
+        """Drop all cached results of `get_cs` and the composed static sub-chains.
+
+        This needs to be called by every method that modifies the graph or its
+        transformations. The cached time indexes of the edges and the time union can
+        be kept if the existing transformations remain untouched. The tree index can
+        be kept if no system is removed or renamed.
+
+        """
+        self._cs_cache.clear()
+        self._static_chain_cache.clear()
+        if not keep_time_indexes:
+            self._edge_time_cache.clear()
+            self._time_union_cache = None
+        if not keep_tree_index:
+            self._tree_index = None
+
+    def _get_tree_index(self) -> _TreeIndex:
+        """Get the index of the tree structure, which is built on first use."""
+        if self._tree_index is None:
+            self._tree_index = _TreeIndex(self._graph, self._root_system_name)
+        return self._tree_index
+
     def _update_local_coordinate_system(
         self, node_from: str, node_to: str, lcs: LocalCoordinateSystem
     ):
@@ -480,6 +515,7 @@ class CoordinateSystemManager:
             raise TypeError(
                 "'local_coordinate_system' must be an instance of LocalCoordinateSystem"
             )
+        self._invalidate_cs_cache(keep_time_indexes=True, keep_tree_index=True)
 
         if (
             lcs.is_time_dependent  # always add static lcs
@@ -509,6 +545,7 @@ class CoordinateSystemManager:
                     f'Can not update coordinate system. "{reference_system_name}" is '
                     f"not a neighbor of {coordinate_system_name}"
                 )
+            self._invalidate_cs_cache(keep_tree_index=True)
             if lcs_child_in_parent:
                 self._update_local_coordinate_system(
                     coordinate_system_name,
@@ -524,17 +561,17 @@ class CoordinateSystemManager:
         else:
             self._check_coordinate_system_exists(reference_system_name)
             self._add_coordinate_system_node(coordinate_system_name)
-            if lcs_child_in_parent:
-                self._add_edges(
-                    coordinate_system_name,
-                    reference_system_name,
-                    lcs,
-                )
-            else:
-                self._add_edges(
-                    reference_system_name,
-                    coordinate_system_name,
-                    lcs,
+            edge = (coordinate_system_name, reference_system_name)
+            if not lcs_child_in_parent:
+                edge = (reference_system_name, coordinate_system_name)
+            self._add_edges(*edge, lcs)
+            if self._tree_index is not None:
+                self._tree_index.add(coordinate_system_name, reference_system_name)
+
+            # update the time union incrementally
+            if self._time_union_cache is not None and lcs.is_time_dependent:
+                self._time_union_cache = self._merge_time_indexes(
+                    [self._time_union_cache, self._get_edge_time_index(edge)]
                 )
 
     def relabel(self, mapping: dict[str, str]):
@@ -559,6 +596,7 @@ class CoordinateSystemManager:
         from networkx import relabel_nodes
 
         relabel_nodes(self.graph, mapping, copy=False)
+        self._invalidate_cs_cache()
 
     def assign_data(
         self,
@@ -614,6 +652,7 @@ class CoordinateSystemManager:
             reference_system = target_system
 
         self._graph.nodes[reference_system]["data"][data_name] = data
+        self._invalidate_cs_cache()
 
     def delete_data(self, data_name: str):
         """Remove the assigned data with given name.
@@ -906,14 +945,13 @@ class CoordinateSystemManager:
             )
 
         # update subsystems
-        from networkx import shortest_path
-
+        tree_index = self._get_tree_index()
         remove_systems = []
         for subsystem_info in self._subsystems:
             if (
                 coordinate_system_name in subsystem_info.members
-            ) or coordinate_system_name in shortest_path(
-                self.graph, subsystem_info.root, self._root_system_name
+            ) or coordinate_system_name in tree_index.path(
+                subsystem_info.root, self._root_system_name
             ):
                 remove_systems += [subsystem_info.name]
 
@@ -928,6 +966,7 @@ class CoordinateSystemManager:
             for child in children:
                 self._graph.remove_node(child)
         self._graph.remove_node(coordinate_system_name)
+        self._invalidate_cs_cache()
 
     def get_child_system_names(
         self, coordinate_system_name: str, neighbors_only: bool = True
@@ -1091,6 +1130,49 @@ class CoordinateSystemManager:
             return lcs.invert()
         return lcs
 
+    @staticmethod
+    def _get_cs_cache_key(
+        coordinate_system_name: str,
+        reference_system_name: str,
+        time: types_time_like,
+        time_ref: types_timestamp_like,
+    ) -> tuple | None:
+        """Get a hashable key for the `get_cs` result cache.
+
+        Returns `None` if the passed time values can not be converted into a key. In
+        this case, the result should not be cached.
+
+        """
+        try:
+            if time is None or isinstance(time, str):
+                time_key = time
+            else:
+                time = Time(time)
+                time_key = (
+                    time.is_absolute,
+                    time.index.values.view(np.int64).tobytes(),
+                )
+            if time_ref is not None:
+                time_ref = Time(time_ref).as_pandas()
+        except (TypeError, ValueError):
+            return None
+        return coordinate_system_name, reference_system_name, time_key, time_ref
+
+    def _is_static_edge(self, edge: tuple[str, str]) -> bool:
+        """Return `True` if the transformation on a graph edge is not time dependent."""
+        lcs = self.graph.edges[edge]["transformation"]
+        return lcs is not None and not lcs.is_time_dependent
+
+    def _get_static_chain(self, edges: tuple[tuple[str, str], ...]):
+        """Get the cached composition of consecutive static edges of a path."""
+        lcs = self._static_chain_cache.get(edges)
+        if lcs is None:
+            lcs = self.graph.edges[edges[0]]["transformation"]
+            for edge in edges[1:]:
+                lcs = lcs + self.graph.edges[edge]["transformation"]
+            self._static_chain_cache[edges] = lcs
+        return lcs
+
     def get_cs(
         self,
         coordinate_system_name: str,
@@ -1222,6 +1304,14 @@ class CoordinateSystemManager:
         angle between 2 ``keyframes``, further interpolations wrongly change the
         rotation order.
 
+        **Caching:**
+
+        Results are cached per combination of coordinate system, reference system,
+        time and reference time. Consecutive static transformations on the path are
+        composed only once and reused by all queries along the same path. Both caches
+        are cleared by all methods that modify the `CoordinateSystemManager`.
+        Every call returns a new system that shares the cached data as read-only arrays.
+
         """
         # check inputs
         if reference_system_name is None:
@@ -1238,13 +1328,68 @@ class CoordinateSystemManager:
         if coordinate_system_name == reference_system_name:
             return LocalCoordinateSystem()
 
-        # get path
-        from networkx import shortest_path
+        cache_key = self._get_cs_cache_key(
+            coordinate_system_name, reference_system_name, time, time_ref
+        )
+        if cache_key is not None and cache_key in self._cs_cache:
+            return self._cs_cache[cache_key]._shared_copy()
+
+        lcs_result = self._get_cs_uncached(
+            coordinate_system_name, reference_system_name, time, time_ref
+        )
 
-        path = shortest_path(self.graph, coordinate_system_name, reference_system_name)
+        if cache_key is not None:
+            if len(self._cs_cache) >= _CS_CACHE_SIZE:
+                del self._cs_cache[next(iter(self._cs_cache))]
+            self._cs_cache[cache_key] = lcs_result
+            return lcs_result._shared_copy()
+        return lcs_result
+
+    def _get_cs_uncached(
+        self,
+        coordinate_system_name: str,
+        reference_system_name: str,
+        time: types_time_like,
+        time_ref: types_timestamp_like,
+    ) -> LocalCoordinateSystem:
+        """Calculate the result of `get_cs` for two different systems."""
+        # get path
+        path = self._get_tree_index().path(
+            coordinate_system_name, reference_system_name
+        )
         path_edges = list(zip(path[:-1], path[1:]))
 
-        # handle time inputs
+        time, time_ref = self._get_cs_time(time, time_ref, path_edges)
+
+        # calculate result lcs
+        if len(path_edges) == 1:
+            return self._get_cs_on_edge(path_edges[0], time, time_ref, time_ref is None)
+
+        # only time dependent edges need to be recombined, static ones are cached
+        lcs_list = []
+        for is_static, edges in itertools.groupby(path_edges, self._is_static_edge):
+            edges = tuple(edges)
+            if is_static:
+                lcs_list.append(self._get_static_chain(edges))
+            else:
+                lcs_list += [self._get_cs_on_edge(e, time, time_ref) for e in edges]
+
+        lcs_result = lcs_list[0]
+        for lcs in lcs_list[1:]:
+            lcs_result += lcs
+        return lcs_result
+
+    def _get_cs_time(
+        self,
+        time: types_time_like,
+        time_ref: types_timestamp_like,
+        path_edges: list[tuple[str, str]],
+    ) -> tuple[Time | None, pd.Timestamp | None]:
+        """Get the time and reference time that are used by `get_cs`.
+
+        If no time is passed, the time union of the passed edges is returned.
+
+        """
         if time_ref is None:
             time_ref = self.reference_time
         if time is None:
@@ -1266,15 +1411,286 @@ class CoordinateSystemManager:
 
         if time is not None:
             time = Time(time, time_ref)
+        return time, time_ref
 
-        # calculate result lcs
-        if len(path_edges) == 1:
-            return self._get_cs_on_edge(path_edges[0], time, time_ref, time_ref is None)
+    def get_cs_many(
+        self,
+        coordinate_system_names: list[str],
+        reference_system_name: str = None,
+        time: types_time_like = None,
+        time_ref: types_timestamp_like = None,
+    ) -> dict[str, LocalCoordinateSystem]:
+        """Get multiple coordinate systems in relation to a common reference system.
 
-        lcs_result = self._get_cs_on_edge(path_edges[0], time, time_ref)
-        for edge in path_edges[1:]:
-            lcs_result += self._get_cs_on_edge(edge, time, time_ref)
-        return lcs_result
+        In contrast to calling `get_cs` for every system, the graph is only traversed
+        once starting at the reference system. The transformation of every system on
+        the way is calculated once and reused for all of its descendants.
+
+        Parameters
+        ----------
+        coordinate_system_names :
+            Names of the requested coordinate systems.
+        reference_system_name :
+            Name of the common reference system. If `None` is passed, the root system
+            is used.
+        time :
+            Specifies the desired time of the returned coordinate systems. If `None` is
+            passed, the time union of all transformations between the requested
+            systems and the reference system is used for all of them.
+        time_ref :
+            The desired reference time of the returned coordinate systems.
+
+        Returns
+        -------
+        dict[str, LocalCoordinateSystem] :
+            The requested coordinate systems by name.
+
+        See Also
+        --------
+        get_cs
+        get_homogeneous_matrices
+
+        Examples
+        --------
+        >>> from weldx import CoordinateSystemManager, Q_
+        >>>
+        >>> csm = CoordinateSystemManager("root")
+        >>> csm.create_cs("a", "root", coordinates=Q_([1, 0, 0], "mm"))
+        >>> csm.create_cs("b", "a", coordinates=Q_([0, 2, 0], "mm"))
+        >>> lcs = csm.get_cs_many(["a", "b"])
+        >>> lcs["b"].coordinates.data
+        <Quantity([1. 2. 0.], 'millimeter')>
+
+        """
+        if reference_system_name is None:
+            reference_system_name = self._root_system_name
+        self._check_coordinate_system_exists(reference_system_name)
+        for name in coordinate_system_names:
+            self._check_coordinate_system_exists(name)
+
+        # every system points to its neighbor on the path towards the reference system
+        tree_index = self._get_tree_index()
+        successors = {}
+        path_edges = {}
+        for name in coordinate_system_names:
+            path = tree_index.path(name, reference_system_name)
+            for node, successor in zip(path[:-1], path[1:]):
+                if node in successors:
+                    break
+                successors[node] = successor
+                path_edges[node] = (node, successor)
+
+        time, time_ref = self._get_cs_time(time, time_ref, list(path_edges.values()))
+
+        composed: dict[str, LocalCoordinateSystem] = {}
+        lcs_dict = {}
+        for name in coordinate_system_names:
+            chain = []
+            node = name
+            while node != reference_system_name and node not in composed:
+                chain.append(node)
+                node = successors[node]
+            for child in reversed(chain):
+                lcs = self._get_cs_on_edge(path_edges[child], time, time_ref)
+                if node != reference_system_name:
+                    lcs = lcs + composed[node]
+                composed[child] = lcs
+                node = child
+
+            if name == reference_system_name:
+                lcs_dict[name] = LocalCoordinateSystem()
+            elif successors[name] == reference_system_name and time_ref is None:
+                # same special case as in get_cs for direct neighbors
+                lcs_dict[name] = self._get_cs_on_edge(
+                    path_edges[name], time, time_ref, True
+                )
+            else:
+                lcs_dict[name] = composed[name]
+
+        return lcs_dict
+
+    def get_homogeneous_matrices(
+        self,
+        coordinate_system_names: list[str],
+        translation_unit: UnitLike,
+        reference_system_name: str = None,
+        time: types_time_like = None,
+        time_ref: types_timestamp_like = None,
+    ) -> np.ndarray:
+        """Get the homogeneous matrices of multiple systems as a single array.
+
+        The systems are calculated with `get_cs_many`.
+
+        Parameters
+        ----------
+        coordinate_system_names :
+            Names of the requested coordinate systems.
+        translation_unit :
+            The unit of the translation part of the matrices.
+        reference_system_name :
+            Name of the common reference system. If `None` is passed, the root system
+            is used.
+        time :
+            Specifies the desired time of the returned matrices. If `None` is passed,
+            the time union of all transformations between the requested systems and
+            the reference system is used for all of them.
+        time_ref :
+            The desired reference time of the returned matrices.
+
+        Returns
+        -------
+        numpy.ndarray :
+            The stacked homogeneous transformation matrices with shape
+            ``(n_systems, n_time, 4, 4)``. Static systems are broadcast along the time
+            axis.
+
+        See Also
+        --------
+        get_cs_many
+
+        Examples
+        --------
+        >>> from weldx import CoordinateSystemManager, Q_
+        >>>
+        >>> csm = CoordinateSystemManager("root")
+        >>> csm.create_cs("a", "root", coordinates=Q_([1, 0, 0], "mm"))
+        >>> csm.create_cs("b", "a", coordinates=Q_([0, 2, 0], "mm"))
+        >>> csm.get_homogeneous_matrices(["a", "b"], "mm").shape
+        (2, 1, 4, 4)
+
+        """
+        lcs_dict = self.get_cs_many(
+            coordinate_system_names, reference_system_name, time, time_ref
+        )
+        matrices = [
+            np.reshape(
+                lcs_dict[name].as_homogeneous_matrix(translation_unit), (-1, 4, 4)
+            )
+            for name in coordinate_system_names
+        ]
+        num_times = max((m.shape[0] for m in matrices), default=1)
+        matrices = [np.broadcast_to(m, (num_times, 4, 4)) for m in matrices]
+        return np.reshape(matrices, (-1, num_times, 4, 4))
+
+    def compile_path(
+        self,
+        coordinate_system_name: str,
+        reference_system_name: str,
+        translation_unit: UnitLike = None,
+    ) -> CompiledPath:
+        """Compile the transformation between two systems for repeated evaluations.
+
+        The path between both systems is resolved once. Consecutive static
+        transformations are composed into a single one and only the discrete data of
+        the time dependent transformations is kept. Evaluating the returned object
+        at a point in time requires neither graph operations nor the creation of
+        `LocalCoordinateSystem` instances.
+
+        Note that later modifications of the `CoordinateSystemManager` are not
+        reflected by the compiled path.
+
+        Parameters
+        ----------
+        coordinate_system_name :
+            Name of the coordinate system that should be transformed.
+        reference_system_name :
+            Name of the reference system.
+        translation_unit :
+            The unit of the returned coordinates. If `None` is passed, millimeters are
+            used.
+
+        Returns
+        -------
+        CompiledPath :
+            A callable that returns the orientations and coordinates of the coordinate
+            system in the reference system at the passed times.
+
+        See Also
+        --------
+        get_cs
+
+        Examples
+        --------
+        >>> from weldx import CoordinateSystemManager, Q_
+        >>>
+        >>> csm = CoordinateSystemManager("root")
+        >>> csm.create_cs(
+        ...     "a", "root", coordinates=Q_([[0, 0, 0], [4, 0, 0]], "mm"),
+        ...     time=Q_([0, 4], "s")
+        ... )
+        >>> csm.create_cs("b", "a", coordinates=Q_([0, 2, 0], "mm"))
+        >>> path = csm.compile_path("b", "root")
+        >>> orientation, coordinates = path(Q_([1, 2], "s"))
+        >>> coordinates
+        array([[1., 2., 0.],
+               [2., 2., 0.]])
+
+        """
+        self._check_coordinate_system_exists(coordinate_system_name)
+        self._check_coordinate_system_exists(reference_system_name)
+        unit = _DEFAULT_LEN_UNIT if translation_unit is None else U_(translation_unit)
+
+        path = self._get_tree_index().path(
+            coordinate_system_name, reference_system_name
+        )
+
+        edges = []
+        for edge in zip(path[:-1], path[1:]):
+            lcs = self.graph.edges[edge]["transformation"]
+            invert = lcs is None
+            if invert:
+                lcs = self.graph.edges[(edge[1], edge[0])]["transformation"]
+            if lcs.has_timeseries:
+                raise WeldxException(
+                    "Paths with coordinate systems that use a 'TimeSeries' as "
+                    "coordinates can not be compiled."
+                )
+            edges.append((lcs, invert))
+
+        time_ref = self.reference_time
+        if time_ref is None:
+            has_time_ref = {
+                lcs.has_reference_time for lcs, _ in edges if lcs.is_time_dependent
+            }
+            if len(has_time_ref) > 1:
+                raise TypeError(
+                    "Only 1 reference time provided for time dependent coordinate "
+                    "system. Either the reference time of the coordinate system or the "
+                    "one passed to the function is 'None'. Only cases where the "
+                    "reference times are both 'None' or both contain a timestamp are "
+                    "allowed. Also check that the reference time has the correct type."
+                )
+            time_ref = min(
+                (lcs.reference_time for lcs, _ in edges if lcs.has_reference_time),
+                default=None,
+            )
+
+        steps = []
+        static = None
+        for lcs, invert in edges:
+            transform = lcs._get_transform()
+            if not transform.is_time_dependent:
+                if invert:
+                    transform = transform.invert()
+                static = transform if static is None else static.compose(transform)
+                continue
+            if static is not None:
+                steps.append((static, False))
+                static = None
+            if transform.time_ref is not None:
+                transform = transform.with_time_ref(time_ref)
+            steps.append((transform, invert))
+        if static is not None:
+            steps.append((static, False))
+
+        return CompiledPath(
+            coordinate_system_name,
+            reference_system_name,
+            steps,
+            unit,
+            time_ref,
+            time_ref is not None and self.reference_time is None,
+        )
 
     def get_parent_system_name(self, coordinate_system_name) -> str | None:
         """Get the name of a coordinate systems parent system.
@@ -1297,12 +1713,8 @@ class CoordinateSystemManager:
         if coordinate_system_name == self._root_system_name:
             return None
 
-        from networkx import shortest_path
-
         self._check_coordinate_system_exists(coordinate_system_name)
-        path = shortest_path(self.graph, coordinate_system_name, self._root_system_name)
-
-        return path[1]
+        return self._get_tree_index().parent[coordinate_system_name]
 
     def has_coordinate_system(self, coordinate_system_name: str) -> bool:
         """Return `True` if a coordinate system with specified name already exists.
@@ -1374,6 +1786,7 @@ class CoordinateSystemManager:
 
         """
         if in_place:
+            self._invalidate_cs_cache()
             if affected_coordinate_systems is not None:
                 if isinstance(affected_coordinate_systems, str):
                     affected_coordinate_systems = [affected_coordinate_systems]
@@ -1710,38 +2123,71 @@ class CoordinateSystemManager:
 
         """
         if list_of_edges is None:
-            lcs_list = self.lcs_time_dependent
+            if self._time_union_cache is None:
+                self._time_union_cache = self._merge_time_indexes(
+                    [
+                        self._get_edge_time_index(edge)
+                        for edge in self.graph.edges
+                        if self.graph.edges[edge]["defined"]
+                        and self.graph.edges[edge]["transformation"].is_time_dependent
+                    ]
+                )
+            time_index = self._time_union_cache
         else:
+            time_index = self._merge_time_indexes(
+                [self._get_edge_time_index(edge) for edge in list_of_edges]
+            )
 
-            def _get_lcs(edge):
-                lcs = self.graph.edges[edge]["transformation"]
-                if lcs is not None:
-                    return lcs
-                return self.graph.edges[(edge[1], edge[0])]["transformation"]
-
-            lcs_list = [_get_lcs(edge) for edge in list_of_edges]
-        lcs_list = [lcs for lcs in lcs_list if lcs.time is not None]
-
-        if not lcs_list:
+        if time_index is None:
             return None
+        values, is_absolute = time_index
+        if is_absolute:
+            return Time._from_trusted(pd.DatetimeIndex(values.view("datetime64[ns]")))
+        return Time._from_nanoseconds(values)
 
-        reference_time = self.reference_time
-        if self.uses_absolute_times and not reference_time:
-            reference_time = min(
-                lcs.reference_time
-                for lcs in self.lcs_time_dependent
-                if lcs.reference_time
-            )
+    def _get_edge_time_index(self, edge: tuple[str, str]) -> tuple[np.ndarray, bool]:
+        """Get the cached and sorted time values of the transformation on an edge.
+
+        The values are int64 nanoseconds. If the transformation or the
+        `CoordinateSystemManager` has a reference time, the values are absolute and
+        the second returned value is `True`. `None` is returned for systems without
+        time.
 
-        time_list = [Time(lcs.time, reference_time) for lcs in lcs_list]
+        """
+        if not self.graph.edges[edge]["defined"]:
+            edge = (edge[1], edge[0])
+        if edge not in self._edge_time_cache:
+            time = self.graph.edges[edge]["transformation"].time
+            time_index = None
+            if time is not None:
+                values = _time_as_int(time)
+                is_absolute = time.is_absolute or self.has_reference_time
+                if time.is_absolute:
+                    values = values + time.reference_time.value
+                elif is_absolute:
+                    values = values + self.reference_time.value
+                time_index = (np.unique(values), is_absolute)
+            self._edge_time_cache[edge] = time_index
+        return self._edge_time_cache[edge]
 
-        return Time.union(time_list)
+    @staticmethod
+    def _merge_time_indexes(
+        time_indexes: list[tuple[np.ndarray, bool] | None],
+    ) -> tuple[np.ndarray, bool] | None:
+        """Merge multiple time indexes of `_get_edge_time_index` into a sorted union."""
+        time_indexes = [t for t in time_indexes if t is not None]
+        if not time_indexes:
+            return None
+        values = _union_int64([values for values, _ in time_indexes])
+        return values, any(is_absolute for _, is_absolute in time_indexes)
 
     def transform_data(
         self,
         data: types_coordinates,
         source_coordinate_system_name: str,
         target_coordinate_system_name: str,
+        chunk_size: int = None,
+        out: np.ndarray = None,
     ) -> SpatialData | xr.DataArray:
         """Transform spatial data from one coordinate system to another.
 
@@ -1757,12 +2203,29 @@ class CoordinateSystemManager:
         target_coordinate_system_name :
             Name of the coordinate system the data
             should be transformed to
+        chunk_size :
+            If provided, the data is transformed block by block. A block contains
+            ``chunk_size`` time steps or, if the result is not time dependent,
+            ``chunk_size`` entries of the leading dimension. This limits the size of
+            intermediate arrays for large point clouds.
+        out :
+            An optional preallocated array like a `numpy.memmap` that receives the
+            magnitudes of the transformed data. Its shape must match the result, which
+            has the ``time`` dimension first and the ``c`` dimension last.
 
         Returns
         -------
         Union[weldx.geometry.SpatialData, xarray.DataArray]
             Transformed data
 
+        Notes
+        -----
+        If ``chunk_size`` or ``out`` is specified or the data is backed by a dask
+        array, the transformation is performed block wise. The result has the unit of
+        the input data and is ordered as described for the ``out`` parameter. Dask
+        backed data is transformed lazily unless ``out`` is given, in which case the
+        blocks are computed and stored into ``out``.
+
         """
         if isinstance(data, SpatialData):
             return SpatialData(
@@ -1770,6 +2233,8 @@ class CoordinateSystemManager:
                     data.coordinates,
                     source_coordinate_system_name,
                     target_coordinate_system_name,
+                    chunk_size=chunk_size,
+                    out=out,
                 ),
                 attributes=data.attributes,
                 triangles=data.triangles,
@@ -1782,6 +2247,9 @@ class CoordinateSystemManager:
             source_coordinate_system_name, target_coordinate_system_name, time=time
         )
 
+        if chunk_size is not None or out is not None or data.chunks is not None:
+            return _transform_data_blockwise(data, lcs, chunk_size, out)
+
         mul = util.xr_matmul(
             lcs.orientation, data, dims_a=["c", "v"], dims_b=["c"], dims_out=["c"]
         )
@@ -1834,6 +2302,7 @@ class CoordinateSystemManager:
 
         if graph is not None:
             csm._graph = graph
+            csm._invalidate_cs_cache()
 
         return csm
 
@@ -1908,6 +2377,7 @@ class CoordinateSystemManager:
 
         self._graph = compose(self._graph, other.graph)
         self._graph.nodes[common_node]["data"] = joined_data
+        self._invalidate_cs_cache()
 
         self._subsystems.append(
             self.SubsystemInfo(
@@ -1957,6 +2427,7 @@ class CoordinateSystemManager:
 
         subsystems = self.subsystems
         self.remove_subsystems()
+        self._invalidate_cs_cache()
 
         lcs_rem = [lcs for lcs in lcs_rem if lcs not in self.coordinate_system_names]
         for sub in subsystems:
@@ -2029,3 +2500,290 @@ class CoordinateSystemManager:
             subsystem_list.append(csm_sub)
 
         return subsystem_list
+
+
+def _transform_points(
+    orientation: np.ndarray, coordinates: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """Rotate and translate an array of points.
+
+    If the orientation is time dependent, the first axis of ``points`` is interpreted
+    as time axis.
+    """
+    if orientation.ndim == 3:
+        shape = (orientation.shape[0],) + (1,) * (points.ndim - 2)
+        orientation = orientation.reshape(*shape, 3, 3)
+        coordinates = coordinates.reshape(*shape, 3)
+    return np.einsum("...ij,...j->...i", orientation, points) + coordinates
+
+
+def _transform_data_blockwise(
+    data: xr.DataArray,
+    lcs: LocalCoordinateSystem,
+    chunk_size: int | None,
+    out: np.ndarray | None,
+) -> xr.DataArray:
+    """Transform spatial data block by block.
+
+    See `CoordinateSystemManager.transform_data` for a description of the parameters.
+    """
+    data = data.transpose(*(["time"] if "time" in data.dims else []), ..., "c")
+    if isinstance(data.data, pint.Quantity):
+        unit = data.data.u
+        magnitude = data.data.m
+    else:
+        unit = lcs.coordinates.data.u
+        magnitude = data.data
+    coords = dict(data.coords)
+    dims = list(data.dims)
+
+    orientation = lcs.orientation.transpose(..., "c", "v").data
+    coordinates = lcs.coordinates.transpose(..., "c").data.to(unit).m
+    is_dask = data.chunks is not None
+
+    time_dependent = lcs.is_time_dependent
+    if time_dependent:
+        num_times = len(lcs.time)
+        orientation = np.broadcast_to(orientation, (num_times, 3, 3))
+        coordinates = np.broadcast_to(coordinates, (num_times, 3))
+        if "time" not in dims:
+            shape = (num_times, *magnitude.shape)
+            if is_dask:
+                import dask.array as da
+
+                magnitude = da.broadcast_to(
+                    magnitude[np.newaxis], shape, chunks=(num_times, *magnitude.chunks)
+                )
+            else:
+                magnitude = np.broadcast_to(magnitude[np.newaxis], shape)
+            dims = ["time", *dims]
+            coords["time"] = lcs.dataset.time
+
+    if out is not None and out.shape != magnitude.shape:
+        raise ValueError(
+            f"The shape {out.shape} of 'out' does not match the shape "
+            f"{magnitude.shape} of the transformed data."
+        )
+
+    if is_dask:
+        magnitude = magnitude.rechunk(
+            {0: chunk_size or "auto", -1: -1} if magnitude.ndim > 1 else {-1: -1}
+        )
+
+        def _transform_block(block, block_info=None):
+            if not time_dependent:
+                return _transform_points(orientation, coordinates, block)
+            sl = slice(*block_info[0]["array-location"][0])
+            return _transform_points(orientation[sl], coordinates[sl], block)
+
+        result = magnitude.map_blocks(_transform_block, dtype=float)
+        if out is not None:
+            result.store(out)
+            result = out
+    else:
+        if out is None:
+            out = np.empty(magnitude.shape)
+        if magnitude.ndim == 1:
+            out[...] = _transform_points(orientation, coordinates, magnitude)
+        else:
+            step = chunk_size or max(len(magnitude), 1)
+            for start in range(0, len(magnitude), step):
+                sl = slice(start, start + step)
+                if time_dependent:
+                    out[sl] = _transform_points(
+                        orientation[sl], coordinates[sl], magnitude[sl]
+                    )
+                else:
+                    out[sl] = _transform_points(orientation, coordinates, magnitude[sl])
+        result = out
+
+    return xr.DataArray(Q_(result, unit), dims=dims, coords=coords, attrs=data.attrs)
+
+
+class _TreeIndex:
+    """Parent pointers, depths and ancestor tables of the coordinate system tree.
+
+    The ancestor table of each system stores its ancestors at the distances
+    ``1, 2, 4, ...``. It is used to find the lowest common ancestor of two systems
+    in logarithmic time.
+
+    """
+
+    def __init__(self, graph: nx.DiGraph, root: str):
+        self.parent: dict[str, str | None] = {root: None}
+        self.depth: dict[str, int] = {root: 0}
+        self.ancestors: dict[str, list[str]] = {root: []}
+
+        adjacency = graph.adj
+        queue = [root]
+        for node in queue:  # breadth first, so parents are added before children
+            for child in adjacency[node]:
+                if child not in self.parent:
+                    self.add(child, node)
+                    queue.append(child)
+
+    def add(self, node: str, parent: str):
+        """Add a new leaf system."""
+        self.parent[node] = parent
+        self.depth[node] = self.depth[parent] + 1
+        ancestors = [parent]
+        while len(ancestors) <= len(self.ancestors[ancestors[-1]]):
+            ancestors.append(self.ancestors[ancestors[-1]][len(ancestors) - 1])
+        self.ancestors[node] = ancestors
+
+    def _get_ancestor(self, node: str, distance: int) -> str:
+        """Get the ancestor of a node at the given distance."""
+        level = 0
+        while distance:
+            if distance & 1:
+                node = self.ancestors[node][level]
+            distance >>= 1
+            level += 1
+        return node
+
+    def lowest_common_ancestor(self, node_0: str, node_1: str) -> str:
+        """Get the deepest system that is an ancestor of both passed systems."""
+        if self.depth[node_0] < self.depth[node_1]:
+            node_0, node_1 = node_1, node_0
+        node_0 = self._get_ancestor(node_0, self.depth[node_0] - self.depth[node_1])
+        if node_0 == node_1:
+            return node_0
+        for level in reversed(range(len(self.ancestors[node_0]))):
+            ancestors_0 = self.ancestors[node_0]
+            ancestors_1 = self.ancestors[node_1]
+            if level < len(ancestors_0) and ancestors_0[level] != ancestors_1[level]:
+                node_0 = ancestors_0[level]
+                node_1 = ancestors_1[level]
+        return self.parent[node_0]
+
+    def path(self, node_0: str, node_1: str) -> list[str]:
+        """Get the systems on the path between two systems, including both."""
+        ancestor = self.lowest_common_ancestor(node_0, node_1)
+        path_0 = [node_0]
+        while path_0[-1] != ancestor:
+            path_0.append(self.parent[path_0[-1]])
+        path_1 = []
+        while node_1 != ancestor:
+            path_1.append(node_1)
+            node_1 = self.parent[node_1]
+        return path_0 + path_1[::-1]
+
+
+class CompiledPath:
+    """Precompiled transformation between two systems of a `CoordinateSystemManager`.
+
+    Instances are created by `CoordinateSystemManager.compile_path`. Calling them with
+    a time value or array returns the orientation matrices and the coordinate
+    magnitudes of the coordinate system in the reference system as numpy arrays.
+
+    """
+
+    def __init__(
+        self,
+        coordinate_system_name: str,
+        reference_system_name: str,
+        steps: list[tuple[_Transform, bool]],
+        unit: pint.Unit,
+        time_ref: pd.Timestamp | None,
+        requires_absolute_time: bool,
+    ):
+        self.coordinate_system_name = coordinate_system_name
+        self.reference_system_name = reference_system_name
+        self.unit = unit
+        self.time_ref = time_ref
+        self._requires_absolute_time = requires_absolute_time
+        self._steps = [
+            (transform, invert, Q_(1.0, transform.unit).to(unit).m)
+            for transform, invert in steps
+        ]
+
+    def __repr__(self):
+        """Give a short description of the compiled path."""
+        num_dynamic = sum(t.is_time_dependent for t, *_ in self._steps)
+        return (
+            f"<CompiledPath {self.coordinate_system_name} -> "
+            f"{self.reference_system_name} ({num_dynamic} time dependent steps)>"
+        )
+
+    @property
+    def is_time_dependent(self) -> bool:
+        """Return `True` if the compiled transformation is time dependent."""
+        return any(t.is_time_dependent for t, *_ in self._steps)
+
+    def _get_time(self, time: types_time_like, time_ref: types_timestamp_like):
+        """Get the time as int64 nanoseconds relative to the paths reference time."""
+        if (
+            time_ref is None
+            and not self._requires_absolute_time
+            and isinstance(time, (np.ndarray, np.timedelta64))
+            and time.dtype.kind == "m"
+        ):
+            return np.atleast_1d(time).astype("timedelta64[ns]").view(np.int64)
+
+        time = Time(time, time_ref)
+        time_int = _time_as_int(time)
+        if not time.is_absolute:
+            if self._requires_absolute_time:
+                raise TypeError(
+                    "The path contains systems with reference times. Provide "
+                    "absolute times or a reference time."
+                )
+            return time_int
+        if self.time_ref is None:
+            raise TypeError(
+                "The path has no reference time. Only time deltas are supported."
+            )
+        return time_int + (time.reference_time - self.time_ref).value
+
+    def __call__(
+        self, time: types_time_like = None, time_ref: types_timestamp_like = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate the transformation.
+
+        Parameters
+        ----------
+        time :
+            The time values at which the transformation is evaluated. It can only be
+            `None` if the transformation is static. Arrays of `numpy.timedelta64`
+            values are used without further conversion.
+        time_ref :
+            An optional reference time of the passed time values.
+
+        Returns
+        -------
+        numpy.ndarray :
+            The orientation matrices with shape ``(n, 3, 3)`` or ``(3, 3)`` for a
+            single or no time value.
+        numpy.ndarray :
+            The coordinates in the unit of the path with shape ``(n, 3)`` or ``(3,)``.
+
+        """
+        scalar = time is None or (
+            not isinstance(time, Time)
+            and np.ndim(getattr(time, "magnitude", time)) == 0
+        )
+        time_int = None if time is None else self._get_time(time, time_ref)
+
+        orientation = np.eye(3)
+        coordinates = np.zeros(3)
+        for transform, invert, scale in self._steps:
+            if transform.is_time_dependent:
+                if time_int is None:
+                    raise ValueError("A time is required for time dependent paths.")
+                transform = transform.interp_time(time_int, transform.time_ref)
+                if invert:
+                    transform = transform.invert()
+            r = transform.orientation
+            coordinates = (
+                np.einsum("...ij,...j->...i", r, coordinates)
+                + transform.coordinates * scale
+            )
+            orientation = np.matmul(r, orientation)
+
+        if scalar:
+            return orientation.reshape(3, 3), coordinates.reshape(3)
+        num_times = len(time_int)
+        return (
+            np.broadcast_to(orientation, (num_times, 3, 3)).copy(),
+            np.broadcast_to(coordinates, (num_times, 3)).copy(),
+        )
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import typing
 import warnings
-from copy import deepcopy
 from typing import Any
 
 import numpy as np
@@ -12,9 +11,10 @@ import pandas as pd
 import pint
 import xarray as xr
 from scipy.spatial.transform import Rotation as Rot
+from scipy.spatial.transform import Slerp
 
 import weldx.util as ut
-from weldx.constants import _DEFAULT_LEN_UNIT, Q_
+from weldx.constants import _DEFAULT_LEN_UNIT, Q_, U_
 from weldx.core import TimeSeries
 from weldx.exceptions import WeldxException
 from weldx.time import Time, TimeDependent, types_time_like, types_timestamp_like
@@ -25,6 +25,7 @@ from weldx.transformations.types import (
 )
 from weldx.transformations.util import normalize
 from weldx.types import UnitLike
+from weldx.util.util import _is_dask_array
 
 __all__ = ("LocalCoordinateSystem",)
 
@@ -112,7 +113,8 @@ class LocalCoordinateSystem(TimeDependent):
             coordinates.name = "coordinates"
             dataset_items.append(coordinates)
 
-        self._dataset = xr.merge(dataset_items, join="exact")
+        self._xr_dataset = xr.merge(dataset_items, join="exact")
+        self._transform: _Transform | None = None
 
         self._time_ref = time_cls.reference_time if isinstance(time_cls, Time) else None
         if "time" in self._dataset and self._time_ref is not None:
@@ -166,54 +168,14 @@ class LocalCoordinateSystem(TimeDependent):
             Resulting coordinate system.
 
         """
-        lhs_cs = self
-
-        if isinstance(lhs_cs.coordinates, TimeSeries) or isinstance(
-            rhs_cs.coordinates, TimeSeries
-        ):
+        if self._coord_ts is not None or rhs_cs._coord_ts is not None:
             raise WeldxException(
                 "Addition of coordinate systems that use a 'TimeSeries' as coordinates "
                 "is not supported. Use 'interp_time' to create discrete values."
             )
 
-        # handle time
-        # TODO: time var is unused! why? The var should be used in line 201?
-        # e.g. ... rhs_cs.interp_time(lhs_cs.time, time_ref)
-        time = lhs_cs.time
-        if time is None:
-            time = rhs_cs.time
-
-        # handle reference times
-        if (
-            lhs_cs.reference_time != rhs_cs.reference_time
-            and lhs_cs.has_reference_time
-            and rhs_cs.has_reference_time
-        ):
-            if lhs_cs.reference_time < rhs_cs.reference_time:
-                time_ref = lhs_cs.reference_time
-                rhs_cs = deepcopy(rhs_cs)
-                rhs_cs.reset_reference_time(time_ref)
-            else:
-                time_ref = rhs_cs.reference_time
-                lhs_cs = deepcopy(lhs_cs)
-                lhs_cs.reset_reference_time(time_ref)
-        elif not lhs_cs.has_reference_time:
-            time_ref = rhs_cs.reference_time
-        else:
-            time_ref = lhs_cs.reference_time
-
-        # interpolate rhs time to match lhs
-        rhs_cs = rhs_cs.interp_time(lhs_cs.time, time_ref)
-
-        # calculate resulting orientation and coordinates
-        orientation = ut.xr_matmul(
-            rhs_cs.orientation, lhs_cs.orientation, dims_a=["c", "v"]
-        )
-        coordinates = (
-            ut.xr_matmul(rhs_cs.orientation, lhs_cs.coordinates, ["c", "v"], ["c"])
-            + rhs_cs.coordinates
-        )
-        return LocalCoordinateSystem(orientation, coordinates, time_ref=time_ref)
+        transform = self._get_transform().compose(rhs_cs._get_transform())
+        return LocalCoordinateSystem._from_transform(transform)
 
     def __sub__(self, rhs_cs: LocalCoordinateSystem) -> LocalCoordinateSystem:
         """Subtract 2 coordinate systems.
@@ -271,6 +233,45 @@ class LocalCoordinateSystem(TimeDependent):
 
     __hash__ = None
 
+    @property
+    def _dataset(self) -> xr.Dataset:
+        """Get the internal dataset, which is created lazily for internal results."""
+        if self._xr_dataset is None:
+            self._xr_dataset = self._transform.to_dataset()
+        return self._xr_dataset
+
+    @classmethod
+    def _from_transform(cls, transform: _Transform) -> LocalCoordinateSystem:
+        """Create a coordinate system from its array representation without checks."""
+        lcs = cls.__new__(cls)
+        lcs._coord_ts = None
+        lcs._time_ref = transform.time_ref
+        lcs._xr_dataset = None
+        lcs._transform = transform
+        return lcs
+
+    def _shared_copy(self) -> LocalCoordinateSystem:
+        """Get a copy that shares the data of the system as read-only arrays.
+
+        In-place methods of the copy, like `reset_reference_time`, do not affect the
+        original system.
+
+        """
+        if self._coord_ts is not None:
+            lcs = type(self).__new__(type(self))
+            lcs._coord_ts = self._coord_ts
+            lcs._time_ref = self._time_ref
+            lcs._xr_dataset = self._dataset.copy(deep=False)
+            lcs._transform = None
+            return lcs
+        return self._from_transform(self._get_transform().read_only())
+
+    def _get_transform(self) -> _Transform:
+        """Get the array representation of a system without `TimeSeries`."""
+        if self._transform is None:
+            self._transform = _Transform.from_dataset(self.dataset, self.reference_time)
+        return self._transform
+
     @staticmethod
     def _build_orientation(
         orientation: types_orientation,
@@ -283,7 +284,9 @@ class LocalCoordinateSystem(TimeDependent):
         if not isinstance(orientation, xr.DataArray):
             if isinstance(orientation, Rot):
                 orientation = orientation.as_matrix()
-            elif not isinstance(orientation, np.ndarray):
+            elif not isinstance(orientation, np.ndarray) and not _is_dask_array(
+                orientation
+            ):
                 orientation = np.array(orientation)
             orientation = ut.xr_3d_matrix(orientation, time)
 
@@ -351,7 +354,13 @@ class LocalCoordinateSystem(TimeDependent):
 
     @staticmethod
     def _check_and_normalize_orientation(orientation: xr.DataArray) -> xr.DataArray:
-        """Check if the orientation has the correct format and normalize it."""
+        """Check if the orientation has the correct format and normalize it.
+
+        Dask backed orientations are only checked eagerly at their first and last
+        time step. The normalization and the checks of the remaining data are deferred
+        until the data is computed.
+
+        """
         ut.xr_check_coords(
             orientation,
             dict(
@@ -361,6 +370,18 @@ class LocalCoordinateSystem(TimeDependent):
             ),
         )
 
+        if _is_dask_array(orientation.data):
+            sample = orientation
+            if "time" in orientation.dims:
+                sample = orientation.isel(time=[0, -1])
+            LocalCoordinateSystem._check_and_normalize_orientation(sample.compute())
+
+            c_axis, v_axis = orientation.get_axis_num(["c", "v"])
+            data = orientation.data.rechunk({c_axis: -1, v_axis: -1}).map_blocks(
+                _normalize_orientation_block, c_axis, v_axis, dtype=float
+            )
+            return orientation.copy(data=data)
+
         orientation = xr.apply_ufunc(
             normalize,
             orientation,
@@ -478,6 +499,46 @@ class LocalCoordinateSystem(TimeDependent):
         orientation = Rot.from_euler(sequence, angles, degrees)
         return cls(orientation, coordinates=coordinates, time=time, time_ref=time_ref)
 
+    @classmethod
+    def _from_homogeneous_transformation_view(
+        cls,
+        transformation_matrix: types_homogeneous,
+        translation_unit: UnitLike,
+        time: types_time_like,
+        time_ref: types_timestamp_like,
+    ) -> LocalCoordinateSystem:
+        """Wrap homogeneous transformation matrices without copying them."""
+        if isinstance(transformation_matrix, xr.DataArray):
+            transformation_matrix = transformation_matrix.data
+        matrix = np.asarray(transformation_matrix)
+        if matrix.shape[-2:] != (4, 4) or matrix.ndim not in (2, 3):
+            raise ValueError(
+                "Homogeneous transformation matrices need a shape of (4, 4) or "
+                f"(n, 4, 4). The passed array has the shape {matrix.shape}."
+            )
+
+        time_int = None
+        if matrix.ndim == 3:
+            if time is None:
+                raise ValueError("Time dependent matrices require time values.")
+            time = Time(time, time_ref)
+            if len(time) != matrix.shape[0]:
+                raise ValueError(
+                    f"The number of time values ({len(time)}) does not match the "
+                    f"number of matrices ({matrix.shape[0]})."
+                )
+            time_int = _time_as_int(time)
+            time_ref = time.reference_time
+
+        transform = _Transform(
+            matrix[..., :3, :3],
+            matrix[..., :3, 3],
+            U_(translation_unit),
+            time_int,
+            time_ref,
+        )
+        return cls._from_transform(transform)
+
     @classmethod
     def from_axis_vectors(
         cls,
@@ -552,6 +613,7 @@ class LocalCoordinateSystem(TimeDependent):
         translation_unit: UnitLike,
         time: types_time_like = None,
         time_ref: types_timestamp_like = None,
+        construction_checks: bool = True,
     ) -> LocalCoordinateSystem:
         """Construct a local coordinate system from a homogeneous transformation matrix.
 
@@ -567,6 +629,11 @@ class LocalCoordinateSystem(TimeDependent):
             Time data for time dependent coordinate systems (Default value = None)
         time_ref :
             Optional reference timestamp if ``time`` is a time delta.
+        construction_checks :
+            If `False`, the matrices are neither validated nor normalized. The
+            orientations and coordinates of the returned system are views into the
+            passed array, which can also be a `numpy.memmap`. It must not be modified
+            afterwards.
 
         Returns
         -------
@@ -574,6 +641,10 @@ class LocalCoordinateSystem(TimeDependent):
             Local coordinate system
 
         """
+        if not construction_checks:
+            return cls._from_homogeneous_transformation_view(
+                transformation_matrix, translation_unit, time, time_ref
+            )
         if isinstance(transformation_matrix, xr.DataArray):
             transformation_matrix = np.array(transformation_matrix.data)
         if transformation_matrix.ndim == 3:
@@ -620,6 +691,8 @@ class LocalCoordinateSystem(TimeDependent):
             `True` if the coordinate system is time dependent, `False` otherwise.
 
         """
+        if self._transform is not None:
+            return self._transform.is_time_dependent
         return self._coord_ts is not None or ("time" in self._dataset.dims)
 
     @property
@@ -651,8 +724,10 @@ class LocalCoordinateSystem(TimeDependent):
             The coordinate systems reference time
 
         """
-        if isinstance(self.coordinates, TimeSeries):
+        if self._coord_ts is not None:
             return self._time_ref
+        if self._transform is not None:
+            return self._transform.time_ref
         return self._dataset.weldx.time_ref
 
     @property
@@ -665,6 +740,10 @@ class LocalCoordinateSystem(TimeDependent):
             Time-like data array representing the time union of the LCS
 
         """
+        if self._transform is not None:
+            if self._transform.time is None:
+                return None
+            return Time._from_nanoseconds(self._transform.time, self.reference_time)
         if "time" in self._dataset.coords:
             return Time(self._dataset.time, self.reference_time)
         return None
@@ -734,7 +813,9 @@ class LocalCoordinateSystem(TimeDependent):
         """
         return Rot.from_matrix(self.orientation.values)
 
-    def as_homogeneous_matrix(self, translation_unit: UnitLike) -> np.ndarray:
+    def as_homogeneous_matrix(
+        self, translation_unit: UnitLike, out: np.ndarray = None
+    ) -> np.ndarray:
         """Get a homogeneous transformation matrix from the coordinate system
         orientation.
 
@@ -743,30 +824,38 @@ class LocalCoordinateSystem(TimeDependent):
         translation_unit : UnitLike
             Unit the translation part of the homogeneous transformation matrix
             should represent.
+        out :
+            An optional preallocated array, for example a `numpy.memmap`, that the
+            matrices are written to. It needs the shape ``(n_time, 4, 4)`` or
+            ``(4, 4)`` for static systems.
 
         Returns
         -------
         numpy.ndarray
-            Numpy array representing the homogeneous transformation matrix.
+            Numpy array representing the homogeneous transformation matrix. Single
+            matrices are returned with the shape ``(4, 4)`` if no ``out`` is passed.
 
         """
+        if self._coord_ts is not None:
+            raise NotImplementedError(
+                "Cannot convert LCS with `TimeSeries` coordinates to homogeneous matrix"
+            )
 
-        time_dim = self.time.shape[0] if self.is_time_dependent else 1
+        transform = self._get_transform()
+        squeeze = out is None
+        if out is None:
+            time_dim = len(transform.time) if transform.is_time_dependent else 1
+            out = np.empty((time_dim, 4, 4))
 
-        rotation = np.resize(self.orientation.data, (time_dim, 3, 3))
-        coordinates = self.coordinates
-        if not isinstance(coordinates, TimeSeries):
-            translation = np.resize(
-                coordinates.data.to(translation_unit).m, (time_dim, 3)
-            )
-            homogeneous_matrix = np.resize(np.identity(4), (time_dim, 4, 4))
-            homogeneous_matrix[:, :3, :3] = rotation
-            homogeneous_matrix[:, :3, 3] = translation
+        scale = Q_(1.0, transform.unit).to(translation_unit).m
+        out[..., :3, :3] = transform.orientation
+        out[..., :3, 3] = transform.coordinates
+        if scale != 1.0:
+            out[..., :3, 3] *= scale
+        out[..., 3, :3] = 0
+        out[..., 3, 3] = 1
 
-            return np.squeeze(homogeneous_matrix)
-        raise NotImplementedError(
-            "Cannot convert LCS with `TimeSeries` coordinates to homogeneous matrix"
-        )
+        return np.squeeze(out) if squeeze else out
 
     def _interp_time_orientation(self, time: Time) -> xr.DataArray:
         """Interpolate the orientation in time."""
@@ -840,6 +929,12 @@ class LocalCoordinateSystem(TimeDependent):
                 "allowed. Also check that the reference time has the correct type."
             )
 
+        if self._coord_ts is None:
+            transform = self._get_transform().interp_time(
+                _time_as_int(time), time.reference_time
+            )
+            return self._from_transform(transform)
+
         orientation = self._interp_time_orientation(time)
         coordinates = self._interp_time_coordinates(time)
 
@@ -861,22 +956,12 @@ class LocalCoordinateSystem(TimeDependent):
             Inverted coordinate system.
 
         """
-        if isinstance(self.coordinates, TimeSeries):
+        if self._coord_ts is not None:
             raise WeldxException(
                 "Can not invert coordinates that are described by an expression. "
                 "Use 'interp_time' to create discrete values."
             )
-        orientation = ut.xr_transpose_matrix_data(self.orientation, dim1="c", dim2="v")
-        coordinates = ut.xr_matmul(
-            self.orientation,
-            self.coordinates * -1,
-            dims_a=["c", "v"],
-            dims_b=["c"],
-            trans_a=True,
-        )
-        return LocalCoordinateSystem(
-            orientation, coordinates, self.time, self.reference_time
-        )
+        return self._from_transform(self._get_transform().invert())
 
     def plot(
         self,
@@ -958,3 +1043,257 @@ class LocalCoordinateSystem(TimeDependent):
         """
         self._time_ref = time_ref_new
         self._dataset.weldx.time_ref = time_ref_new
+        self._transform = None
+
+
+def _normalize_orientation_block(
+    block: np.ndarray, c_axis: int, v_axis: int
+) -> np.ndarray:
+    """Normalize and check a block of orientation matrices of a dask array."""
+    block = np.moveaxis(block, (c_axis, v_axis), (-1, -2))
+    block = normalize(block)
+    if not np.allclose(block @ np.swapaxes(block, -1, -2), np.eye(3)):
+        raise ValueError("Orientation vectors must be orthogonal")
+    return np.moveaxis(block, (-1, -2), (c_axis, v_axis))
+
+
+def _as_float_array(data) -> np.ndarray:
+    """Convert data to a float array but keep dask arrays lazy."""
+    if _is_dask_array(data):
+        return data.astype(float)
+    return np.asarray(data, dtype=float)
+
+
+def _read_only_view(data: np.ndarray) -> np.ndarray:
+    """Get a read-only view of a numpy array. Dask arrays are returned unchanged."""
+    if _is_dask_array(data):
+        return data
+    data = data.view()
+    data.flags.writeable = False
+    return data
+
+
+def _time_as_int(time: Time) -> np.ndarray:
+    """Get the time deltas to the reference time as int64 nanoseconds."""
+    return time._as_timedelta_int64()
+
+
+class _Transform:
+    """Array representation of a `LocalCoordinateSystem` with discrete values.
+
+    Orientations and coordinates are plain numpy arrays with an optional leading time
+    axis. The coordinates are stored as magnitudes of ``unit`` and the time as int64
+    nanoseconds relative to the reference time. Composition, inversion and
+    interpolation are performed without any xarray or pint overhead.
+
+    Static systems might still carry a single time value. This happens if a time
+    dependent system is interpolated at a single point in time.
+
+    """
+
+    __slots__ = ("orientation", "coordinates", "unit", "time", "time_ref", "_slerp")
+
+    def __init__(
+        self,
+        orientation: np.ndarray,
+        coordinates: np.ndarray,
+        unit: pint.Unit,
+        time: np.ndarray = None,
+        time_ref: pd.Timestamp = None,
+    ):
+        self.orientation = orientation
+        self.coordinates = coordinates
+        self.unit = unit
+        self.time = time
+        self.time_ref = time_ref if time is not None else None
+        self._slerp: Slerp | None = None
+
+    @property
+    def is_time_dependent(self) -> bool:
+        """Return `True` if orientation or coordinates have a time axis."""
+        return self.orientation.ndim == 3 or self.coordinates.ndim == 2
+
+    @classmethod
+    def from_dataset(cls, dataset: xr.Dataset, time_ref: pd.Timestamp) -> _Transform:
+        """Create the array representation from a dataset with ordered dimensions."""
+        coordinates = dataset.coordinates.data
+        time = None
+        if "time" in dataset.coords:
+            time = _time_as_int(Time(dataset.time.data))
+        return cls(
+            _as_float_array(dataset.orientation.data),
+            _as_float_array(coordinates.m),
+            coordinates.u,
+            time,
+            time_ref,
+        )
+
+    def to_dataset(self) -> xr.Dataset:
+        """Create the dataset that is stored by a `LocalCoordinateSystem`."""
+        dims = ["c"] if self.coordinates.ndim == 1 else ["time", "c"]
+        data_vars = {
+            "orientation": (
+                ["c", "v"] if self.orientation.ndim == 2 else ["time", "c", "v"],
+                self.orientation,
+            ),
+            "coordinates": (dims, Q_(self.coordinates, self.unit)),
+        }
+        coords = {"c": ["x", "y", "z"], "v": [0, 1, 2]}
+        if self.time is not None:
+            attrs = {} if self.time_ref is None else {"time_ref": self.time_ref}
+            time = pd.to_timedelta(self.time)
+            if not self.is_time_dependent:
+                coords["time"] = xr.Variable((), time[0], attrs)
+            else:
+                coords["time"] = xr.Variable("time", time, attrs)
+        return xr.Dataset(data_vars, coords)
+
+    def read_only(self) -> _Transform:
+        """Get a copy that holds read-only views of the numpy arrays."""
+        transform = _Transform(
+            _read_only_view(self.orientation),
+            _read_only_view(self.coordinates),
+            self.unit,
+            None if self.time is None else _read_only_view(self.time),
+            self.time_ref,
+        )
+        transform._slerp = self._slerp
+        return transform
+
+    def with_time_ref(self, time_ref: pd.Timestamp) -> _Transform:
+        """Get a copy with time values that refer to another reference time."""
+        if time_ref == self.time_ref:
+            return self
+        time = self.time + (self.time_ref - time_ref).value
+        return _Transform(self.orientation, self.coordinates, self.unit, time, time_ref)
+
+    def _get_slerp(self) -> Slerp:
+        """Get the cached interpolator of the orientation keyframes."""
+        if self._slerp is None:
+            self._slerp = Slerp(self.time, Rot.from_matrix(self.orientation))
+        return self._slerp
+
+    def _interp_orientation(self, time: np.ndarray) -> tuple[np.ndarray, bool]:
+        """Interpolate the orientation and return if actual interpolation happened."""
+        orientation = self.orientation
+        if orientation.ndim == 2:
+            return orientation, False
+        if time.max() <= self.time[0]:
+            return orientation[0], False
+        if time.min() >= self.time[-1]:
+            return orientation[-1], False
+        time = np.clip(time, self.time[0], self.time[-1])
+        orientation = self._get_slerp()(time).as_matrix()
+        return (orientation[0] if len(time) == 1 else orientation), True
+
+    def _interp_coordinates(self, time: np.ndarray) -> tuple[np.ndarray, bool]:
+        """Interpolate the coordinates and return if actual interpolation happened."""
+        coordinates = self.coordinates
+        if coordinates.ndim == 1:
+            return coordinates, False
+        if time.max() <= self.time[0]:
+            return coordinates[0], False
+        if time.min() >= self.time[-1]:
+            return coordinates[-1], False
+        coordinates = np.stack(
+            [np.interp(time, self.time, c) for c in coordinates.T], axis=-1
+        )
+        return (coordinates[0] if len(time) == 1 else coordinates), True
+
+    def _get_keyframes(self, time: np.ndarray) -> _Transform:
+        """Get the loaded keyframes that are required to interpolate at the times.
+
+        The window includes the neighbors of keyframes that match the times exactly,
+        so that the interpolation treats them like the complete keyframes.
+
+        """
+        start = max(np.searchsorted(self.time, time.min(), side="left") - 1, 0)
+        stop = np.searchsorted(self.time, time.max(), side="right") + 1
+        window = slice(start, stop)
+
+        orientation = self.orientation
+        if orientation.ndim == 3:
+            orientation = orientation[window]
+        coordinates = self.coordinates
+        if coordinates.ndim == 2:
+            coordinates = coordinates[window]
+        return _Transform(
+            np.asarray(orientation),
+            np.asarray(coordinates),
+            self.unit,
+            self.time[window],
+            self.time_ref,
+        )
+
+    def interp_time(self, time: np.ndarray, time_ref: pd.Timestamp) -> _Transform:
+        """Interpolate in time.
+
+        The time values need to be relative to the passed reference time, which must
+        be `None` if the system has no reference time.
+
+        """
+        if not self.is_time_dependent:
+            return self
+
+        time_key = time
+        if self.time_ref is not None:
+            time_key = time + (time_ref - self.time_ref).value
+
+        source = self
+        if _is_dask_array(self.orientation) or _is_dask_array(self.coordinates):
+            source = self._get_keyframes(time_key)
+
+        orientation, interp_o = source._interp_orientation(time_key)
+        coordinates, interp_c = source._interp_coordinates(time_key)
+        if orientation.ndim == 2 and coordinates.ndim == 1 and not interp_o | interp_c:
+            return _Transform(orientation, coordinates, self.unit)
+        return _Transform(orientation, coordinates, self.unit, time, time_ref)
+
+    def compose(self, rhs: _Transform) -> _Transform:
+        """Get the transformation that results from treating self as defined in rhs.
+
+        This follows the same rules for time and reference time handling as
+        `LocalCoordinateSystem.__add__`.
+
+        """
+        lhs = self
+
+        # handle reference times
+        if lhs.time_ref is not None and rhs.time_ref is not None:
+            time_ref = min(lhs.time_ref, rhs.time_ref)
+            lhs = lhs.with_time_ref(time_ref)
+            rhs = rhs.with_time_ref(time_ref)
+        elif lhs.time_ref is None:
+            time_ref = rhs.time_ref
+        else:
+            time_ref = lhs.time_ref
+
+        # interpolate rhs time to match lhs
+        if lhs.time is not None and rhs.is_time_dependent:
+            if (rhs.time_ref is None) != (time_ref is None):
+                raise TypeError(
+                    "Only 1 reference time provided for time dependent coordinate "
+                    "system. Either the reference time of the coordinate system or the "
+                    "one passed to the function is 'None'. Only cases where the "
+                    "reference times are both 'None' or both contain a timestamp are "
+                    "allowed. Also check that the reference time has the correct type."
+                )
+            rhs = rhs.interp_time(lhs.time, time_ref)
+
+        scale = 1.0
+        if rhs.unit != lhs.unit:
+            scale = Q_(1.0, rhs.unit).to(lhs.unit).m
+
+        orientation = np.matmul(rhs.orientation, lhs.orientation)
+        coordinates = (
+            np.einsum("...ij,...j->...i", rhs.orientation, lhs.coordinates)
+            + rhs.coordinates * scale
+        )
+        time = lhs.time if lhs.time is not None else rhs.time
+        return _Transform(orientation, coordinates, lhs.unit, time, time_ref)
+
+    def invert(self) -> _Transform:
+        """Get the inverse transformation."""
+        orientation = np.swapaxes(self.orientation, -1, -2)
+        coordinates = -np.einsum("...ij,...j->...i", orientation, self.coordinates)
+        return _Transform(orientation, coordinates, self.unit, self.time, self.time_ref)
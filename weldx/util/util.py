@@ -174,6 +174,13 @@ def _array_equal(a, b):
     return np.all(a == b)
 
 
+def _is_dask_array(data) -> bool:
+    """Return `True` if the data is a dask array, also if it is wrapped by pint."""
+    if isinstance(data, pint.Quantity):
+        data = data.magnitude
+    return hasattr(data, "__dask_graph__")
+
+
 _eq_compare_nested_input_types = Union[
     Sequence,
     Mapping,
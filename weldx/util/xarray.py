@@ -643,7 +643,7 @@ def xr_3d_matrix(data: wxt.ArrayLike, time: Time = None) -> xr.DataArray:
     xarray.DataArray
 
     """
-    if time is not None and np.array(data).ndim == 3:
+    if time is not None and np.ndim(data) == 3:
         if isinstance(time, Time):
             time = time.as_data_array()
         da = xr.DataArray(